@@ -0,0 +1,161 @@
+"""
+테이블(단계)별 생성 벤치마크
+
+직원 수별로 전체 파이프라인을 한 번씩 실행하고 generate(report_path=...) 의 단계별 측정값
+(소요 시간, CPU 시간, 최고 RSS, 기록 바이트, 행 수)을 JSON 베이스라인 하나로 모읍니다.
+직원 수마다 새 프로세스에서 실행하므로 이전 규모의 메모리 사용량이 섞이지 않습니다.
+
+    python bench/run_bench.py                                 # 210, 1만, 10만, 100만 명 → bench/baseline.json
+    python bench/run_bench.py --sizes 210 10000 --output /tmp/bench.json --compare bench/baseline.json
+
+스케일링 지수는 인접한 두 규모 사이의 log(시간 비) / log(직원 수 비) 입니다. 1 이면 선형이고,
+SUPERLINEAR 이상이면 직원마다 전체 목록을 훑는 조회 같은 이차 비용을 의심할 수 있습니다.
+--compare 는 같은 규모/단계의 소요 시간이 베이스라인 대비 허용 비율 이상 늘어난 단계를 표시합니다.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hr_data_generator import generate  # noqa: E402
+
+DEFAULT_SIZES = [210, 10_000, 100_000, 1_000_000]
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# 베이스라인에 남길 단계별 측정값
+STAGE_METRICS = ['rows', 'wall_seconds', 'cpu_seconds', 'write_seconds', 'rows_per_second',
+                 'peak_rss_mb', 'tracemalloc_peak_mb', 'bytes_written']
+
+SUPERLINEAR = 1.5      # 이 이상의 스케일링 지수는 경고
+MIN_SECONDS = 0.05     # 이보다 짧은 단계는 측정 잡음이 커서 비교/지수 계산에서 제외
+TOLERANCE = 0.25       # --compare 허용 증가 비율
+
+
+def stage_seconds(metrics):
+    """단계 소요 시간 (생성 + 기록. stream 모드는 기록이 생성 시간에 포함됨)"""
+    return metrics['wall_seconds'] + (metrics.get('write_seconds') or 0)
+
+
+def run_size(size, stream=False, workers=None, output_format='csv', trace_memory=False, config=None):
+    """직원 size 명 규모로 전체 테이블을 임시 폴더에 생성하고 실행 리포트 반환"""
+    with tempfile.TemporaryDirectory(prefix=f'hr_bench_{size}_') as output_dir:
+        report_path = os.path.join(output_dir, 'run_report.json')
+        generate(config={**(config or {}), 'TOTAL_EMPLOYEES': size}, output_dir=output_dir,
+                 workers=workers, stream=stream, output_format=output_format,
+                 report_path=report_path, trace_memory=trace_memory)
+        with open(report_path, encoding='utf-8') as f:
+            return json.load(f)
+
+
+def scaling_exponents(results):
+    """{직원 수: {단계: 측정값}} → {단계: [(작은 규모, 큰 규모, 지수)]} (짧은 단계 제외)"""
+    sizes = sorted(results, key=int)
+    exponents = {}
+    for small, large in zip(sizes, sizes[1:]):
+        for stage, metrics in results[large].items():
+            before = results[small].get(stage)
+            if not before or stage_seconds(before) < MIN_SECONDS:
+                continue
+            exponent = (math.log(stage_seconds(metrics) / stage_seconds(before))
+                        / math.log(int(large) / int(small)))
+            exponents.setdefault(stage, []).append((int(small), int(large), round(exponent, 2)))
+    return exponents
+
+
+def regressions(results, baseline, tolerance=TOLERANCE):
+    """베이스라인 대비 소요 시간이 (1 + tolerance) 배 이상 늘어난 [(직원 수, 단계, 이전, 현재)]"""
+    found = []
+    for size, stages in results.items():
+        for stage, metrics in stages.items():
+            before = baseline.get('results', {}).get(size, {}).get(stage)
+            if not before or stage_seconds(before) < MIN_SECONDS:
+                continue
+            if stage_seconds(metrics) > stage_seconds(before) * (1 + tolerance):
+                found.append((int(size), stage, stage_seconds(before), stage_seconds(metrics)))
+    return found
+
+
+def print_table(results, exponents):
+    sizes = sorted(results, key=int)
+    stages = list(results[sizes[0]])
+    print(f"\n{'단계':<34}" + ''.join(f"{int(size):>12,}" for size in sizes) + '  지수')
+    for stage in stages:
+        times = ''.join(f"{stage_seconds(results[size][stage]):>11.2f}s" if stage in results[size] else f"{'-':>12}"
+                        for size in sizes)
+        worst = max((exponent for _, _, exponent in exponents.get(stage, [])), default=None)
+        flag = '' if worst is None else f'  {worst:.2f}' + (' (!)' if worst >= SUPERLINEAR else '')
+        print(f"{stage:<34}{times}{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='HR 데이터 생성 단계별 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='직원 수 목록 (기본: 210 10000 100000 1000000)')
+    parser.add_argument('--output', default=DEFAULT_BASELINE, help='결과 JSON 경로 (기본: bench/baseline.json)')
+    parser.add_argument('--compare', default=None, help='비교할 베이스라인 JSON 경로')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE,
+                        help='--compare 허용 증가 비율 (기본: 0.25)')
+    parser.add_argument('--stream', action='store_true', help='stream 모드로 생성 (대규모에서 메모리 제한)')
+    parser.add_argument('--workers', type=int, default=None, help='병렬 생성 프로세스 수')
+    parser.add_argument('--format', dest='output_format', default='csv',
+                        choices=['csv', 'parquet', 'feather', 'sqlite', 'neo4j'], help='출력 형식 (기본: csv)')
+    parser.add_argument('--trace-memory', action='store_true', help='tracemalloc 최고치도 측정 (느려짐)')
+    args = parser.parse_args(argv)
+
+    # --compare 와 --output 이 같은 파일이어도 비교 대상은 실행 전 베이스라인
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = {}
+    runs = {}
+    for size in args.sizes:
+        print(f"직원 {size:,}명 생성 중...", flush=True)
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            report = pool.submit(run_size, size, args.stream, args.workers, args.output_format,
+                                 args.trace_memory).result()
+        runs[str(size)] = report['run']
+        results[str(size)] = {stage['table']: {key: stage.get(key) for key in STAGE_METRICS}
+                              for stage in report['stages']}
+        print(f"   {report['run']['wall_seconds']:.1f}초, 최고 RSS {report['run']['peak_rss_mb'] or 0:.0f}MB")
+
+    exponents = scaling_exponents(results)
+    output = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'machine': {'platform': platform.platform(), 'python': platform.python_version(),
+                    'cpus': os.cpu_count()},
+        'options': {'stream': args.stream, 'workers': args.workers, 'output_format': args.output_format},
+        'runs': runs,
+        'results': results,
+        'scaling': {stage: [list(item) for item in items] for stage, items in exponents.items()},
+    }
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(output, f, ensure_ascii=False, indent=2)
+
+    print_table(results, exponents)
+    print(f"\n결과 저장: {args.output}")
+
+    if baseline is not None:
+        found = regressions(results, baseline, args.tolerance)
+        for size, stage, before, after in found:
+            print(f"[느려짐] {size:,}명 {stage}: {before:.2f}초 → {after:.2f}초 ({after / before:.2f}배)")
+        if found:
+            return 1
+        print(f"베이스라인 대비 {args.tolerance:.0%} 이상 느려진 단계 없음")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
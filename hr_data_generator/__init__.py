@@ -0,0 +1,70 @@
+"""
+GDB-HR 데이터 생성 패키지
+
+    from hr_data_generator import generate
+    tables = generate(tables=['employee_info', 'performance_review'],
+                      config={'TOTAL_EMPLOYEES': 210})
+
+테이블별 생성 함수(build_*)는 상위 테이블 레코드를 인자로 받아 레코드 리스트를 반환합니다.
+행 수가 많은 테이블은 레코드를 하나씩 내보내는 iter_* 함수도 제공합니다 (TABLES[...]['iterator']).
+직원 단위 테이블은 employee_info 를 컬럼형으로 변환한 EmployeeMaster(master 인자)를 공유합니다.
+COMMENT_ENCODING 으로 저장한 정성 코멘트는 load_phrase_dictionary 와 expand_comments 로 복원합니다.
+"""
+
+from .columnar import EmployeeMaster, build_employee_master
+from .config import CONFIG, resolve_config
+from .database import DATABASE_FILE
+from .engagement import build_compensation_history, build_engagement_survey
+from .graph import NEO4J_IMPORT_ARGS
+from .graphstore import GraphStore
+from .index import group_by, index_by
+from .instrument import PROFILE_DIR, RUN_REPORT_FILE, measured_stage
+from .master import (
+    build_employee_info,
+    build_hr_metrics_definition,
+    build_job_history,
+    build_organization_structure,
+    build_personal_traits,
+    build_reporting_closure,
+    build_reporting_lines,
+)
+from .performance import (
+    build_continuous_performance_review,
+    build_exit_interview,
+    build_goal_management,
+    build_leadership_360_review,
+    build_one_on_one_meetings,
+    build_performance_review,
+    build_project_history,
+    build_rewards_and_discipline,
+    build_skill_assessment,
+    build_team_culture_survey,
+)
+from .pipeline import (
+    OUTPUT_TABLES,
+    TABLES,
+    expand_comments,
+    export_sqlite,
+    generate,
+    load_tables,
+    read_table,
+    resolve_tables,
+    run_stage,
+    stream_stage,
+    table_path,
+    to_frame,
+    write_table,
+)
+from .recruitment import (
+    build_onboarding_program,
+    build_recruitment_aptitude_results,
+    build_recruitment_cpi_results,
+    build_recruitment_history,
+    build_recruitment_mmpi_results,
+    build_training_history,
+)
+from .rng import StageRandom, stage_random
+from .scheduler import critical_path, run_dag
+from .streaming import collect, write_csv_chunks
+from .talent import build_employee_yearly_snapshot, build_key_talent_pool, build_succession_plan
+from .templates import PHRASE_DICTIONARY_FILE, PhraseBank, PhraseDictionary, load_phrase_dictionary
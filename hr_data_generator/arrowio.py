@@ -0,0 +1,215 @@
+"""
+Arrow 기반 출력 (Parquet, Arrow IPC/Feather v2)
+
+레코드를 Arrow 테이블로 변환할 때 컬럼 타입을 지정합니다. 날짜 문자열은 date32, 일시
+문자열은 timestamp, 반복 값이 많은 문자열(본부/조직명, 직급, 상태, 지표 코드 등)은 dictionary
+(pandas category) 로 저장하고, TABLES[...]['dtypes'] 로 선언한 점수 컬럼은 int8 로 저장합니다.
+컬럼 타입은 첫 청크에서 정하며 이후 청크도 같은 스키마로 변환합니다.
+
+Feather 파일은 압축하지 않은 Arrow IPC 파일이므로 memory map 으로 열면 버퍼를 복사하지 않고
+페이지 캐시를 그대로 참조합니다. 같은 호스트의 여러 프로세스가 같은 파일을 열면 메모리를 공유합니다.
+stream 모드에서는 dictionary 컬럼을 청크마다 새 값만 덧붙이는 delta 로 기록합니다.
+
+pyarrow 는 Parquet/Feather 출력을 사용할 때만 필요합니다.
+"""
+
+import re
+
+from .streaming import chunked, to_frame
+
+DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+TIMESTAMP_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$')
+
+# 고유값 수가 행 수의 이 비율 이하인 문자열 컬럼은 dictionary(category) 로 저장
+CATEGORY_RATIO = 0.5
+
+# Parquet row group 행 수 (stream 모드에서는 청크를 모아 이 크기로 기록)
+DEFAULT_ROW_GROUP_ROWS = 1_000_000
+
+
+def _load_pyarrow():
+    """pyarrow, pyarrow.parquet 모듈 반환 (설치되어 있지 않으면 ImportError)"""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Parquet/Feather 출력에는 pyarrow 가 필요합니다: pip install pyarrow") from e
+    return pyarrow, pyarrow.parquet
+
+
+class DictionaryBuilder:
+    """
+    청크 사이에 이어지는 dictionary (처음 나온 순서대로 값을 뒤에 추가)
+
+    Arrow IPC 파일은 필드마다 dictionary 하나만 허용하므로, 청크마다 따로 인코딩하지 않고
+    기존 dictionary 를 확장해 delta 로 기록할 수 있게 합니다.
+    """
+
+    def __init__(self):
+        self.values = []
+        self.index = {}
+        self.dictionary = None
+
+    def encode(self, pa, array):
+        """문자열 배열 → 누적 dictionary 를 사용하는 DictionaryArray"""
+        chunk = array.dictionary_encode()
+        mapping = []
+        for value in chunk.dictionary.to_pylist():
+            if value not in self.index:
+                self.index[value] = len(self.values)
+                self.values.append(value)
+                self.dictionary = None
+            mapping.append(self.index[value])
+        if self.dictionary is None:
+            self.dictionary = pa.array(self.values, type=pa.string())
+        indices = pa.array(mapping, type=pa.int32()).take(chunk.indices)
+        return pa.DictionaryArray.from_arrays(indices, self.dictionary)
+
+
+def column_type(pa, series):
+    """pandas 컬럼 → Arrow 타입 (문자열 컬럼은 값 형식과 고유값 비율로 결정)"""
+    if series.dtype != object and not str(series.dtype).startswith(('str', 'string')):
+        return pa.from_numpy_dtype(series.dtype)
+
+    values = series.dropna()
+    if values.empty:
+        return pa.string()
+    values = values.astype(str)
+    if values.str.fullmatch(DATE_PATTERN).all():
+        return pa.date32()
+    if values.str.fullmatch(TIMESTAMP_PATTERN).all():
+        return pa.timestamp('s')
+    if values.nunique() <= CATEGORY_RATIO * len(series):
+        return pa.dictionary(pa.int32(), pa.string())
+    return pa.string()
+
+
+def arrow_schema(df):
+    """DataFrame(첫 청크) → 출력 스키마"""
+    pa, _ = _load_pyarrow()
+    return pa.schema([(str(col), column_type(pa, df[col])) for col in df.columns])
+
+
+def to_arrow(df, schema, dictionaries=None):
+    """
+    DataFrame → schema 타입의 Arrow 테이블
+
+    dictionaries: {컬럼: DictionaryBuilder} - 지정하면 청크 사이에 dictionary 를 이어서 사용
+    """
+    pa, _ = _load_pyarrow()
+    arrays = []
+    for field in schema:
+        values = df[field.name]
+        if pa.types.is_dictionary(field.type):
+            array = pa.array(values.astype(object), type=pa.string(), from_pandas=True)
+            if dictionaries is None:
+                array = array.dictionary_encode()
+            else:
+                array = dictionaries.setdefault(field.name, DictionaryBuilder()).encode(pa, array)
+        elif pa.types.is_date32(field.type) or pa.types.is_timestamp(field.type):
+            array = pa.array(values.astype(object), type=pa.string(), from_pandas=True).cast(field.type)
+        else:
+            array = pa.array(values, from_pandas=True).cast(field.type)
+        arrays.append(array)
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def iter_arrow_tables(records, chunk_rows, dtypes=None, shared_dictionaries=False):
+    """
+    레코드를 chunk_rows 행씩 Arrow 테이블로 변환 (스키마는 첫 청크 기준)
+
+    shared_dictionaries: True 이면 dictionary 컬럼이 청크 사이에 같은 dictionary 를 확장해 사용
+    """
+    columns = schema = None
+    dictionaries = {} if shared_dictionaries else None
+    for chunk in chunked(records, chunk_rows):
+        df = to_frame(chunk, columns)
+        columns = list(df.columns)
+        if dtypes:
+            df = df.astype(dtypes)
+        if schema is None:
+            schema = arrow_schema(df)
+        yield to_arrow(df, schema, dictionaries)
+
+
+def write_parquet_chunks(records, path, chunk_rows, dtypes=None, row_group_rows=DEFAULT_ROW_GROUP_ROWS):
+    """
+    레코드를 chunk_rows 행씩 변환해 Parquet 파일에 기록하고 전체 행 수 반환
+
+    변환된 청크는 row_group_rows 행이 모일 때까지 Arrow 테이블로 보관했다가 한 row group 으로
+    기록합니다 (레코드 dict 보다 훨씬 작음).
+    """
+    pa, pq = _load_pyarrow()
+    rows = 0
+    writer = None
+    pending = []
+    pending_rows = 0
+    try:
+        for table in iter_arrow_tables(records, chunk_rows, dtypes):
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            pending.append(table)
+            pending_rows += table.num_rows
+            rows += table.num_rows
+            if pending_rows >= row_group_rows:
+                writer.write_table(pa.concat_tables(pending), row_group_size=row_group_rows)
+                pending, pending_rows = [], 0
+        if writer is None:
+            pq.write_table(pa.table({}), path)
+        elif pending:
+            writer.write_table(pa.concat_tables(pending), row_group_size=row_group_rows)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def write_parquet(df, path, dtypes=None, row_group_rows=DEFAULT_ROW_GROUP_ROWS):
+    """DataFrame 을 Parquet 파일로 저장"""
+    _, pq = _load_pyarrow()
+    if dtypes:
+        df = df.astype(dtypes)
+    pq.write_table(to_arrow(df, arrow_schema(df)), path, row_group_size=row_group_rows)
+    return path
+
+
+def write_feather_chunks(records, path, chunk_rows, dtypes=None):
+    """레코드를 chunk_rows 행씩 변환해 Arrow IPC(Feather v2, 비압축) 파일에 기록하고 전체 행 수 반환"""
+    pa, _ = _load_pyarrow()
+    rows = 0
+    writer = None
+    options = pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+    try:
+        for table in iter_arrow_tables(records, chunk_rows, dtypes, shared_dictionaries=True):
+            if writer is None:
+                writer = pa.ipc.new_file(path, table.schema, options=options)
+            writer.write_table(table)
+            rows += table.num_rows
+        if writer is None:
+            pa.ipc.new_file(path, pa.schema([])).close()
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def write_feather(df, path, dtypes=None):
+    """DataFrame 을 Arrow IPC(Feather v2, 비압축) 파일로 저장"""
+    pa, _ = _load_pyarrow()
+    if dtypes:
+        df = df.astype(dtypes)
+    table = to_arrow(df, arrow_schema(df))
+    with pa.ipc.new_file(path, table.schema) as writer:
+        writer.write_table(table)
+    return path
+
+
+def read_feather(path, mmap=True):
+    """
+    Arrow IPC(Feather v2) 파일 → Arrow 테이블
+
+    mmap 이면 파일을 memory map 으로 열어 버퍼를 복사하지 않습니다 (테이블이 파일을 참조).
+    """
+    pa, _ = _load_pyarrow()
+    source = pa.memory_map(path, 'r') if mmap else pa.OSFile(path, 'rb')
+    return pa.ipc.open_file(source).read_all()
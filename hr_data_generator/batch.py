@@ -0,0 +1,42 @@
+"""
+배치 생성 엔진
+
+직원 한 명씩 점수를 뽑는 대신 테이블 전체의 점수 행렬을 NumPy 호출 한 번으로 생성합니다.
+본부/퇴사자/직급별 보정은 평균 행렬에 배열로 더해 브로드캐스트로 반영하고, 등급 등
+범주형 값은 np.select 로 산출합니다.
+"""
+
+import numpy as np
+
+
+def clipped_scores(gen, mean, std, min_val, max_val, size=None):
+    """정규분포 점수를 [min_val, max_val] 로 자른 정수 배열 (int() 와 같이 소수점 버림)"""
+    return np.clip(gen.normal(mean, std, size), min_val, max_val).astype(np.int64)
+
+
+def t_scores(gen, mean=50, std=10, min_val=20, max_val=80, size=None):
+    """T점수 배열 (평균 50, 표준편차 10)"""
+    return clipped_scores(gen, mean, std, min_val, max_val, size)
+
+
+def latent_scores(latent, mean, std, min_val, max_val):
+    """표준정규 잠재점수를 평균/표준편차 척도로 변환해 [min_val, max_val] 로 자른 정수 배열"""
+    return np.clip(mean + std * latent, min_val, max_val).astype(np.int64)
+
+
+def to_dates(strings):
+    """'YYYY-MM-DD' 문자열 리스트 → datetime64[D] 배열"""
+    return np.array(strings, dtype='datetime64[D]')
+
+
+def date_strings(dates):
+    """datetime64[D] 배열 → 'YYYY-MM-DD' 문자열 리스트"""
+    return np.datetime_as_string(dates, unit='D').tolist()
+
+
+def iter_records(columns):
+    """{컬럼: 값 배열} → 레코드를 하나씩 반환 (NumPy 값은 파이썬 int/float/str 로 변환)"""
+    keys = list(columns)
+    values = [col.tolist() if isinstance(col, np.ndarray) else col for col in columns.values()]
+    for row in zip(*values):
+        yield dict(zip(keys, row))
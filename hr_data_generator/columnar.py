@@ -0,0 +1,187 @@
+"""
+컬럼형 직원 마스터 (numpy 배열)
+
+employee_info 레코드 리스트를 한 번만 변환해 두고 하위 테이블이 공유합니다. 날짜는 datetime64[D],
+성별/상태/직급/조직 등 범주형 컬럼은 작은 정수 코드와 범주 목록으로 저장하고, 재직/리더/상사 유무
+마스크를 미리 계산합니다. 각 단계는 직원마다 입사일 문자열을 다시 파싱하거나 status 를 파이썬
+루프로 비교하는 대신 마스크와 배열 인덱싱을 사용합니다.
+
+    master = build_employee_master(employees)
+    for i in master.rows(master['active']):   # 재직자 행 번호 (employees 와 같은 순서)
+        hire_date = master.hire_datetimes()[i]
+
+병렬 생성(workers)에서는 share() 로 배열을 .npy 파일(가능하면 tmpfs 인 SHARED_MEMORY_DIR)에 한 번
+기록하고, 워커에는 폴더 경로와 범주 목록만 pickle 해서 보냅니다. 워커는 파일을 읽기 전용 memory map
+으로 열기 때문에 배열을 복사하지 않으며, 한 호스트의 모든 프로세스가 같은 페이지를 공유합니다.
+마스터에는 employee_info 의 모든 컬럼이 들어 있으므로 레코드가 필요한 단계는 records() 로 워커
+안에서 레코드 리스트를 복원하고, employee_info 레코드 리스트는 워커에 전달하지 않습니다.
+"""
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from .config import CONFIG
+from .hierarchy import parent_array
+
+ACTIVE_STATUS = '재직'
+# 리더 직급 (leadership_360_review 평가 대상)
+LEADER_TITLES = ['팀장', '부장', '센터장', '본부장', '이사', '대표이사']
+
+# 범주 코드로 저장하는 컬럼 (manager_id 는 상사 ID, 상사가 없으면 None 범주)
+CATEGORY_COLUMNS = ['gender', 'employment_type', 'org_id', 'org_name', 'division_name', 'job_title',
+                    'manager_id', 'status']
+DATE_COLUMNS = ['birth_date', 'hire_date']
+STRING_COLUMNS = ['employee_id', 'name']
+# employee_info 레코드 키 순서 (records() 복원용)
+RECORD_COLUMNS = ['employee_id', 'name', 'gender', 'birth_date', 'employment_type', 'hire_date', 'org_id',
+                  'org_name', 'division_name', 'job_title', 'manager_id', 'status']
+
+# 공유 배열 파일을 둘 위치 (tmpfs. 없거나 여유 공간이 부족하면 시스템 임시 폴더)
+SHARED_MEMORY_DIR = '/dev/shm'
+SHARED_PREFIX = 'hr_master_'
+
+
+def encode(values):
+    """값 목록 → (정수 코드 배열, 범주 목록). 범주는 처음 나온 순서"""
+    categories = {}
+    codes = [categories.setdefault(value, len(categories)) for value in values]
+    dtype = np.int8 if len(categories) < 2 ** 7 else np.int32
+    return np.array(codes, dtype=dtype), list(categories)
+
+
+class EmployeeMaster:
+    """
+    직원 마스터 컬럼 저장소 (행 번호 = employee_info 레코드 순서)
+
+    arrays: {컬럼 이름: numpy 배열} - employee_id, name, manager(상사 행 번호, 없으면 -1), 날짜 컬럼,
+            범주 코드 컬럼, hire_year 와 마스크(active, leader, has_manager)
+    categories: {범주 컬럼 이름: 범주 목록} (코드 → 값)
+    directory: 배열이 공유 .npy 파일의 memory map 이면 그 폴더 (share() 참고)
+    """
+
+    def __init__(self, arrays, categories, directory=None, records=None):
+        self.arrays = arrays
+        self.categories = categories
+        self.directory = directory
+        self._hire_datetimes = None
+        self._records = records
+
+    def __len__(self):
+        return len(self.arrays['employee_id'])
+
+    def __getitem__(self, column):
+        return self.arrays[column]
+
+    def __getstate__(self):
+        # 공유 배열은 폴더 경로만 전달 (받는 프로세스가 memory map 으로 연결).
+        # datetime 리스트와 레코드 리스트는 프로세스마다 다시 만듦
+        if self.directory:
+            return {'directory': self.directory, 'columns': list(self.arrays), 'categories': self.categories}
+        return {'arrays': self.arrays, 'categories': self.categories}
+
+    def __setstate__(self, state):
+        if 'directory' in state:
+            self.__init__(attach_arrays(state['directory'], state['columns']), state['categories'],
+                          state['directory'])
+        else:
+            self.__init__(state['arrays'], state['categories'])
+
+    def share(self):
+        """
+        배열을 새 임시 폴더의 .npy 파일로 기록하고 memory map 으로 다시 연 읽기 전용 EmployeeMaster 반환
+
+        반환된 마스터를 pickle 하면 배열 대신 폴더 경로만 전달됩니다. 다 쓴 뒤 release() 로 폴더를
+        삭제합니다 (이미 연결한 프로세스의 memory map 은 POSIX 에서 계속 유효).
+        """
+        nbytes = sum(array.nbytes for array in self.arrays.values())
+        directory = tempfile.mkdtemp(prefix=SHARED_PREFIX, dir=shared_parent(nbytes))
+        for column, array in self.arrays.items():
+            np.save(column_path(directory, column), array)
+        return EmployeeMaster(attach_arrays(directory, list(self.arrays)), self.categories, directory)
+
+    def release(self):
+        """share() 로 만든 공유 배열 폴더 삭제"""
+        if self.directory:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def code(self, column, value):
+        """범주 값 → 코드 (없으면 -1)"""
+        categories = self.categories[column]
+        return categories.index(value) if value in categories else -1
+
+    def mask(self, column, *values):
+        """범주 컬럼이 values 중 하나인 행 마스크"""
+        codes = [self.code(column, value) for value in values]
+        return np.isin(self.arrays[column], codes)
+
+    def values(self, column):
+        """범주 코드 컬럼 → 값 배열"""
+        return np.asarray(self.categories[column], dtype=object)[self.arrays[column]]
+
+    @staticmethod
+    def rows(mask):
+        """마스크 → 행 번호 리스트 (파이썬 int)"""
+        return np.flatnonzero(mask).tolist()
+
+    def hire_datetimes(self):
+        """입사일 datetime 리스트 (프로세스마다 한 번 변환)"""
+        if self._hire_datetimes is None:
+            self._hire_datetimes = self.arrays['hire_date'].astype('datetime64[us]').tolist()
+        return self._hire_datetimes
+
+    def records(self):
+        """employee_info 레코드 리스트 (만든 프로세스에서는 원본, 그 외에는 배열에서 한 번 복원)"""
+        if self._records is None:
+            columns = []
+            for column in RECORD_COLUMNS:
+                if column in self.categories:
+                    columns.append(self.values(column).tolist())
+                elif column in DATE_COLUMNS:
+                    columns.append(self.arrays[column].astype(str).tolist())
+                else:
+                    columns.append(self.arrays[column].tolist())
+            self._records = [dict(zip(RECORD_COLUMNS, row)) for row in zip(*columns)]
+        return self._records
+
+
+def shared_parent(nbytes):
+    """공유 배열 폴더를 만들 위치 (SHARED_MEMORY_DIR 에 여유가 없으면 None = 시스템 임시 폴더)"""
+    if os.path.isdir(SHARED_MEMORY_DIR) and shutil.disk_usage(SHARED_MEMORY_DIR).free > 2 * nbytes:
+        return SHARED_MEMORY_DIR
+    return None
+
+
+def column_path(directory, column):
+    return os.path.join(directory, f'{column}.npy')
+
+
+def attach_arrays(directory, columns):
+    """공유 .npy 파일 → {컬럼 이름: 읽기 전용 memory map 배열} (복사 없음)"""
+    return {column: np.load(column_path(directory, column), mmap_mode='r') for column in columns}
+
+
+def build_employee_master(employees, config=CONFIG):
+    """employee_info 레코드 → EmployeeMaster (레코드 리스트는 records() 가 그대로 반환)"""
+    ids = [emp['employee_id'] for emp in employees]
+    arrays = {column: np.array([emp[column] for emp in employees], dtype=str) for column in STRING_COLUMNS}
+    arrays['manager'] = parent_array(ids, [emp['manager_id'] for emp in employees])
+    for column in DATE_COLUMNS:
+        arrays[column] = np.array([emp[column] for emp in employees], dtype='datetime64[D]')
+    categories = {}
+    for column in CATEGORY_COLUMNS:
+        arrays[column], categories[column] = encode([emp[column] for emp in employees])
+
+    arrays['hire_year'] = arrays['hire_date'].astype('datetime64[Y]').astype(np.int32) + 1970
+    master = EmployeeMaster(arrays, categories, records=employees)
+    arrays['active'] = master.mask('status', ACTIVE_STATUS)
+    arrays['leader'] = master.mask('job_title', *LEADER_TITLES)
+    arrays['has_manager'] = arrays['manager'] >= 0
+    return master
+
+
+def ensure_master(employees, master=None):
+    """단계 함수를 직접 호출할 때 master 가 없으면 employees 에서 생성"""
+    return master if master is not None else build_employee_master(employees)
@@ -0,0 +1,107 @@
+"""
+HR 데이터 생성 설정값 (Configuration)
+"""
+
+import copy
+from datetime import datetime
+
+CONFIG = {
+    # 조직 설정
+    'TOTAL_EMPLOYEES': 210,  # 총 직원 수 (대표 1 + 본부장 3 + 팀장 10 + 일반직원 ~196)
+    'ACTIVE_RATIO': 0.93,  # 재직자 비율 (93%)
+    'CONTRACT_RATIO': 0.05,  # 계약직 비율 (5%)
+    'UNIQUE_NAMES': False,  # True 이면 같은 성별 안에서 직원 이름 중복 없음 (성별당 9,396명까지)
+    
+    # 조직 규모 조정 ('fixed': 3본부 10팀 고정 조직, 'scaled': TOTAL_EMPLOYEES 로 본부/팀 구성 산출,
+    #               'auto': TOTAL_EMPLOYEES 가 고정 조직 인원(210명)과 다르면 scaled)
+    'ORG_SCALING': 'auto',
+    'TEAM_SIZE': {'mean': 20, 'sigma': 0.35, 'min': 6, 'max': 40},  # scaled 팀 인원 (팀장 포함, 로그정규분포)
+    # 조직 단위 계층 수 (회사 → 본부 → ... → 팀). 3 이면 회사/본부/팀, 4 이상이면 본부와 팀 사이에
+    # 센터/실/그룹/파트 계층을 끼워 넣고 중간 조직의 하위 단위 수를 SPAN_OF_CONTROL 범위로 맞춤
+    # (팀이 적은 본부는 중간 계층 수를 줄임)
+    'ORG_LEVELS': 3,
+    'SPAN_OF_CONTROL': {'min': 2, 'max': 6},
+    
+    # 난수 시드 (재현성)
+    'RANDOM_SEED': 42,
+    
+    # 데이터 생성 기간
+    'START_YEAR': 2015,
+    'END_YEAR': 2024,
+    # 데이터 기준일: 생년월일/근속 계산 기준이며 이후 날짜의 기록은 만들지 않음 (실행 날짜와 무관하게 재현)
+    'REFERENCE_DATE': '2024-12-31',
+    'REVIEW_PERIODS': ['2022 H1', '2022 H2', '2023 H1', '2023 H2', '2024 H1'],
+    'SURVEY_YEARS': [2022, 2023, 2024],
+    
+    # 성과 평가 등급 분포
+    'PERFORMANCE_DISTRIBUTION': {
+        'S': 0.05,  # 5%
+        'A': 0.25,  # 25%
+        'B': 0.50,  # 50%
+        'C': 0.15,  # 15%
+        'D': 0.05   # 5%
+    },
+    
+    # 검사 점수 설정
+    'T_SCORE': {'mean': 50, 'std': 10, 'min': 20, 'max': 80},  # CPI, MMPI
+    'APTITUDE_SCORE': {'mean': 75, 'std': 12, 'min': 30, 'max': 100},  # 적성검사
+    'BIG5_SCORE': {'mean': 65, 'std': 15, 'min': 30, 'max': 100},  # Big-5
+    
+    # 퇴사자 특성 조정값
+    'LEAVER_ADJUSTMENT': {
+        'aptitude': -8,  # 적성검사 전반
+        'cpi_general': -5,  # CPI 전반
+        'cpi_wellbeing': -10,  # CPI 안녕감
+        'cpi_responsibility': -8,  # CPI 책임감
+        'mmpi_depression': 10,  # MMPI 우울증
+        'mmpi_anxiety': 8,  # MMPI 불안
+        'mmpi_general': 5  # MMPI 전반
+    },
+    
+    # 직무별 적성검사 조정값
+    'JOB_APTITUDE_ADJUSTMENT': {
+        '기술본부': {'numerical': 5, 'verbal': 0, 'situational': 3},
+        '경영지원본부': {'numerical': 2, 'verbal': 5, 'situational': 5},
+        '비즈니스본부': {'numerical': 0, 'verbal': 3, 'situational': 5}
+    },
+    
+    # 직급별 CPI 리더십 조정값
+    'LEADERSHIP_BONUS': {
+        '팀장': 8, '본부장': 8, '대표이사': 8,
+        '차장': 5, '부장': 5,
+        'default': 0
+    },
+    
+    # 핵심인재 선정 기준
+    'TALENT_TIER': {
+        'tier1_performance': 4.5,  # Tier 1: 성과 4.5 이상
+        'tier1_rewards': 2,  # + 포상 2회 이상
+        'tier1_leadership': 4.3,  # OR 리더십 4.3 이상
+        'tier2_performance': 4.0,  # Tier 2: 성과 4.0 이상
+        'tier3_performance': 3.8,  # Tier 3: 성과 3.8 이상
+        'tier3_years': 5  # + 근속 5년 이하
+    },
+    
+    # 데이터 간 상관관계 강화 설정
+    'ENABLE_CORRELATION': True,  # 상관관계 강화 기능 활성화
+    'CORRELATION_STRENGTH': 0.6,  # 상관관계 강도 (0.0~1.0) - 0.6으로 상관관계 선명화
+
+    # 정성 코멘트 압축 저장 (True: 문장 대신 템플릿 코드 저장, 문장은 comment_templates.json 으로 복원)
+    'COMMENT_ENCODING': False
+}
+
+
+def resolve_config(overrides=None):
+    """기본 CONFIG 위에 사용자 설정을 덮어쓴 사본 반환 (중첩 dict는 한 단계 병합)"""
+    config = copy.deepcopy(CONFIG)
+    for key, value in (overrides or {}).items():
+        if isinstance(value, dict) and isinstance(config.get(key), dict):
+            config[key].update(value)
+        else:
+            config[key] = value
+    return config
+
+
+def reference_date(config=CONFIG):
+    """config 의 REFERENCE_DATE ('YYYY-MM-DD') → datetime"""
+    return datetime.strptime(config['REFERENCE_DATE'], '%Y-%m-%d')
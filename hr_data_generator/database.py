@@ -0,0 +1,181 @@
+"""
+SQLite 출력
+
+모든 테이블을 하나의 SQLite 데이터베이스 파일에 적재합니다. 테이블마다 청크 단위
+executemany 를 하나의 트랜잭션으로 실행하고, 적재 중에는 WAL 저널과 synchronous=OFF 를
+사용합니다. 기본 키(각 테이블의 첫 컬럼)와 외래 키(컬럼 이름 기준)를 선언하며, 적재가 끝나면
+README / DATA_SPECIFICATION 의 분석 쿼리에 필요한 인덱스를 만들고 ANALYZE 로 통계를 갱신합니다.
+날짜/일시는 ISO 문자열(TEXT)로 저장하므로 문서의 문자열 비교 조건을 그대로 사용할 수 있습니다.
+"""
+
+import sqlite3
+
+from .streaming import iter_frames
+
+DATABASE_FILE = 'hr_data.sqlite'
+
+# 외래 키 (컬럼 이름 → 참조 테이블, 참조 컬럼). 참조 테이블 자신의 기본 키에는 적용하지 않음
+FOREIGN_KEYS = {
+    'employee_id': ('employee_info', 'employee_id'),
+    'manager_id': ('employee_info', 'employee_id'),
+    'immediate_manager_id': ('employee_info', 'employee_id'),
+    'second_level_manager_id': ('employee_info', 'employee_id'),
+    'third_level_manager_id': ('employee_info', 'employee_id'),
+    'head_employee_id': ('employee_info', 'employee_id'),
+    'leader_employee_id': ('employee_info', 'employee_id'),
+    'current_holder_id': ('employee_info', 'employee_id'),
+    'successor_id': ('employee_info', 'employee_id'),
+    'issued_by': ('employee_info', 'employee_id'),
+    'ancestor_id': ('employee_info', 'employee_id'),
+    'descendant_id': ('employee_info', 'employee_id'),
+    'org_id': ('organization_structure', 'org_id'),
+    'parent_org_id': ('organization_structure', 'org_id'),
+    'metric_code': ('hr_metrics_definition', 'metric_code'),
+    # recruitment_id 는 채용 이력이 없는 직원의 검사 결과에도 부여되므로 외래 키로 선언하지 않음
+}
+
+# 분석 쿼리용 인덱스 (테이블, 컬럼)
+INDEXES = [
+    # 핵심인재 이탈 리스크: WHERE retention_risk AND talent_tier, JOIN employee_info
+    ('key_talent_pool', ['retention_risk', 'talent_tier']),
+    ('key_talent_pool', ['employee_id']),
+    # 승계 공백 리스크 / 승계 준비도: GROUP BY org_name, critical_position, position_risk_level
+    ('succession_plan', ['org_name', 'critical_position', 'position_risk_level']),
+    ('succession_plan', ['successor_id']),
+    # 팀 문화와 리더십: team_culture_survey(연도, 조직) → employee_info(조직) → leadership_360_review(리더, 연도)
+    ('team_culture_survey', ['survey_year', 'org_id']),
+    ('employee_info', ['org_id']),
+    ('employee_info', ['manager_id']),
+    ('leadership_360_review', ['leader_employee_id', 'review_year', 'rater_relationship']),
+    ('leadership_360_review', ['metric_code']),
+    # 자기평가 vs 상사평가 갭: WHERE rating_gap = 1
+    ('continuous_performance_review', ['rating_gap']),
+    ('continuous_performance_review', ['employee_id']),
+    # 직원별 조인 (프로필, 성과-보상, 포상, 육성 효과)
+    ('performance_review', ['employee_id', 'review_period']),
+    ('performance_review', ['review_period']),
+    ('compensation_history', ['employee_id', 'effective_date']),
+    ('compensation_history', ['effective_date']),
+    ('goal_management', ['employee_id', 'target_period']),
+    ('rewards_and_discipline', ['employee_id', 'record_type']),
+    ('training_history', ['employee_id', 'start_date']),
+    ('personal_traits', ['employee_id']),
+    ('reporting_lines', ['employee_id']),
+    # 조직 단위 집계 ("X 산하 전체 직원"): WHERE ancestor_id = X
+    ('reporting_closure', ['ancestor_id', 'descendant_id']),
+    ('reporting_closure', ['descendant_id']),
+    ('organization_structure', ['parent_org_id']),
+    ('exit_interview', ['primary_reason_category']),
+]
+
+
+def connect(path):
+    """적재용 연결 (WAL 저널, synchronous=OFF, 자동 커밋 - 트랜잭션은 직접 시작)"""
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=OFF')
+    return conn
+
+
+def column_type(values):
+    """컬럼 값 → SQLite 타입 (INTEGER / REAL / TEXT)"""
+    values = values.dropna()
+    if values.empty:
+        return 'TEXT'
+    if values.dtype.kind in 'biu':
+        return 'INTEGER'
+    if values.dtype.kind == 'f':
+        return 'REAL'
+    return 'TEXT'
+
+
+def create_table(conn, name, df):
+    """첫 청크의 컬럼으로 테이블 생성 (기존 테이블은 삭제)"""
+    definitions = []
+    for i, col in enumerate(df.columns):
+        definition = f'"{col}" {column_type(df[col])}'
+        if i == 0:
+            definition += ' PRIMARY KEY'
+        elif col in FOREIGN_KEYS:
+            table, key = FOREIGN_KEYS[col]
+            definition += f' REFERENCES {table}({key})'
+        definitions.append(definition)
+    conn.execute(f'DROP TABLE IF EXISTS {name}')
+    conn.execute(f'CREATE TABLE {name} (\n    ' + ',\n    '.join(definitions) + '\n)')
+
+
+def rows(df):
+    """DataFrame → 파이썬 기본 타입 튜플 리스트 (결측값은 None, 날짜/일시는 ISO 문자열)"""
+    df = df.copy()
+    for col in df.columns:
+        if df[col].dtype.kind == 'M':
+            values = df[col]
+            midnight = (values.dropna() == values.dropna().dt.normalize()).all()
+            df[col] = values.dt.strftime('%Y-%m-%d' if midnight else '%Y-%m-%d %H:%M:%S')
+    df = df.astype(object)
+    return list(df.where(df.notna(), None).itertuples(index=False, name=None))
+
+
+def load_frames(path, name, frames):
+    """
+    DataFrame 청크들을 SQLite 테이블 name 에 적재하고 전체 행 수 반환
+
+    테이블 하나를 하나의 트랜잭션으로 적재합니다. 컬럼 구성과 타입은 첫 청크 기준입니다.
+    """
+    conn = connect(path)
+    count = 0
+    insert = None
+    try:
+        conn.execute('BEGIN')
+        for df in frames:
+            if insert is None:
+                create_table(conn, name, df)
+                insert = f'INSERT INTO {name} VALUES ({", ".join("?" * len(df.columns))})'
+            conn.executemany(insert, rows(df))
+            count += len(df)
+        conn.execute('COMMIT')
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute('ROLLBACK')
+        raise
+    finally:
+        conn.close()
+    return count
+
+
+def write_sqlite_chunks(records, path, name, chunk_rows):
+    """레코드를 chunk_rows 행씩 SQLite 테이블 name 에 적재하고 전체 행 수 반환"""
+    return load_frames(path, name, iter_frames(records, chunk_rows))
+
+
+def write_sqlite(df, path, name):
+    """DataFrame 을 SQLite 테이블 name 으로 저장"""
+    load_frames(path, name, [df])
+    return path
+
+
+def finalize_database(path, tables=None):
+    """
+    적재 후 처리: 분석 쿼리 인덱스 생성, ANALYZE, WAL 체크포인트
+
+    tables: 인덱스를 만들 테이블 이름 목록 (None 이면 데이터베이스에 있는 모든 테이블)
+    """
+    conn = sqlite3.connect(path, isolation_level=None)
+    try:
+        existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        targets = existing if tables is None else existing & set(tables)
+        conn.execute('BEGIN')
+        for table, columns in INDEXES:
+            if table not in targets:
+                continue
+            present = {row[1] for row in conn.execute(f'PRAGMA table_info({table})')}
+            if not set(columns) <= present:
+                continue
+            index = f"idx_{table}_{'_'.join(columns)}"
+            conn.execute(f'CREATE INDEX IF NOT EXISTS {index} ON {table} ({", ".join(columns)})')
+        conn.execute('COMMIT')
+        conn.execute('ANALYZE')
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    finally:
+        conn.close()
+    return path
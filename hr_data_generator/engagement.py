@@ -0,0 +1,98 @@
+"""
+D그룹: 조직 몰입도 및 보상 데이터
+"""
+
+import numpy as np
+
+from .columnar import ensure_master
+from .config import CONFIG
+from .rng import stage_random
+
+SURVEY_YEARS = [2022, 2023, 2024]
+
+BASE_SALARY_RANGES = {
+    '사원': (35000000, 42000000),
+    '주임': (40000000, 48000000),
+    '대리': (48000000, 58000000),
+    '과장': (58000000, 72000000),
+    '차장': (72000000, 90000000),
+    '팀장': (90000000, 120000000),
+    '부장': (110000000, 140000000),
+    '센터장': (120000000, 150000000),
+    '본부장': (130000000, 160000000),
+    '이사': (150000000, 190000000),
+    '대표이사': (200000000, 280000000)
+}
+
+
+def build_engagement_survey(employees, master=None, config=CONFIG):
+    """12. engagement_survey - 조직 몰입도 설문"""
+    rng = stage_random(config, 'engagement_survey')
+    master = ensure_master(employees, master)
+    hire_years = master['hire_year'].tolist()
+    engagement_data = []
+    survey_counter = 1
+
+    for i in master.rows(master['active']):
+        emp = employees[i]
+        for year in SURVEY_YEARS:
+            if year < hire_years[i]:
+                continue
+
+            # 정규분포 기반 점수
+            job_satisfaction = round(np.clip(rng.normal(3.6, 0.7), 1.0, 5.0), 1)
+            manager_relationship = round(np.clip(rng.normal(3.7, 0.6), 1.0, 5.0), 1)
+            turnover_intention = round(np.clip(rng.normal(2.5, 0.8), 1.0, 5.0), 1)
+            work_life_balance = round(np.clip(rng.normal(3.4, 0.7), 1.0, 5.0), 1)
+            growth_opportunity = round(np.clip(rng.normal(3.5, 0.7), 1.0, 5.0), 1)
+
+            engagement_data.append({
+                'survey_id': f'ENG{survey_counter:04d}',
+                'employee_id': emp['employee_id'],
+                'survey_year': year,
+                'q_job_satisfaction': job_satisfaction,
+                'q_manager_relationship': manager_relationship,
+                'q_turnover_intention': turnover_intention,
+                'q_work_life_balance': work_life_balance,
+                'q_growth_opportunity': growth_opportunity
+            })
+            survey_counter += 1
+
+    return engagement_data
+
+
+def build_compensation_history(employees, master=None, config=CONFIG):
+    """13. compensation_history - 보상 이력"""
+    rng = stage_random(config, 'compensation_history')
+    master = ensure_master(employees, master)
+    hire_years = master['hire_year'].tolist()
+    compensation_data = []
+    comp_counter = 1
+
+    for i in master.rows(master['active']):
+        emp = employees[i]
+        current_year = 2024
+
+        for year in range(hire_years[i], current_year + 1):
+            job_title = emp['job_title']
+            salary_range = BASE_SALARY_RANGES.get(job_title, (35000000, 50000000))
+
+            # 기본 연봉 (범위 내 랜덤)
+            base_salary = rng.randint(salary_range[0], salary_range[1])
+
+            # 성과 보너스 (0-25%, 정규분포)
+            bonus_pct = np.clip(rng.normal(0.12, 0.06), 0, 0.30)
+            annual_bonus = int(base_salary * bonus_pct)
+
+            compensation_data.append({
+                'compensation_id': f'COMP{comp_counter:04d}',
+                'employee_id': emp['employee_id'],
+                'effective_date': f'{year}-01-01',
+                'base_salary': base_salary,
+                'annual_bonus_amount': annual_bonus,
+                'total_compensation': base_salary + annual_bonus,
+                'currency': 'KRW'
+            })
+            comp_counter += 1
+
+    return compensation_data
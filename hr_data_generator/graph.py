@@ -0,0 +1,127 @@
+"""
+Neo4j 벌크 임포트 출력 (neo4j-admin database import)
+
+테이블마다 TABLES[...]['graph'] 로 선언한 노드/관계 파일을 레코드를 한 번 훑으면서 함께 기록합니다.
+생성된 CSV 를 다시 읽지 않으므로 stream 모드에서는 상위 테이블처럼 레코드를 모으지 않고 바로
+기록합니다. 각 파일은 헤더 행을 포함하며 (노드: ':ID(공간)', ':LABEL', 관계: ':START_ID(공간)',
+':END_ID(공간)', ':TYPE'), 속성 컬럼에는 neo4j 타입을 붙입니다 (문자열은 생략).
+
+그래프 선언:
+    {'nodes': 'Employee', 'id': 'employee_id', 'properties': {'name': 'string', ...}}
+        labels: ';' 로 구분한 라벨 (기본: ID 공간 이름), distinct: 같은 ID 는 처음 한 번만 기록
+    {'relationship': 'REPORTS_TO', 'start': ('employee_id', 'Employee'),
+     'end': ('manager_id', 'Employee'), 'properties': {...}}
+        시작/끝 ID 가 비어 있는 레코드는 관계를 만들지 않습니다.
+
+파일명은 '<테이블 파일명>.<라벨 또는 관계 타입>.csv' 이고, 임포트 인자는 NEO4J_IMPORT_ARGS 파일로
+저장합니다: neo4j-admin database import full @neo4j_import.args (output_dir 에서 실행)
+"""
+
+import csv
+import os
+
+NEO4J_IMPORT_ARGS = 'neo4j_import.args'
+
+
+def element_name(element):
+    """노드 ID 공간 또는 관계 타입"""
+    return element['nodes'] if 'nodes' in element else element['relationship']
+
+
+def graph_path(prefix, element):
+    """노드/관계 파일 경로 (prefix: 확장자를 뺀 테이블 파일 경로)"""
+    return f'{prefix}.{element_name(element)}.csv'
+
+
+def property_header(properties):
+    return [col if kind == 'string' else f'{col}:{kind}' for col, kind in properties.items()]
+
+
+def header(element):
+    """neo4j-admin 헤더 행"""
+    properties = property_header(element.get('properties', {}))
+    if 'nodes' in element:
+        return [f"{element['id']}:ID({element['nodes']})", ':LABEL'] + properties
+    (_, start), (_, end) = element['start'], element['end']
+    return [f':START_ID({start})', f':END_ID({end})', ':TYPE'] + properties
+
+
+def format_value(value, kind):
+    """레코드 값 → CSV 필드 (결측값은 빈 문자열 = 속성 없음)"""
+    if value is None or value != value:
+        return ''
+    if kind == 'int':
+        return str(int(value))
+    if kind == 'localdatetime':
+        return str(value).replace(' ', 'T')
+    return str(value)
+
+
+def element_writer(element, writer):
+    """레코드 하나를 받아 노드/관계 행을 기록하는 함수 반환"""
+    properties = list(element.get('properties', {}).items())
+
+    def props(record):
+        return [format_value(record.get(col), kind) for col, kind in properties]
+
+    if 'nodes' in element:
+        key = element['id']
+        labels = element.get('labels', element['nodes'])
+        seen = set() if element.get('distinct') else None
+
+        def write(record):
+            node_id = record[key]
+            if seen is not None:
+                if node_id in seen:
+                    return
+                seen.add(node_id)
+            writer.writerow([node_id, labels] + props(record))
+        return write
+
+    (start, _), (end, _) = element['start'], element['end']
+    rel_type = element['relationship']
+
+    def write(record):
+        start_id, end_id = record.get(start), record.get(end)
+        if format_value(start_id, 'string') and format_value(end_id, 'string'):
+            writer.writerow([start_id, end_id, rel_type] + props(record))
+    return write
+
+
+def write_graph_chunks(records, prefix, elements):
+    """레코드를 한 번 훑으면서 elements 의 노드/관계 파일을 모두 기록하고 레코드 수 반환"""
+    files = [open(graph_path(prefix, element), 'w', encoding='utf-8', newline='') for element in elements]
+    try:
+        writers = []
+        for element, f in zip(elements, files):
+            writer = csv.writer(f)
+            writer.writerow(header(element))
+            writers.append(element_writer(element, writer))
+
+        rows = 0
+        for record in records:
+            for write in writers:
+                write(record)
+            rows += 1
+    finally:
+        for f in files:
+            f.close()
+    return rows
+
+
+def write_import_args(path, files, options=('--multiline-fields=true',)):
+    """
+    neo4j-admin 인자 파일 저장
+
+    files: [(prefix, elements)] - 테이블별 파일 경로 접두어와 그래프 선언
+    """
+    lines = []
+    for kind in ('nodes', 'relationship'):
+        flag = '--nodes' if kind == 'nodes' else '--relationships'
+        for prefix, elements in files:
+            for element in elements:
+                if kind in element:
+                    lines.append(f'{flag}={os.path.basename(graph_path(prefix, element))}')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines + list(options)) + '\n')
+    return path
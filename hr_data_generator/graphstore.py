@@ -0,0 +1,228 @@
+"""
+메모리 내 속성 그래프 (그래프 DB 쿼리 로컬 테스트용)
+
+생성된 테이블에서 TABLES[...]['graph'] 선언(Neo4j 임포트와 같은 노드/관계 정의)을 읽어 노드는
+(ID 공간, ID) → 정수 번호로, 관계는 타입별 CSR 인접 배열(indptr, indices)로 저장합니다.
+정방향(start → end)과 역방향(end → start) CSR 을 모두 만들어 두므로 이웃 조회는 배열 슬라이스
+하나이고, k-hop, 보고 라인, 팀원, 공동 프로젝트 조회가 그래프 DB 없이 마이크로초 단위로 실행됩니다.
+
+    store = GraphStore.from_tables(generate(tables=['employee_info', 'project_history', ...]))
+    store.reporting_chain('EMP150')       # ['EMP150', 'TL008', 'DIV002', 'EMP000']
+    store.k_hop('Employee', 'EMP150', 2)  # 2 hop 이내 노드 [(공간, ID), ...]
+"""
+
+import numpy as np
+
+from .pipeline import TABLES, read_table
+
+# 조회 함수가 사용하는 관계 타입
+REPORTS_TO = 'REPORTS_TO'
+BELONGS_TO = 'BELONGS_TO'
+PART_OF = 'PART_OF'
+WORKED_ON = 'WORKED_ON'
+SUCCESSOR_OF = 'SUCCESSOR_OF'
+
+
+def is_missing(value):
+    return value is None or value != value
+
+
+def table_records(table):
+    """DataFrame 또는 레코드 리스트 → 레코드 리스트"""
+    return table.to_dict('records') if hasattr(table, 'to_dict') else table
+
+
+def build_csr(starts, ends, n):
+    """간선 (starts[i] → ends[i]) → (indptr, indices). 같은 시작 노드의 간선은 입력 순서 유지"""
+    order = np.argsort(starts, kind='stable')
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(starts, minlength=n), out=indptr[1:])
+    return indptr, ends[order]
+
+
+class GraphStore:
+    """
+    노드: 정수 번호 0..n-1 (spaces[i], ids[i], properties[i])
+    관계: {타입: (indptr, indices)} 정방향 out, 역방향 in
+    """
+
+    def __init__(self, nodes, edges):
+        """
+        nodes: [(ID 공간, ID, 라벨, 속성 dict)] - 같은 (공간, ID) 는 처음 것만 사용
+        edges: {관계 타입: [(시작 공간, 시작 ID, 끝 공간, 끝 ID)]} - 끝점이 없는 관계는 제외
+        """
+        self.lookup = {}
+        self.spaces, self.ids, self.labels, self.properties = [], [], [], []
+        for space, node_id, labels, props in nodes:
+            key = (space, node_id)
+            if key in self.lookup:
+                continue
+            self.lookup[key] = len(self.ids)
+            self.spaces.append(space)
+            self.ids.append(node_id)
+            self.labels.append(labels)
+            self.properties.append(props)
+
+        n = len(self.ids)
+        self.out, self.inc = {}, {}
+        self.dropped = {}
+        for rel_type, pairs in edges.items():
+            starts, ends = [], []
+            for start_space, start, end_space, end in pairs:
+                i = self.lookup.get((start_space, start))
+                j = self.lookup.get((end_space, end))
+                if i is None or j is None:
+                    self.dropped[rel_type] = self.dropped.get(rel_type, 0) + 1
+                    continue
+                starts.append(i)
+                ends.append(j)
+            starts = np.asarray(starts, dtype=np.int64)
+            ends = np.asarray(ends, dtype=np.int64)
+            self.out[rel_type] = build_csr(starts, ends, n)
+            self.inc[rel_type] = build_csr(ends, starts, n)
+
+    @classmethod
+    def from_tables(cls, tables):
+        """
+        {테이블 이름: DataFrame 또는 레코드 리스트} (generate() 반환값) → GraphStore
+
+        TABLES[...]['graph'] 가 선언된 테이블만 사용합니다. 관계의 끝 노드가 주어진 테이블에
+        없으면 그 관계는 제외됩니다 (dropped 에 타입별 개수 기록).
+        """
+        nodes = []
+        edges = {}
+        for name, table in tables.items():
+            elements = TABLES[name].get('graph', [])
+            if not elements:
+                continue
+            records = table_records(table)
+            for element in elements:
+                if 'nodes' in element:
+                    space, key = element['nodes'], element['id']
+                    labels = element.get('labels', space)
+                    columns = list(element.get('properties', {}))
+                    nodes.extend(
+                        (space, record[key], labels,
+                         {col: record.get(col) for col in columns if not is_missing(record.get(col))})
+                        for record in records
+                    )
+                else:
+                    (start, start_space), (end, end_space) = element['start'], element['end']
+                    edges.setdefault(element['relationship'], []).extend(
+                        (start_space, record[start], end_space, record[end])
+                        for record in records
+                        if not is_missing(record.get(start)) and not is_missing(record.get(end))
+                    )
+        return cls(nodes, edges)
+
+    @classmethod
+    def from_files(cls, output_dir, output_format='csv', tables=None):
+        """generate(output_dir=...) 로 저장된 테이블에서 GraphStore 생성 (tables: None 이면 graph 선언이 있는 전체)"""
+        names = [name for name in (tables or TABLES) if 'graph' in TABLES[name]]
+        return cls.from_tables({name: read_table(name, output_dir, output_format) for name in names})
+
+    def __len__(self):
+        return len(self.ids)
+
+    def node_index(self, space, node_id):
+        """(ID 공간, ID) → 노드 번호 (없으면 KeyError)"""
+        try:
+            return self.lookup[(space, node_id)]
+        except KeyError:
+            raise KeyError(f"그래프에 없는 노드: {space} {node_id}") from None
+
+    def node(self, space, node_id):
+        """노드 속성 dict (ID 와 라벨 포함)"""
+        i = self.node_index(space, node_id)
+        return {'id': self.ids[i], 'labels': self.labels[i], **self.properties[i]}
+
+    def relationship_count(self, rel_type):
+        return len(self.out[rel_type][1]) if rel_type in self.out else 0
+
+    def adjacent(self, i, rel_type, direction='out'):
+        """노드 번호 i 의 rel_type 이웃 노드 번호 배열 (direction: 'out' 또는 'in')"""
+        csr = (self.out if direction == 'out' else self.inc).get(rel_type)
+        if csr is None:
+            return np.empty(0, dtype=np.int64)
+        indptr, indices = csr
+        return indices[indptr[i]:indptr[i + 1]]
+
+    def neighbors(self, space, node_id, rel_type, direction='out'):
+        """rel_type 관계로 연결된 이웃 ID 리스트 (관계 순서 유지, 중복 관계는 중복 반환)"""
+        i = self.node_index(space, node_id)
+        return [self.ids[j] for j in self.adjacent(i, rel_type, direction)]
+
+    def k_hop(self, space, node_id, k, rel_types=None, direction='both'):
+        """
+        k hop 이내에 도달하는 노드 [(ID 공간, ID)] (시작 노드 제외, 가까운 순)
+
+        rel_types: 따라갈 관계 타입 목록 (None 이면 전체), direction: 'out', 'in', 'both'
+        """
+        start = self.node_index(space, node_id)
+        rel_types = list(self.out) if rel_types is None else rel_types
+        directions = ['out', 'in'] if direction == 'both' else [direction]
+
+        seen = {start}
+        order = []
+        frontier = [start]
+        for _ in range(k):
+            reached = []
+            for i in frontier:
+                for rel_type in rel_types:
+                    for d in directions:
+                        for j in self.adjacent(i, rel_type, d).tolist():
+                            if j not in seen:
+                                seen.add(j)
+                                reached.append(j)
+            if not reached:
+                break
+            order.extend(reached)
+            frontier = reached
+        return [(self.spaces[j], self.ids[j]) for j in order]
+
+    def reporting_chain(self, employee_id):
+        """직원부터 최상위 관리자까지 REPORTS_TO 를 따라간 직원 ID 리스트 (순환 시 중단)"""
+        i = self.node_index('Employee', employee_id)
+        chain = [i]
+        seen = {i}
+        while True:
+            managers = self.adjacent(i, REPORTS_TO)
+            if not len(managers) or int(managers[0]) in seen:
+                break
+            i = int(managers[0])
+            chain.append(i)
+            seen.add(i)
+        return [self.ids[j] for j in chain]
+
+    def direct_reports(self, employee_id):
+        """직속 부하 직원 ID 리스트"""
+        return self.neighbors('Employee', employee_id, REPORTS_TO, 'in')
+
+    def team_members(self, org_id, recursive=False):
+        """조직 소속 직원 ID 리스트 (recursive 이면 PART_OF 하위 조직 포함)"""
+        orgs = [self.node_index('Org', org_id)]
+        if recursive:
+            pending = list(orgs)
+            while pending:
+                children = self.adjacent(pending.pop(), PART_OF, 'in').tolist()
+                orgs.extend(children)
+                pending.extend(children)
+        return [self.ids[j] for i in orgs for j in self.adjacent(i, BELONGS_TO, 'in')]
+
+    def projects(self, employee_id):
+        """직원이 참여한 프로젝트 ID 리스트 (중복 제거, 참여 순서)"""
+        return list(dict.fromkeys(self.neighbors('Employee', employee_id, WORKED_ON)))
+
+    def shared_projects(self, employee_id, other_id):
+        """두 직원이 함께 참여한 프로젝트 ID 리스트 (employee_id 의 참여 순서)"""
+        other = set(self.adjacent(self.node_index('Employee', other_id), WORKED_ON).tolist())
+        mine = self.adjacent(self.node_index('Employee', employee_id), WORKED_ON).tolist()
+        return [self.ids[j] for j in dict.fromkeys(mine) if j in other]
+
+    def project_members(self, project_id):
+        """프로젝트 참여 직원 ID 리스트 (중복 제거)"""
+        return list(dict.fromkeys(self.neighbors('Project', project_id, WORKED_ON, 'in')))
+
+    def successors(self, employee_id):
+        """직원(현 직책자)의 승계 후보자 ID 리스트 (승계 계획 순위 순)"""
+        return self.neighbors('Employee', employee_id, SUCCESSOR_OF, 'in')
@@ -0,0 +1,35 @@
+"""
+테이블 간 조회용 인덱스
+
+상위 테이블 레코드를 employee_id 등 키로 한 번만 색인해 두고, 하위 테이블 생성 시
+선형 탐색(next(r for r in records if ...)) 대신 O(1) 로 조회합니다.
+"""
+
+
+def index_by(records, key='employee_id'):
+    """
+    key 값 → 레코드 dict
+
+    같은 키가 여러 번 나오면 첫 번째 레코드를 사용합니다 (선형 탐색 next(...) 와 동일한 결과).
+    """
+    index = {}
+    for record in records:
+        index.setdefault(record[key], record)
+    return index
+
+
+def group_by(records, *keys):
+    """
+    키 값 → 레코드 리스트 dict (원래 순서 유지)
+
+    키가 여러 개이면 (값1, 값2, ...) 튜플을 키로 사용합니다.
+    """
+    groups = {}
+    if len(keys) == 1:
+        key = keys[0]
+        for record in records:
+            groups.setdefault(record[key], []).append(record)
+    else:
+        for record in records:
+            groups.setdefault(tuple(record[k] for k in keys), []).append(record)
+    return groups
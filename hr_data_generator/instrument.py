@@ -0,0 +1,140 @@
+"""
+단계별 실행 측정 (소요 시간, CPU 시간, 메모리 최고치, 처리량, 기록 바이트)
+
+measured_stage 로 stage_fn 을 감싸면 워커 프로세스에서도 측정값을 함께 반환합니다.
+메인 프로세스에서 행 수, 행/초, 기록 바이트를 더해 실행 리포트(JSON 또는 CSV)로 저장합니다.
+
+- 최고 RSS: Linux 에서는 단계 시작 시 /proc/self/clear_refs 로 최고치를 초기화하므로 단계별
+  값이고, 초기화할 수 없는 환경에서는 프로세스 시작 이후 최고치입니다.
+- tracemalloc 최고치: trace_memory 를 켠 경우에만 측정합니다 (할당 추적으로 2~3배 느려짐).
+- profile_dir 를 지정하면 단계마다 '<테이블 이름>.prof' cProfile 덤프를 저장합니다
+  (snakeviz, gprof2dot, flameprof 등으로 플레임 그래프 분석).
+"""
+
+import cProfile
+import csv
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+RUN_REPORT_FILE = 'run_report.json'
+PROFILE_DIR = 'profiles'
+
+# CSV 리포트 컬럼 (JSON 리포트의 stages 항목과 같은 키)
+STAGE_FIELDS = [
+    'table', 'step', 'rows', 'wall_seconds', 'cpu_seconds', 'rows_per_second', 'write_seconds',
+    'bytes_written', 'peak_rss_mb', 'tracemalloc_peak_mb', 'pid', 'profile',
+]
+
+
+def reset_peak_rss():
+    """프로세스 최고 RSS 초기화 (Linux 4.0 이상, 실패하면 False)"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb():
+    """프로세스 최고 RSS (MB, 측정할 수 없으면 None)"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss 단위: macOS 는 바이트, Linux 는 KB
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def measured_stage(name, upstream, stage_fn, trace_memory=False, profile_dir=None):
+    """
+    stage_fn(name, upstream) 실행 후 (결과, 측정값 dict) 반환 (워커 프로세스에서도 호출 가능)
+
+    trace_memory: True 이면 tracemalloc 최고치 측정
+    profile_dir: 지정 시 '<name>.prof' cProfile 덤프 저장
+    """
+    reset_peak_rss()
+    if trace_memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+    profiler = cProfile.Profile() if profile_dir else None
+
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    if profiler:
+        profiler.enable()
+    try:
+        result = stage_fn(name, upstream)
+    finally:
+        if profiler:
+            profiler.disable()
+    stats = {
+        'table': name,
+        'wall_seconds': time.perf_counter() - wall,
+        'cpu_seconds': time.process_time() - cpu,
+        'peak_rss_mb': peak_rss_mb(),
+        'tracemalloc_peak_mb': tracemalloc.get_traced_memory()[1] / (1024 * 1024) if trace_memory else None,
+        'pid': os.getpid(),
+        'profile': None,
+    }
+    if profiler:
+        os.makedirs(profile_dir, exist_ok=True)
+        stats['profile'] = os.path.join(profile_dir, f'{name}.prof')
+        profiler.dump_stats(stats['profile'])
+    return result, stats
+
+
+def finish_stats(stats, rows, bytes_written=0, write_seconds=0.0):
+    """메인 프로세스에서 행 수, 처리량, 기록 시간/바이트 추가 (stats 를 수정하고 반환)"""
+    elapsed = stats['wall_seconds'] + write_seconds
+    stats['rows'] = rows
+    stats['write_seconds'] = write_seconds
+    stats['bytes_written'] = bytes_written
+    stats['rows_per_second'] = rows / elapsed if elapsed > 0 else None
+    return stats
+
+
+def run_summary(stages, wall_seconds, **context):
+    """단계 측정값 목록 → 실행 리포트 dict ({'run': 실행 전체, 'stages': 단계별})"""
+    rows = sum(stage['rows'] for stage in stages)
+    peaks = [stage['peak_rss_mb'] for stage in stages if stage['peak_rss_mb'] is not None]
+    run = {
+        'started_at': context.pop('started_at', None),
+        'wall_seconds': wall_seconds,
+        'cpu_seconds': sum(stage['cpu_seconds'] for stage in stages),
+        'rows': rows,
+        'rows_per_second': rows / wall_seconds if wall_seconds > 0 else None,
+        'bytes_written': sum(stage['bytes_written'] or 0 for stage in stages),
+        'peak_rss_mb': max(peaks, default=None),
+        'python': sys.version.split()[0],
+        **context,
+    }
+    return {'run': run, 'stages': stages}
+
+
+def write_run_report(path, report):
+    """실행 리포트 저장 (.csv 이면 단계별 행만, 그 외에는 JSON)"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    if path.endswith('.csv'):
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=STAGE_FIELDS, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(report['stages'])
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return path
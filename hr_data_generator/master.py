@@ -0,0 +1,466 @@
+"""
+A그룹: 마스터 데이터 (Master Data)
+
+조직 구조, 평가 지표 사전, 직원 기본 정보, 보고 라인, 경력 이력, Big-5 성격 검사
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from .columnar import ensure_master
+from .config import CONFIG, reference_date
+from .hierarchy import ancestor_matrix, chain_depth, closure_pairs
+from .metadata import (
+    APTITUDE_DETAILED_DEFINITIONS,
+    APTITUDE_METADATA,
+    BASE_METRICS,
+    CPI_DETAILED_DEFINITIONS,
+    CPI_METADATA,
+    LIFESTYLE_CHARACTERISTICS,
+    MMPI_DETAILED_DEFINITIONS,
+    MMPI_METADATA,
+)
+from .names import name_engine
+from .org import COMPANY_NAME, build_org_layout
+from .rng import stage_random
+from .streaming import collect
+
+ORG_STRUCTURE_COLUMNS = ['org_id', 'org_name', 'org_type', 'parent_org_id', 'level', 'head_employee_id']
+
+JOB_TITLES_HIERARCHY = {
+    '사원': 1,
+    '주임': 2,
+    '대리': 3,
+    '과장': 4,
+    '차장': 5,
+    '팀장': 6,
+    '부장': 7,
+    '센터장': 8,
+    '본부장': 9,
+    '이사': 10,
+}
+
+# 단계별 승진 경로에 넣지 않는 직급 (센터 조직장 직책, 본인의 현재 직급일 때만 경로 끝에 옴)
+APPOINTED_TITLES = {'센터장'}
+
+def build_organization_structure(config=CONFIG):
+    """0-1. organization_structure - 조직 구조 (부서 간 위계)"""
+    layout = build_org_layout(config)
+    company_org = layout['company_org']
+
+    rows = [(company_org, COMPANY_NAME, 'Company', None, 0, layout['ceo_id'])]
+    # 본부 (Level 1)
+    for emp_id, org_id, org_name, _ in layout['divisions']:
+        rows.append((org_id, org_name, 'Division', company_org, 1, emp_id))
+    # 중간 조직 (ORG_LEVELS 가 4 이상일 때, Level 2 ~)
+    for org_id, org_name, org_type, parent_org, _, level, head_id, _ in layout['groups']:
+        rows.append((org_id, org_name, org_type, parent_org, level, head_id))
+    # 팀 (Level 2 ~ ORG_LEVELS - 1, 본부의 중간 계층 수에 따라 다름)
+    for org_id, org_name, parent_org, _, _, leader_id in layout['teams']:
+        rows.append((org_id, org_name, 'Team', parent_org, layout['team_levels'][org_id], leader_id))
+
+    return [dict(zip(ORG_STRUCTURE_COLUMNS, row)) for row in rows]
+
+
+def build_hr_metrics_definition(config=CONFIG):
+    """1. hr_metrics_definition - 평가 지표 사전"""
+    metrics_data = [list(row) for row in BASE_METRICS]
+
+    # CPI 지표들 (상세 특성 정의)
+    for scale_code, scale_info in CPI_METADATA["scales"].items():
+        detailed_def, high_char, low_char = CPI_DETAILED_DEFINITIONS.get(scale_code,
+            (scale_info['definition'], '평균 이상 특성', '평균 이하 특성'))
+        metrics_data.append([
+            f'CPI_{scale_code}', scale_info['name'], 'CPI', scale_info['group'],
+            detailed_def, 'T점수 (20-80)', high_char, low_char
+        ])
+
+    # CPI 라이프스타일 유형들
+    for type_code, type_info in CPI_METADATA["lifestyle_types"].items():
+        detailed_def, high_char, low_char = LIFESTYLE_CHARACTERISTICS[type_code]
+        metrics_data.append([
+            f'CPI_LIFESTYLE_{type_code}', type_info['name'], 'CPI', '라이프스타일유형',
+            detailed_def, '유형분류', high_char, low_char
+        ])
+
+    # MMPI 지표들 (임상적 특성 포함)
+    for scale_code, scale_info in MMPI_METADATA["scales"].items():
+        detailed_def, high_char, low_char = MMPI_DETAILED_DEFINITIONS.get(scale_code,
+            (scale_info['definition'], '높은 점수 특성', '낮은 점수 특성'))
+        metrics_data.append([
+            f'MMPI_{scale_code}', scale_info['name'], 'MMPI', scale_info['group'],
+            detailed_def, 'T점수 (20-80)', high_char, low_char
+        ])
+
+    # 적성검사 지표들 (직무 연관성 포함)
+    for factor_code, factor_info in APTITUDE_METADATA["factors"].items():
+        if factor_code in APTITUDE_DETAILED_DEFINITIONS:
+            detailed_def, high_char, low_char = APTITUDE_DETAILED_DEFINITIONS[factor_code]
+        else:
+            detailed_def = factor_info['definition']
+            high_char = '우수한 능력'
+            low_char = '개선 필요'
+
+        measurement_scale = '100점 척도' if factor_info['group'] != '상위요인' else '평균점수'
+        metrics_data.append([
+            f'APT_{factor_code.upper()}', factor_info['name'], '적성검사', factor_info['group'],
+            detailed_def, measurement_scale, high_char, low_char
+        ])
+
+    columns = ['metric_code', 'metric_name', 'tool_name', 'dimension',
+               'definition', 'measurement_scale', 'high_score_characteristics', 'low_score_characteristics']
+    return [dict(zip(columns, row)) for row in metrics_data]
+
+
+def build_employee_info(config=CONFIG):
+    """2. employee_info - 직원 기본 정보 (위계 구조 반영)"""
+    rng = stage_random(config, 'employee_info')
+    names = name_engine(rng, config)
+    employees = []
+    # 이름/생년월일은 직원 행을 모두 만든 뒤 성별과 나이 범위로 한 번에 생성
+    age_ranges = []
+
+    layout = build_org_layout(config)
+    ceo_id = layout['ceo_id']
+    # 조직 → 조직장 (팀장은 상위 조직의 조직장에게 보고)
+    unit_head = {org_id: emp_id for emp_id, org_id, _, _ in layout['divisions']}
+
+    # 1. 대표이사
+    employees.append({
+        'employee_id': ceo_id,
+        'name': None,
+        'gender': rng.choice(['남', '여']),
+        'birth_date': None,
+        'employment_type': '정규직',
+        'hire_date': '2010-01-01',
+        'org_id': layout['company_org'],
+        'org_name': COMPANY_NAME,
+        'division_name': '대표이사',
+        'job_title': '대표이사',
+        'manager_id': None,
+        'status': '재직'
+    })
+    age_ranges.append((50, 60))
+
+    # 2. 본부장 (경영지원본부, 기술본부, 비즈니스본부 ...)
+    for emp_id, org_id, org_name, div_name in layout['divisions']:
+        employees.append({
+            'employee_id': emp_id,
+            'name': None,
+            'gender': rng.choice(['남', '여']),
+            'birth_date': None,
+            'employment_type': '정규직',
+            'hire_date': names.date_between(14, 8).strftime('%Y-%m-%d'),
+            'org_id': org_id,
+            'org_name': org_name,
+            'division_name': div_name,
+            'job_title': '본부장',
+            'manager_id': ceo_id,
+            'status': '재직'
+        })
+        age_ranges.append((45, 55))
+
+    # 2-1. 중간 조직장 (센터장/실장 등, 상위 조직장에게 보고)
+    for org_id, org_name, _, parent_org, div_name, _, head_id, title in layout['groups']:
+        unit_head[org_id] = head_id
+        employees.append({
+            'employee_id': head_id,
+            'name': None,
+            'gender': rng.choice(['남', '여']),
+            'birth_date': None,
+            'employment_type': '정규직',
+            'hire_date': names.date_between(13, 6).strftime('%Y-%m-%d'),
+            'org_id': org_id,
+            'org_name': org_name,
+            'division_name': div_name,
+            'job_title': title,
+            'manager_id': unit_head[parent_org],
+            'status': '재직'
+        })
+        age_ranges.append((42, 54))
+
+    # 3. 팀장 (팀별 1명, 상위 조직장(본부장 또는 중간 조직장)에게 보고)
+    for org_id, org_name, parent_org, div_name, _, leader_id in layout['teams']:
+        employees.append({
+            'employee_id': leader_id,
+            'name': None,
+            'gender': rng.choice(['남', '여']),
+            'birth_date': None,
+            'employment_type': '정규직',
+            'hire_date': names.date_between(12, 5).strftime('%Y-%m-%d'),
+            'org_id': org_id,
+            'org_name': org_name,
+            'division_name': div_name,
+            'job_title': '팀장',
+            'manager_id': unit_head[parent_org],
+            'status': '재직'
+        })
+        age_ranges.append((38, 50))
+
+    # 4. 일반 직원 생성 (팀별)
+    emp_counter = 1
+    id_width = layout['member_id_width']
+    for org_id, org_name, parent_org, div_name, team_size, manager_id in layout['teams']:
+        # 팀원 생성 (팀장 1명 제외)
+        for _ in range(team_size - 1):
+            # 입사 연도 (2015-2024)
+            hire_year = rng.randint(2015, 2024)
+            hire_month = rng.randint(1, 12)
+            hire_day = rng.randint(1, 28)
+            hire_date = datetime(hire_year, hire_month, hire_day)
+
+            # 근속연수 계산
+            years_of_service = 2024 - hire_year
+
+            # 근속연수에 따른 직급 결정 (자연스러운 분포)
+            if years_of_service < 2:
+                job_title = '사원'
+            elif years_of_service < 4:
+                job_title = rng.choice(['사원', '주임', '대리'])
+            elif years_of_service < 6:
+                job_title = rng.choice(['주임', '대리', '과장'])
+            elif years_of_service < 8:
+                job_title = rng.choice(['대리', '과장', '차장'])
+            else:
+                job_title = rng.choice(['과장', '차장', '차장', '부장'])
+
+            # 나이 계산 (직급과 연관성 있게)
+            if job_title in ['사원', '주임']:
+                age_range = (25, 32)
+            elif job_title in ['대리', '과장']:
+                age_range = (28, 38)
+            elif job_title == '차장':
+                age_range = (33, 45)
+            else:
+                age_range = (38, 55)
+
+            # 재직/퇴사 상태 (약 90% 재직)
+            status = rng.choices(['재직', '퇴사'], weights=[90, 10])[0]
+
+            employees.append({
+                'employee_id': f'EMP{emp_counter:0{id_width}d}',
+                'name': None,
+                'gender': rng.choice(['남', '여']),
+                'birth_date': None,
+                'employment_type': rng.choices(['정규직', '계약직'], weights=[95, 5])[0],
+                'hire_date': hire_date.strftime('%Y-%m-%d'),
+                'org_id': org_id,
+                'org_name': org_name,
+                'division_name': div_name,
+                'job_title': job_title,
+                'manager_id': manager_id,
+                'status': status
+            })
+            age_ranges.append(age_range)
+            emp_counter += 1
+
+    minimum_ages, maximum_ages = zip(*age_ranges)
+    full_names = names.names([emp['gender'] for emp in employees], unique=config['UNIQUE_NAMES'])
+    birth_dates = names.birth_dates(minimum_ages, maximum_ages).astype(str)
+    for emp, name, birth_date in zip(employees, full_names, birth_dates):
+        emp['name'] = name
+        emp['birth_date'] = str(birth_date)
+
+    return employees
+
+
+def iter_reporting_lines(employees, master=None, config=CONFIG):
+    """
+    2-1. reporting_lines - 전체 보고 라인 매핑
+
+    manager_id 를 정수 부모 배열로 바꾼 뒤 pointer jumping 으로 조상 행렬을 한 번에 구하므로 조직
+    계층 수(ORG_LEVELS)와 무관하게 최상위 상사까지의 보고 라인(manager_chain)을 기록합니다.
+    """
+    ids = [emp['employee_id'] for emp in employees]
+    ancestors = ancestor_matrix(ensure_master(employees, master)['manager'])
+    depths = chain_depth(ancestors)
+    line_counter = 1
+
+    for i, emp in enumerate(employees):
+        if emp['manager_id'] is None:
+            continue  # 대표이사는 보고 라인 없음
+
+        # 직속 상사부터 최상위 상사까지 (상사가 직원 목록에 없으면 직속 상사만)
+        chain_index = ancestors[i, :depths[i]].tolist()
+        chain = [ids[j] for j in chain_index] or [emp['manager_id']]
+        manager_emp = employees[chain_index[0]] if chain_index else None
+
+        yield {
+            'reporting_line_id': f'RL{line_counter:04d}',
+            'employee_id': emp['employee_id'],
+            'employee_name': emp['name'],
+            'job_title': emp['job_title'],
+            'immediate_manager_id': emp['manager_id'],
+            'immediate_manager_title': manager_emp['job_title'] if manager_emp else None,
+            'second_level_manager_id': chain[1] if len(chain) > 1 else None,
+            'third_level_manager_id': chain[2] if len(chain) > 2 else None,
+            'reporting_depth': len(chain),
+            'manager_chain': '>'.join(chain),
+            'division_name': emp['division_name'],
+            'org_name': emp['org_name']
+        }
+        line_counter += 1
+
+
+build_reporting_lines = collect(iter_reporting_lines)
+
+
+def iter_reporting_closure(employees, master=None, config=CONFIG):
+    """
+    2-2. reporting_closure - 보고 라인 클로저 테이블 (조상, 자손, 거리)
+
+    직원마다 자기 자신(depth 0)과 모든 상위 상사를 한 행씩 기록합니다. "X 산하 전체 직원"은
+    ancestor_id = X 인 행으로 바로 조회되므로 manager_id 를 재귀적으로 따라갈 필요가 없습니다.
+    """
+    ids = [emp['employee_id'] for emp in employees]
+    ancestors = ancestor_matrix(ensure_master(employees, master)['manager'])
+    descendant, ancestor, depth = closure_pairs(ancestors)
+
+    for i, (d, a, k) in enumerate(zip(descendant.tolist(), ancestor.tolist(), depth.tolist()), start=1):
+        yield {
+            'closure_id': f'RC{i:04d}',
+            'ancestor_id': ids[a],
+            'descendant_id': ids[d],
+            'depth': k,
+        }
+
+
+build_reporting_closure = collect(iter_reporting_closure)
+
+
+def iter_job_history(employees, master=None, config=CONFIG):
+    """3. job_history - 직원 경력 경로"""
+    rng = stage_random(config, 'job_history')
+    reference = reference_date(config)
+    hire_dates = ensure_master(employees, master).hire_datetimes()
+    history_counter = 1
+
+    for emp, hire_date in zip(employees, hire_dates):
+        emp_id = emp['employee_id']
+        current_title = emp['job_title']
+
+        # 입사 시점 직급 결정 (모든 직원이 낮은 직급에서 시작)
+        if current_title == '대표이사':
+            initial_title = current_title  # 대표이사만 예외
+        else:
+            # 현재 직급보다 낮은 직급으로 시작 (팀장도 포함)
+            current_level = JOB_TITLES_HIERARCHY.get(current_title, 1)
+            if current_level <= 2:
+                initial_title = '사원'
+            elif current_level <= 4:  # 대리, 과장
+                initial_title = rng.choice(['사원', '주임'])
+            elif current_level <= 6:  # 차장, 팀장
+                initial_title = rng.choice(['사원', '주임', '대리'])
+            else:  # 부장, 센터장, 본부장
+                initial_title = rng.choice(['주임', '대리', '과장'])
+
+        # 입사 기록 (승진 시 end_date 가 채워지므로 다음 기록이 생길 때 내보냄)
+        record = {
+                'history_id': f'HIST{history_counter:04d}',
+                'employee_id': emp_id,
+                'start_date': emp['hire_date'],
+                'end_date': None if initial_title == current_title else None,
+                'org_id': emp['org_id'],
+                'job_title': initial_title,
+                'change_type': '신규입사'
+        }
+        history_counter += 1
+
+        # 승진 기록 생성 (입사일로부터 현재 직급까지)
+        if initial_title != current_title:
+            years_of_service = reference.year - hire_date.year
+            current_level = JOB_TITLES_HIERARCHY.get(current_title, 1)
+            initial_level = JOB_TITLES_HIERARCHY.get(initial_title, 1)
+
+            # 승진 경로 생성 (사이 직급을 차례로 거쳐 현재 직급에서 끝남)
+            promotion_path = []
+            if current_level > initial_level:
+                promotion_path = [title for title, level in JOB_TITLES_HIERARCHY.items()
+                                  if initial_level < level < current_level and title not in APPOINTED_TITLES]
+                promotion_path.append(current_title)
+
+            # 승진 날짜 분산
+            if promotion_path:
+                years_per_promotion = years_of_service / len(promotion_path)
+                for idx, promoted_title in enumerate(promotion_path):
+                    promotion_date = hire_date + timedelta(days=int((idx + 1) * years_per_promotion * 365))
+                    if promotion_date > reference:
+                        break
+
+                    # 이전 기록 종료
+                    record['end_date'] = (promotion_date - timedelta(days=1)).strftime('%Y-%m-%d')
+                    yield record
+
+                    record = {
+                        'history_id': f'HIST{history_counter:04d}',
+                        'employee_id': emp_id,
+                        'start_date': promotion_date.strftime('%Y-%m-%d'),
+                        'end_date': None if promoted_title == current_title else None,
+                        'org_id': emp['org_id'],
+                        'job_title': promoted_title,
+                        'change_type': '승진'
+                    }
+                    history_counter += 1
+
+        yield record
+
+
+build_job_history = collect(iter_job_history)
+
+
+def iter_personal_traits(employees, master=None, config=CONFIG):
+    """4. personal_traits - Big-5 성격 검사"""
+    rng = stage_random(config, 'personal_traits')
+    master = ensure_master(employees, master)
+    hire_dates = master.hire_datetimes()
+    trait_counter = 1
+
+    # 모든 재직 중인 직원에게 Big-5 검사 실시
+    for i in master.rows(master['active']):
+        emp = employees[i]
+        hire_date = hire_dates[i]
+        assessment_date = hire_date + timedelta(days=rng.randint(30, 120))
+
+        # Big-5 점수 생성 (정규분포 활용, 0-100 척도)
+        openness = int(np.clip(rng.normal(65, 15), 30, 100))
+        conscientiousness = int(np.clip(rng.normal(70, 12), 40, 100))
+        extraversion = int(np.clip(rng.normal(60, 18), 20, 100))
+        agreeableness = int(np.clip(rng.normal(68, 14), 35, 100))
+        neuroticism = int(np.clip(rng.normal(45, 16), 10, 90))
+
+        # 가장 높은 특성 찾기
+        scores = {
+            '개방성': openness,
+            '성실성': conscientiousness,
+            '외향성': extraversion,
+            '친화성': agreeableness
+        }
+        highest_trait = max(scores, key=scores.get)
+        highest_score = scores[highest_trait]
+
+        # 강점 설명
+        if highest_score >= 80:
+            strength_desc = f'매우 높은 {highest_trait}'
+        elif highest_score >= 70:
+            strength_desc = f'높은 {highest_trait}'
+        else:
+            strength_desc = f'{highest_trait} 우세'
+
+        yield {
+            'trait_id': f'TRAIT{trait_counter:03d}',
+            'employee_id': emp['employee_id'],
+            'assessment_date': assessment_date.strftime('%Y-%m-%d'),
+            'tool_name': 'Big-5 성격검사',
+            'openness': openness,
+            'conscientiousness': conscientiousness,
+            'extraversion': extraversion,
+            'agreeableness': agreeableness,
+            'neuroticism': neuroticism,
+            'primary_strength': strength_desc,
+            'motivation_driver': rng.choice(['성취', '안정', '관계', '성장', '인정', '자율성', '전문성', '영향력'])
+        }
+        trait_counter += 1
+
+
+build_personal_traits = collect(iter_personal_traits)
@@ -0,0 +1,458 @@
+"""
+채용 전형 검사 메타데이터 및 평가 지표 정의
+"""
+
+# ============================================================================
+# 채용 전형 검사 메타데이터 정의
+# ============================================================================
+
+# CPI (California Personality Inventory) 메타데이터
+CPI_METADATA = {
+    "description": "캘리포니아 성격 검사(CPI)는 개인의 성격 특성을 다차원적으로 이해하고 예측하기 위해 사용되는 검사입니다.",
+    "scales": {
+        # 1군: 대인관계 및 자신감
+        "Do": {"name": "지배성", "name_en": "Dominance", "group": "대인관계및자신감", 
+               "definition": "리더십, 주도성, 자신감을 측정합니다."},
+        "Cs": {"name": "지위추구성", "name_en": "Capacity for Status", "group": "대인관계및자신감",
+               "definition": "사회적 지위를 얻고자 하는 욕구를 평가합니다."},
+        "Sy": {"name": "사교성", "name_en": "Sociability", "group": "대인관계및자신감",
+               "definition": "사교적이고 외향적인 성향을 측정합니다."},
+        "Sp": {"name": "사회적존재감", "name_en": "Social Presence", "group": "대인관계및자신감",
+               "definition": "대인관계에서 자신감과 자발성을 평가합니다."},
+        "Sa": {"name": "자기수용", "name_en": "Self-acceptance", "group": "대인관계및자신감",
+               "definition": "자신의 가치와 장점을 인정하는 정도를 측정합니다."},
+        "In": {"name": "독립성", "name_en": "Independence", "group": "대인관계및자신감",
+               "definition": "자율적이고 독립적으로 생각하고 행동하는 경향을 평가합니다."},
+        "Em": {"name": "공감성", "name_en": "Empathy", "group": "대인관계및자신감",
+               "definition": "타인의 감정을 이해하고 공유하는 능력을 측정합니다."},
+        
+        # 2군: 규범 지향성 및 가치관
+        "Re": {"name": "책임감", "name_en": "Responsibility", "group": "규범지향성및가치관",
+               "definition": "책임감이 있고 신뢰할 만한 정도를 평가합니다."},
+        "So": {"name": "사회화", "name_en": "Socialization", "group": "규범지향성및가치관",
+               "definition": "사회적 규범과 가치를 내면화한 정도를 측정합니다."},
+        "Sc": {"name": "자기통제", "name_en": "Self-control", "group": "규범지향성및가치관",
+               "definition": "충동을 억제하고 자신을 통제하는 능력을 평가합니다."},
+        "Gi": {"name": "호감성", "name_en": "Good Impression", "group": "규범지향성및가치관",
+               "definition": "타인에게 좋은 인상을 주려는 경향을 측정합니다."},
+        "Cm": {"name": "공동체성", "name_en": "Communality", "group": "규범지향성및가치관",
+               "definition": "일반적인 사람들과 유사하게 반응하는 정도를 평가합니다."},
+        "Wb": {"name": "안녕감", "name_en": "Well-being", "group": "규범지향성및가치관",
+               "definition": "전반적인 삶의 만족감과 행복감을 측정합니다."},
+        "To": {"name": "관용성", "name_en": "Tolerance", "group": "규범지향성및가치관",
+               "definition": "타인의 신념이나 태도에 대한 관용적인 태도를 평가합니다."},
+        
+        # 3군: 성취 잠재력 및 지적 효율성
+        "Ac": {"name": "순응을통한성취", "name_en": "Achievement via Conformance", "group": "성취잠재력및지적효율성",
+               "definition": "규칙적이고 체계적인 환경에서 성취를 이루는 경향을 측정합니다."},
+        "Ai": {"name": "독립을통한성취", "name_en": "Achievement via Independence", "group": "성취잠재력및지적효율성",
+               "definition": "독창적이고 자율적인 환경에서 성취를 이루는 경향을 평가합니다."},
+        "Ie": {"name": "지적효율성", "name_en": "Intellectual Efficiency", "group": "성취잠재력및지적효율성",
+               "definition": "지적 능력을 효율적으로 사용하는 정도를 측정합니다."},
+        
+        # 4군: 역할 및 개인적 스타일
+        "Py": {"name": "심리지향성", "name_en": "Psychological-mindedness", "group": "역할및개인적스타일",
+               "definition": "자신과 타인의 내면 및 동기에 대한 관심 정도를 평가합니다."},
+        "Fx": {"name": "융통성", "name_en": "Flexibility", "group": "역할및개인적스타일",
+               "definition": "변화에 개방적이고 적응을 잘하는 정도를 측정합니다."},
+        "FM": {"name": "여성성남성성", "name_en": "Femininity/Masculinity", "group": "역할및개인적스타일",
+               "definition": "전통적인 성 역할에 부합하는 관심과 태도를 측정합니다."},
+        
+        # 벡터척도
+        "v1": {"name": "외향성내향성", "name_en": "Extraversion-Introversion", "group": "벡터척도",
+               "definition": "외부 세계와 상호작용하는 방식을 측정합니다."},
+        "v2": {"name": "규범지향규범회의", "name_en": "Norm-orientation vs Norm-doubting", "group": "벡터척도",
+               "definition": "규범을 따르는 정도를 측정합니다."},
+        "v3": {"name": "자아실현", "name_en": "Self-realization", "group": "벡터척도",
+               "definition": "개인의 통합감과 자아실현 수준을 측정합니다."}
+    },
+    "lifestyle_types": {
+        "Alpha": {"name": "알파형", "definition": "외향적이고 규범을 따르며, 능동적이고 리더십이 강한 실행형"},
+        "Beta": {"name": "베타형", "definition": "내향적이고 규범을 따르며, 성실하고 책임감이 강한 협력형"},
+        "Gamma": {"name": "감마형", "definition": "외향적이고 규범에 회의적이며, 혁신적이고 즐거움을 추구하는 혁신형"},
+        "Delta": {"name": "델타형", "definition": "내향적이고 규범에 회의적이며, 사색적이고 독특한 경향이 있는 사색형"}
+    }
+}
+
+# MMPI (Minnesota Multiphasic Personality Inventory) 메타데이터
+MMPI_METADATA = {
+    "description": "미네소타 다면적 인성검사(MMPI)는 개인의 성격 특성과 정신병리를 평가하기 위해 사용되는 심리 검사입니다.",
+    "scales": {
+        # 타당도 척도
+        "L": {"name": "허위척도", "name_en": "Lie Scale", "group": "타당도척도",
+              "definition": "자신을 의도적으로 좋게 보이려고 하거나 사회적으로 바람직한 방식으로 응답하는 경향을 측정합니다."},
+        "F": {"name": "빈도척도", "name_en": "Frequency Scale", "group": "타당도척도",
+              "definition": "일반적인 사람들과 다른 비전형적인 방식으로 응답하는 경향을 탐지합니다."},
+        "K": {"name": "교정척도", "name_en": "Correction Scale", "group": "타당도척도",
+              "definition": "자신을 방어적으로 드러내지 않으려는 태도를 측정합니다."},
+        
+        # 임상 척도
+        "Hs": {"name": "건강염려증", "name_en": "Hypochondriasis", "group": "임상척도",
+               "definition": "신체적 건강에 대한 과도한 염려와 집착을 측정합니다."},
+        "D": {"name": "우울증", "name_en": "Depression", "group": "임상척도",
+              "definition": "우울감, 비관주의, 무기력감 등 우울 증상과 관련된 특성을 평가합니다."},
+        "Hy": {"name": "히스테리", "name_en": "Hysteria", "group": "임상척도",
+               "definition": "스트레스 상황에서 신체적 증상을 나타내거나 부인, 억압과 같은 방어기제를 사용하는 경향을 측정합니다."},
+        "Pd": {"name": "반사회성", "name_en": "Psychopathic Deviate", "group": "임상척도",
+               "definition": "사회적 규범이나 권위에 대한 반항, 충동성, 대인관계에서의 갈등 등을 평가합니다."},
+        "Mf": {"name": "남성성여성성", "name_en": "Masculinity-Femininity", "group": "임상척도",
+               "definition": "전통적인 성 역할 고정관념과의 일치 정도를 측정합니다."},
+        "Pa": {"name": "편집증", "name_en": "Paranoia", "group": "임상척도",
+               "definition": "타인에 대한 의심, 민감성, 적대감과 같은 편집성향을 평가합니다."},
+        "Pt": {"name": "강박증", "name_en": "Psychasthenia", "group": "임상척도",
+               "definition": "불안, 걱정, 강박적 사고, 결단력 부족과 관련된 특성을 측정합니다."},
+        "Sc": {"name": "정신분열병", "name_en": "Schizophrenia", "group": "임상척도",
+               "definition": "혼란스러운 사고, 비현실감, 사회적 소외감 등 정신분열 스펙트럼과 관련된 특징을 평가합니다."},
+        "Ma": {"name": "경조증", "name_en": "Hypomania", "group": "임상척도",
+               "definition": "과잉 활동, 충동성, 흥분, 과대사고 등 경조증적 경향을 측정합니다."},
+        "Si": {"name": "사회적내향성", "name_en": "Social Introversion", "group": "임상척도",
+               "definition": "사교 상황에서의 불편감, 내향성, 사회적 회피 경향을 평가합니다."}
+    }
+}
+
+# 적성검사 메타데이터
+APTITUDE_METADATA = {
+    "description": "직무 수행에 필요한 잠재적 능력을 다양한 요인을 통해 측정하는 검사입니다.",
+    "factors": {
+        # 언어적 능력
+        "verbal_total": {"name": "언어적능력", "group": "상위요인", 
+                        "definition": "어휘, 문장 구성 및 해독 등 언어와 관련된 종합적인 능력을 평가합니다."},
+        "verbal_vocab": {"name": "어휘능력", "group": "언어적능력", 
+                        "definition": "어휘의 의미를 정확히 이해하고 활용하는 능력입니다."},
+        "verbal_composition": {"name": "문장구성력", "group": "언어적능력",
+                              "definition": "문법에 맞고 논리적인 문장을 구성하는 능력입니다."},
+        "verbal_decoding": {"name": "문장해독력", "group": "언어적능력",
+                           "definition": "복잡한 문장의 의미를 정확히 파악하는 능력입니다."},
+        "verbal_english": {"name": "영어능력", "group": "언어적능력",
+                          "definition": "영어 독해 및 활용 능력입니다."},
+        
+        # 수리적 능력
+        "numerical_total": {"name": "수리적능력", "group": "상위요인",
+                           "definition": "수량 및 통계 자료를 이해하고 논리적으로 사고하는 능력을 평가합니다."},
+        "numerical_quantity": {"name": "수량적처리능력", "group": "수리적능력",
+                              "definition": "수치 데이터를 빠르고 정확하게 처리하는 능력입니다."},
+        "numerical_statistics": {"name": "통계적처리능력", "group": "수리적능력",
+                                "definition": "통계적 개념을 이해하고 적용하는 능력입니다."},
+        "numerical_logic": {"name": "논리적사고능력", "group": "수리적능력",
+                           "definition": "논리적 추론과 문제 해결 능력입니다."},
+        
+        # 상황판단 능력
+        "situational_judgment": {"name": "상황판단능력", "group": "상위요인",
+                                "definition": "조직 생활에서 발생 가능한 상황을 정확하게 판단하는 능력입니다."},
+        
+        # 사회적 상식
+        "social_knowledge": {"name": "사회적상식", "group": "상위요인",
+                            "definition": "사회 구성원으로서 최소한의 상식을 갖추고 있는 정도입니다."},
+        
+        # 대인관계능력
+        "interpersonal_skills": {"name": "대인관계능력", "group": "상위요인",
+                                "definition": "타인과 원활한 관계를 형성하고 유지하는 능력입니다."}
+    }
+}
+
+# ============================================================================
+# 평가 지표 사전 (hr_metrics_definition) 정의
+# ============================================================================
+
+BASE_METRICS = [
+    # 스킬 역량 (상세 정의 확장)
+    ['SKILL_001', '데이터 분석', 'Competency Framework', 'Technical Skill', 
+     '대량의 데이터를 수집, 정제, 분석하여 비즈니스 인사이트를 도출하고 의사결정을 지원하는 능력. 통계적 분석, 데이터 시각화, 패턴 인식을 포함함', '1-5점 척도',
+     '복잡한 데이터에서 핵심 인사이트 도출, 예측 모델 구축, 데이터 기반 전략 수립, 고급 분석 도구 활용',
+     '기초적 데이터 처리만 가능, 분석 결과 해석 어려움, 단순 집계 수준, 데이터 품질 검증 미흡'],
+    
+    ['SKILL_002', '커뮤니케이션', 'Competency Framework', 'Soft Skill',
+     '다양한 이해관계자와 명확하고 효과적으로 의사소통하는 능력. 경청, 설득, 프레젠테이션, 문서 작성, 갈등 조정을 포함함', '1-5점 척도',
+     '복잡한 내용을 명확히 전달, 이해관계자 설득, 갈등 중재, 효과적 프레젠테이션, 문서화 우수',
+     '의사전달 불분명, 오해 빈발, 소극적 의견 표현, 문서 작성 미흡, 갈등 상황 회피'],
+    
+    ['SKILL_003', 'Python 프로그래밍', 'Competency Framework', 'Technical Skill',
+     'Python 언어를 활용한 소프트웨어 개발, 데이터 처리, 자동화 스크립트 작성 능력. 라이브러리 활용, 코드 최적화, 디버깅 포함', '1-5점 척도',
+     '고급 라이브러리 활용, 효율적 알고리즘 구현, 복잡한 시스템 개발, 코드 리뷰 및 멘토링',
+     '기본 문법만 이해, 단순 스크립트 작성, 라이브러리 의존도 높음, 디버깅 어려움'],
+    
+    ['SKILL_004', '프로젝트 관리', 'Competency Framework', 'Management Skill',
+     '프로젝트의 계획 수립부터 완료까지 전 과정을 체계적으로 관리하는 능력. 일정 관리, 자원 배분, 위험 관리, 품질 관리를 포함함', '1-5점 척도',
+     '복잡한 프로젝트 성공적 완수, 일정 단축 달성, 예산 절감, 팀 생산성 향상, 위험 사전 대응',
+     '일정 지연 빈발, 예산 초과, 품질 기준 미달, 팀 갈등 관리 미흡, 위험 대응 부족'],
+    
+    ['SKILL_005', '협업', 'Competency Framework', 'Soft Skill',
+     '다양한 부서 및 팀원들과 효과적으로 협력하여 공동 목표를 달성하는 능력. 팀워크, 지식 공유, 상호 지원, 시너지 창출을 포함함', '1-5점 척도',
+     '크로스팀 협업 주도, 지식 공유 활발, 갈등 해결 기여, 팀 시너지 창출, 협업 문화 조성',
+     '개인 업무 위주, 정보 공유 소극적, 타 부서와 소통 부족, 협업 회피, 사일로 현상'],
+    
+    ['SKILL_006', '문제 해결', 'Competency Framework', 'Soft Skill',
+     '복잡하고 모호한 문제를 체계적으로 분석하고 창의적이며 실용적인 해결책을 도출하는 능력. 논리적 사고, 창의적 접근, 대안 모색을 포함함', '1-5점 척도',
+     '복잡한 문제 신속 해결, 창의적 솔루션 제시, 근본 원인 파악, 예방적 조치 수립, 문제 해결 프로세스 개선',
+     '문제 인식 부족, 표면적 해결, 반복적 문제 발생, 해결책 부족, 문제 회피 경향'],
+    
+    ['SKILL_007', '기술 전문성', 'Competency Framework', 'Technical Skill',
+     '담당 분야의 깊이 있는 기술적 지식과 실무 경험을 바탕으로 한 전문성. 최신 기술 동향 파악, 기술적 의사결정, 기술 멘토링을 포함함', '1-5점 척도',
+     '업계 최신 기술 선도, 기술적 의사결정 주도, 전문가로 인정, 기술 멘토링 제공, 혁신 기술 도입',
+     '기본 기술만 보유, 최신 동향 파악 부족, 기술적 판단 미흡, 의존적 업무 수행, 학습 의지 부족'],
+    
+    ['SKILL_008', '학습 민첩성', 'Competency Framework', 'Soft Skill',
+     '변화하는 환경에서 새로운 기술, 지식, 스킬을 빠르게 습득하고 적용하는 능력. 자기주도 학습, 적응력, 성장 마인드를 포함함', '1-5점 척도',
+     '신기술 빠른 습득, 자기주도 학습, 변화 적응 우수, 지속적 성장, 학습 내용 실무 적용',
+     '학습 속도 느림, 변화 저항, 기존 방식 고수, 새로운 도전 회피, 성장 정체'],
+    
+    ['SKILL_009', '비즈니스 이해도', 'Competency Framework', 'Business Skill',
+     '조직의 비즈니스 모델, 시장 환경, 고객 니즈를 이해하고 업무에 적용하는 능력. 시장 분석, 고객 관점, 수익성 고려를 포함함', '1-5점 척도',
+     '시장 트렌드 파악, 고객 니즈 이해, 비즈니스 임팩트 고려, 수익성 개선 기여, 전략적 사고',
+     '기술 중심 사고, 비즈니스 맥락 이해 부족, 고객 관점 부재, 단순 업무 처리, 시장 변화 무관심'],
+    
+    ['SKILL_010', '창의성', 'Competency Framework', 'Soft Skill',
+     '기존 관념에서 벗어나 새롭고 독창적인 아이디어를 창출하고 실행하는 능력. 혁신적 사고, 아이디어 구현, 실험 정신을 포함함', '1-5점 척도',
+     '혁신적 아이디어 제시, 창의적 솔루션 개발, 새로운 접근법 시도, 실험 정신, 변화 주도',
+     '관습적 사고, 새로운 시도 부족, 아이디어 부족, 변화 저항, 안전한 방법만 선호'],
+    
+    # 리더십 역량 (상세 정의 확장)
+    ['LEAD_001', '전략적 비전 제시', 'Leadership 360', 'Strategic Leadership',
+     '조직의 장기적 방향성과 비전을 수립하고 구성원들에게 명확히 전달하여 공감대를 형성하는 능력. 미래 예측, 전략 수립, 비전 소통을 포함함', '1-5점 척도',
+     '명확한 비전 제시, 전략적 방향 설정, 구성원 공감대 형성, 미래 트렌드 예측, 조직 변화 주도',
+     '비전 부재, 단기적 사고, 방향성 불분명, 구성원 혼란, 전략적 사고 부족'],
+    
+    ['LEAD_002', '팀 육성 및 개발', 'Leadership 360', 'People Leadership',
+     '팀원 개개인의 강점을 파악하고 성장할 수 있도록 지원하며 팀 전체의 역량을 향상시키는 능력. 개인 개발, 팀 빌딩, 성장 지원을 포함함', '1-5점 척도',
+     '개인별 맞춤 육성, 성장 기회 제공, 팀 역량 향상, 후계자 양성, 학습 문화 조성',
+     '팀원 방치, 개발 기회 부족, 획일적 관리, 성장 지원 미흡, 개인 특성 무시'],
+    
+    ['LEAD_003', '의사결정 능력', 'Leadership 360', 'Strategic Leadership',
+     '복잡한 상황에서 충분한 정보를 수집하고 분석하여 적시에 효과적인 의사결정을 내리는 능력. 정보 분석, 대안 평가, 결정 실행을 포함함', '1-5점 척도',
+     '신속하고 정확한 판단, 데이터 기반 의사결정, 리스크 고려, 결과에 대한 책임, 결정 실행력',
+     '의사결정 지연, 우유부단함, 정보 부족한 판단, 책임 회피, 결정 번복 빈발'],
+    
+    ['LEAD_004', '변화 관리', 'Leadership 360', 'Change Leadership',
+     '조직 내 변화를 계획하고 실행하며 구성원들의 변화 저항을 최소화하고 적응을 돕는 능력. 변화 계획, 저항 관리, 적응 지원을 포함함', '1-5점 척도',
+     '변화 주도, 저항 극복, 구성원 설득, 변화 정착, 지속적 개선 문화',
+     '변화 저항, 현상 유지 선호, 구성원 설득 실패, 변화 계획 부실, 추진력 부족'],
+    
+    ['LEAD_005', '코칭 및 피드백', 'Leadership 360', 'People Leadership',
+     '팀원의 성과와 행동에 대해 건설적이고 구체적인 피드백을 제공하고 성장을 위한 코칭을 하는 능력. 성과 피드백, 행동 코칭, 개발 지원을 포함함', '1-5점 척도',
+     '구체적 피드백 제공, 성장 지향 코칭, 강점 개발 지원, 개선점 명확 제시, 지속적 관심',
+     '피드백 회피, 추상적 조언, 일방적 지시, 개발 지원 부족, 관심 부족'],
+    
+    ['LEAD_006', '신뢰 구축', 'Leadership 360', 'People Leadership',
+     '일관된 행동과 투명한 소통을 통해 팀원들과 상호 신뢰 관계를 형성하고 유지하는 능력. 진정성, 일관성, 투명성, 약속 이행을 포함함', '1-5점 척도',
+     '높은 신뢰도, 약속 이행, 투명한 소통, 일관된 행동, 팀원 존중, 진정성 있는 관계',
+     '신뢰도 낮음, 약속 불이행, 불투명한 소통, 일관성 부족, 편파적 대우, 형식적 관계'],
+    
+    ['LEAD_007', '임파워먼트', 'Leadership 360', 'People Leadership',
+     '팀원에게 적절한 권한과 책임을 위임하고 자율적으로 업무를 수행할 수 있도록 지원하는 능력. 권한 위임, 자율성 부여, 책임감 부여를 포함함', '1-5점 척도',
+     '적절한 권한 위임, 자율적 업무 환경, 책임감 부여, 의사결정 참여 기회, 성장 기회 제공',
+     '과도한 통제, 미시 관리, 권한 위임 부족, 의사결정 독점, 자율성 제한'],
+    
+    # 성과 지표 (상세 정의 확장)
+    ['PERF_001', '업무 성과', 'Performance Review', 'Result',
+     '설정된 목표와 KPI 대비 실제 달성한 성과의 정도. 양적 목표 달성, 질적 기준 충족, 기한 준수, 예산 효율성을 종합 평가', 'S/A/B/C/D 등급',
+     'S등급: 목표 130% 이상 달성, 혁신적 성과, 조직 기여도 탁월 | A등급: 목표 110-129% 달성, 우수한 성과',
+     'D등급: 목표 70% 미만, 기본 업무 미달 | C등급: 목표 70-89% 달성, 개선 필요'],
+    
+    ['PERF_002', '업무 효율성', 'Performance Review', 'Process',
+     '주어진 시간, 인력, 예산 등 제한된 자원을 최적으로 활용하여 최대의 성과를 창출하는 능력. 시간 관리, 자원 활용, 프로세스 개선을 포함함', '1-5점 척도',
+     '높은 생산성, 시간 관리 우수, 자원 최적 활용, 프로세스 개선, 업무 자동화 도입',
+     '낮은 생산성, 시간 관리 부족, 자원 낭비, 비효율적 프로세스, 반복 업무 개선 미흡'],
+    
+    ['PERF_003', '창의성 및 혁신', 'Performance Review', 'Innovation',
+     '기존 방식에서 벗어나 새로운 아이디어와 혁신적 접근법을 제시하고 실행하는 능력. 아이디어 창출, 혁신 실행, 개선 제안을 포함함', '1-5점 척도',
+     '혁신적 아이디어 다수 제안, 새로운 방법론 도입, 프로세스 혁신, 창의적 문제 해결, 변화 주도',
+     '관습적 업무 수행, 새로운 시도 부족, 개선 제안 없음, 변화 저항, 안전한 방법만 선호'],
+    
+    # 조직몰입도 관련 (상세 정의 확장)
+    ['ENG_001', '직무 만족도', 'Engagement Survey', 'Job Satisfaction',
+     '현재 수행하는 업무의 내용, 난이도, 의미, 성취감에 대한 전반적 만족도. 업무 흥미, 성취감, 의미감, 도전감을 포함함', '1-5점 척도',
+     '업무에 대한 높은 흥미, 성취감 충만, 일의 의미 인식, 적절한 도전, 전문성 발휘 기회',
+     '업무 흥미 부족, 성취감 낮음, 일의 의미 부재, 과소/과도한 업무량, 전문성 활용 기회 부족'],
+    
+    ['ENG_002', '상사와의 관계', 'Engagement Survey', 'Manager Relationship',
+     '직속 상사와의 업무적, 인간적 관계에 대한 만족도. 소통 품질, 지원 정도, 신뢰 관계, 성장 지원을 포함함', '1-5점 척도',
+     '원활한 소통, 적극적 지원, 높은 신뢰, 성장 기회 제공, 공정한 평가, 인간적 배려',
+     '소통 단절, 지원 부족, 신뢰 부족, 성장 기회 제한, 불공정한 대우, 관계 갈등'],
+    
+    ['ENG_003', '이직 의도', 'Engagement Survey', 'Retention',
+     '현재 조직을 떠나 다른 직장으로 이직하려는 의도의 강도. 조직 만족도, 커리어 전망, 대안 탐색을 반영함', '1-5점 척도',
+     '높은 점수: 적극적 이직 준비, 대안 탐색 중, 조직 불만족, 커리어 정체감, 외부 기회 모색',
+     '낮은 점수: 조직 만족, 장기 근무 의향, 성장 기회 인식, 조직 애착, 안정적 관계'],
+    
+    # Big-5 성격검사 요인들 (상세 정의 추가)
+    ['BIG5_OPENNESS', '개방성', 'Big-5 성격검사', 'Personality',
+     '새로운 경험과 아이디어에 대한 개방성과 호기심을 측정하는 성격 요인. 창의성, 상상력, 지적 호기심, 예술적 감수성, 변화 수용성을 포함함', '0-100점 척도',
+     '높은 창의성과 상상력, 새로운 아이디어 수용, 예술적 감수성, 지적 호기심 왕성, 변화와 다양성 추구, 독창적 사고, 실험 정신',
+     '보수적 사고, 새로운 것 기피, 예술적 관심 부족, 호기심 부족, 변화 저항, 관습적 접근, 안전한 선택 선호'],
+    
+    ['BIG5_CONSCIENTIOUSNESS', '성실성', 'Big-5 성격검사', 'Personality',
+     '목표 지향적이고 자기 통제력이 있으며 조직적인 성향을 측정하는 성격 요인. 책임감, 근면성, 계획성, 자기 통제, 목표 지향성을 포함함', '0-100점 척도',
+     '높은 책임감과 근면성, 체계적이고 조직적, 목표 지향적, 자기 통제력 우수, 계획적 행동, 성취 지향, 신뢰성 높음',
+     '책임감 부족, 게으름, 비조직적, 목표 의식 부족, 자기 통제력 부족, 즉흥적 행동, 신뢰성 낮음'],
+    
+    ['BIG5_EXTRAVERSION', '외향성', 'Big-5 성격검사', 'Personality',
+     '사회적 상황에서의 활동성과 에너지 수준을 측정하는 성격 요인. 사교성, 활동성, 자극 추구, 긍정적 정서, 주도성을 포함함', '0-100점 척도',
+     '사교적이고 활동적, 에너지 넘침, 자극 추구, 긍정적 정서, 주도적 행동, 사람들과 함께 있기 선호, 외부 활동 적극적',
+     '내향적이고 조용함, 에너지 절약, 자극 회피, 신중한 정서, 수동적 행동, 혼자 있기 선호, 내부 활동 선호'],
+    
+    ['BIG5_AGREEABLENESS', '친화성', 'Big-5 성격검사', 'Personality',
+     '타인에 대한 신뢰와 협력적 태도를 측정하는 성격 요인. 신뢰성, 협력성, 배려심, 겸손함, 관용성을 포함함', '0-100점 척도',
+     '높은 신뢰성과 협력성, 배려심 많음, 겸손하고 관용적, 타인 도움 적극적, 갈등 회피, 조화 추구, 팀워크 우수',
+     '의심 많고 경쟁적, 배려심 부족, 자기중심적, 타인 도움 소극적, 갈등 유발, 대립적 태도, 개인주의'],
+    
+    ['BIG5_NEUROTICISM', '신경증', 'Big-5 성격검사', 'Personality',
+     '정서적 불안정성과 부정적 감정의 경험 정도를 측정하는 성격 요인. 불안, 우울, 분노, 스트레스 취약성, 감정 변화를 포함함', '0-100점 척도',
+     '높은 점수: 정서적 불안정, 스트레스 취약, 불안과 걱정 많음, 기분 변화 심함, 부정적 감정 빈발, 압박감 높음',
+     '낮은 점수: 정서적 안정, 스트레스 저항력, 평온하고 차분함, 기분 안정, 긍정적 감정, 압박감 적음'],
+]
+
+# 채용 검사 지표들 추가 (상세 정의 포함)
+
+# CPI 지표들 (상세 특성 정의)
+CPI_DETAILED_DEFINITIONS = {
+    'Do': ('리더십과 주도성을 측정하는 척도. 타인을 이끌고 영향을 미치려는 경향, 자신감, 결단력을 평가함',
+           '강한 리더십, 주도적 행동, 자신감 넘침, 결단력 있음, 영향력 발휘, 책임감 강함, 도전적 과제 선호',
+           '수동적 태도, 리더십 회피, 자신감 부족, 우유부단함, 타인 의존적, 책임 회피, 안전한 업무 선호'),
+    'Cs': ('사회적 지위와 성공에 대한 욕구를 측정하는 척도. 출세 지향성, 성취 동기, 사회적 인정 추구를 평가함',
+           '출세 욕구 강함, 성취 지향적, 사회적 인정 추구, 경쟁심 강함, 목표 지향적, 성공 의지',
+           '출세 욕구 낮음, 현상 만족, 경쟁 회피, 안정 추구, 소극적 태도, 성취 동기 부족'),
+    'Sy': ('사교적이고 외향적인 성향을 측정하는 척도. 대인관계 선호, 사교 활동, 외향성을 평가함',
+           '사교적, 외향적, 대인관계 활발, 모임 주도, 에너지 넘침, 표현력 풍부',
+           '내향적, 사교 활동 기피, 대인관계 소극적, 혼자 있기 선호, 조용한 성격, 표현 절제'),
+    'Sp': ('대인관계에서의 자신감과 자발성을 측정하는 척도. 사회적 자신감, 존재감, 영향력을 평가함',
+           '사회적 자신감, 강한 존재감, 주목받기 좋아함, 발표력 우수, 카리스마, 사교적 리더십',
+           '사회적 불안, 존재감 부족, 주목받기 싫어함, 발표 기피, 소극적 참여, 뒤에서 지원'),
+    'Sa': ('자신의 가치와 장점을 인정하는 정도를 측정하는 척도. 자존감, 자기 효능감, 자기 수용을 평가함',
+           '높은 자존감, 자기 확신, 장점 인식, 자기 효능감, 긍정적 자아상, 자기 수용',
+           '낮은 자존감, 자기 의심, 단점 집착, 자기 효능감 부족, 부정적 자아상, 자기 비판'),
+    'In': ('자율적이고 독립적인 사고와 행동 경향을 측정하는 척도. 독립성, 자율성, 개별성을 평가함',
+           '독립적 사고, 자율적 행동, 개별성 추구, 독창적 접근, 자기 주도적, 타인 의견에 휘둘리지 않음',
+           '의존적 성향, 타인 의견 추종, 집단 동조, 독립성 부족, 지시 의존적, 자율성 제한'),
+    'Em': ('타인의 감정을 이해하고 공유하는 능력을 측정하는 척도. 공감 능력, 감정 이해, 배려심을 평가함',
+           '높은 공감 능력, 타인 감정 이해, 배려심 많음, 감정적 지지 제공, 인간관계 우수',
+           '공감 능력 부족, 타인 감정 무관심, 배려 부족, 감정적 둔감함, 인간관계 어려움'),
+    'Re': ('책임감과 신뢰성을 측정하는 척도. 의무감, 신뢰성, 성실성, 약속 이행을 평가함',
+           '강한 책임감, 높은 신뢰성, 약속 이행, 성실함, 의무감, 일관된 행동',
+           '책임감 부족, 신뢰성 낮음, 약속 불이행, 불성실함, 의무감 부족, 일관성 부족'),
+    'So': ('사회적 규범과 가치를 내면화한 정도를 측정하는 척도. 사회적 적응, 규범 준수, 도덕성을 평가함',
+           '사회 규범 준수, 도덕적 행동, 사회적 적응 우수, 윤리 의식, 규칙 준수',
+           '규범 무시, 반사회적 행동, 사회 부적응, 윤리 의식 부족, 규칙 위반'),
+    'Sc': ('충동을 억제하고 자신을 통제하는 능력을 측정하는 척도. 자제력, 인내심, 감정 조절을 평가함',
+           '높은 자제력, 감정 조절 우수, 인내심, 신중한 행동, 충동 억제, 계획적 행동',
+           '충동적 행동, 감정 조절 어려움, 인내심 부족, 성급한 판단, 자제력 부족'),
+    'Gi': ('타인에게 좋은 인상을 주려는 경향을 측정하는 척도. 인상 관리, 사회적 바람직성, 외적 이미지를 평가함',
+           '좋은 인상 추구, 사회적 바람직성 높음, 외적 이미지 관리, 예의 바름, 호감형 행동',
+           '인상 관리 무관심, 사회적 바람직성 낮음, 외적 이미지 소홀, 무뚝뚝함, 타인 시선 무관심'),
+    'Cm': ('일반적인 사람들과 유사하게 반응하는 정도를 측정하는 척도. 일반성, 평범성, 사회적 동조를 평가함',
+           '일반적 반응, 사회적 동조, 평범한 취향, 다수 의견 따름, 사회적 적응',
+           '독특한 반응, 비일반적 취향, 다수 의견 거부, 개별적 선택, 사회적 부적응'),
+    'Wb': ('전반적인 삶의 만족감과 행복감을 측정하는 척도. 심리적 안녕, 생활 만족, 긍정성을 평가함',
+           '높은 생활 만족도, 긍정적 마인드, 심리적 안정, 행복감, 낙관적 태도, 스트레스 관리 우수',
+           '생활 불만족, 부정적 마인드, 심리적 불안정, 우울감, 비관적 태도, 스트레스 취약'),
+    'To': ('타인의 신념이나 태도에 대한 관용적 태도를 측정하는 척도. 포용성, 다양성 수용, 열린 마음을 평가함',
+           '높은 포용성, 다양성 수용, 열린 마음, 편견 없음, 차이 인정, 관용적 태도',
+           '편견과 고정관념, 다양성 거부, 닫힌 마음, 배타적 태도, 차이 불인정'),
+    'Ac': ('규칙적이고 체계적인 환경에서 성취를 이루는 경향을 측정하는 척도. 조직 적응, 규칙 준수, 체계적 업무를 평가함',
+           '체계적 업무 수행, 규칙 준수, 조직 적응 우수, 절차 중시, 안정적 성과',
+           '비체계적 업무, 규칙 무시, 조직 부적응, 절차 경시, 불안정한 성과'),
+    'Ai': ('독창적이고 자율적인 환경에서 성취를 이루는 경향을 측정하는 척도. 창의적 성취, 독립적 업무, 혁신 추구를 평가함',
+           '창의적 성취, 독립적 업무 선호, 혁신 추구, 자율적 환경 선호, 독창적 접근',
+           '창의성 부족, 의존적 업무, 혁신 기피, 통제된 환경 선호, 관습적 접근'),
+    'Ie': ('지적 능력을 효율적으로 사용하는 정도를 측정하는 척도. 지적 효율성, 학습 능력, 정보 처리를 평가함',
+           '높은 지적 효율성, 빠른 학습, 정보 처리 우수, 논리적 사고, 문제 해결 능력',
+           '지적 효율성 낮음, 학습 속도 느림, 정보 처리 어려움, 논리적 사고 부족'),
+    'Py': ('자신과 타인의 내면 및 동기에 대한 관심 정도를 측정하는 척도. 심리적 통찰, 내적 동기 이해, 자기 성찰을 평가함',
+           '심리적 통찰력, 내적 동기 이해, 자기 성찰, 타인 심리 파악, 깊이 있는 사고',
+           '심리적 둔감함, 표면적 사고, 자기 성찰 부족, 타인 심리 무관심, 단순한 사고'),
+    'Fx': ('변화에 개방적이고 적응을 잘하는 정도를 측정하는 척도. 유연성, 적응력, 변화 수용을 평가함',
+           '높은 유연성, 변화 적응 우수, 새로운 상황 대처, 다양한 관점 수용, 개방적 태도',
+           '경직된 사고, 변화 저항, 적응 어려움, 고정된 관점, 폐쇄적 태도'),
+    'FM': ('전통적인 성 역할에 부합하는 관심과 태도를 측정하는 척도. 성 역할 인식, 관심사, 행동 패턴을 평가함',
+           '전통적 성 역할 수용, 성별 고정관념 강함, 전형적 관심사, 성 역할 기대 부합',
+           '성 역할 고정관념 약함, 다양한 관심사, 성별 구분 없는 행동, 개방적 성 역할 인식'),
+    'v1': ('외부 세계와 상호작용하는 방식을 측정하는 벡터척도. 외향성-내향성 차원을 평가함',
+           '높은 점수(외향적): 사교적, 활동적, 자극 추구, 타인과의 상호작용 선호, 에너지 넘침',
+           '낮은 점수(내향적): 조용함, 신중함, 혼자 시간 선호, 깊이 있는 관계, 내적 에너지'),
+    'v2': ('규범을 따르는 정도를 측정하는 벡터척도. 규범지향-규범회의 차원을 평가함',
+           '높은 점수(규범지향): 규칙 준수, 전통 존중, 안정 추구, 질서 중시, 보수적 성향',
+           '낮은 점수(규범회의): 규칙 의문시, 변화 추구, 혁신적 사고, 기존 질서 도전, 진보적 성향'),
+    'v3': ('개인의 통합감과 자아실현 수준을 측정하는 벡터척도. 자아 통합, 성숙도, 자아실현을 평가함',
+           '높은 자아 통합, 성숙한 인격, 자아실현 추구, 내적 조화, 삶의 목적 명확, 균형잡힌 성격',
+           '자아 분열, 미성숙함, 자아실현 어려움, 내적 갈등, 삶의 목적 불분명, 불균형한 성격')
+}
+
+# CPI 라이프스타일 유형들
+LIFESTYLE_CHARACTERISTICS = {
+    'Alpha': ('외향적이고 규범을 따르며, 능동적이고 리더십이 강한 실행형. 사교적이면서 책임감이 강하고 목표 지향적임',
+              '리더십 발휘, 사교적 활동, 목표 달성 지향, 책임감 강함, 조직 적응 우수, 실행력 뛰어남',
+              '과도한 통제욕, 융통성 부족, 타인 의견 경시, 스트레스 과다, 완벽주의 경향'),
+    'Beta': ('내향적이고 규범을 따르며, 성실하고 책임감이 강한 협력형. 신중하고 안정적이며 팀워크를 중시함',
+             '높은 성실성, 팀워크 우수, 신뢰성 높음, 안정적 성과, 규칙 준수, 협력적 태도',
+             '소극적 태도, 리더십 부족, 변화 저항, 창의성 부족, 도전 회피'),
+    'Gamma': ('외향적이고 규범에 회의적이며, 혁신적이고 즐거움을 추구하는 혁신형. 창의적이고 자유로우며 변화를 추구함',
+              '높은 창의성, 혁신 추구, 변화 주도, 자유로운 사고, 새로운 시도, 유연한 접근',
+              '규칙 무시, 일관성 부족, 충동적 행동, 책임감 부족, 조직 부적응'),
+    'Delta': ('내향적이고 규범에 회의적이며, 사색적이고 독특한 경향이 있는 사색형. 독립적이고 개별적이며 깊이 있는 사고를 함',
+              '독창적 사고, 깊이 있는 분석, 독립적 판단, 개별성 추구, 내적 동기, 철학적 사고',
+              '사회적 고립, 소통 어려움, 협업 기피, 실용성 부족, 현실 감각 부족')
+}
+
+# MMPI 지표들 (임상적 특성 포함)
+MMPI_DETAILED_DEFINITIONS = {
+    'L': ('자신을 의도적으로 좋게 보이려는 경향을 측정하는 타당도 척도. 사회적 바람직성, 방어적 태도를 평가함',
+          '높은 점수: 과도한 인상 관리, 방어적 태도, 사회적 바람직성 추구, 솔직하지 못함',
+          '낮은 점수: 솔직한 응답, 자연스러운 태도, 인상 관리 적음, 진정성'),
+    'F': ('비전형적이고 특이한 방식으로 응답하는 경향을 측정하는 타당도 척도. 응답 일관성, 집중도를 평가함',
+          '높은 점수: 비전형적 응답, 주의 집중 부족, 혼란스러운 상태, 과장된 증상 호소',
+          '낮은 점수: 일관된 응답, 집중도 양호, 안정된 상태, 현실적 자기 인식'),
+    'K': ('자신을 방어적으로 드러내지 않으려는 태도를 측정하는 타당도 척도. 방어성, 은폐 경향을 평가함',
+          '높은 점수: 강한 방어성, 문제 은폐, 완벽한 이미지 추구, 취약점 숨김',
+          '낮은 점수: 개방적 태도, 솔직한 자기 개방, 취약점 인정, 도움 요청 가능'),
+    'Hs': ('신체적 건강에 대한 과도한 염려와 집착을 측정하는 임상척도. 건강 염려, 신체 증상, 의료 추구를 평가함',
+           '높은 점수: 건강 과도 염려, 신체 증상 호소, 의료진 자주 방문, 업무 집중 어려움',
+           '낮은 점수: 건강 자신감, 신체 증상 적음, 의료 의존도 낮음, 업무 집중 양호'),
+    'D': ('우울감, 비관주의, 무기력감 등 우울 증상을 측정하는 임상척도. 기분 상태, 동기, 에너지 수준을 평가함',
+          '높은 점수: 우울감, 비관적 사고, 무기력감, 동기 저하, 에너지 부족, 절망감, 업무 의욕 저하',
+          '낮은 점수: 긍정적 기분, 낙관적 사고, 활력, 높은 동기, 에너지 충만, 희망적 태도'),
+    'Hy': ('스트레스 상황에서 신체 증상이나 방어기제를 사용하는 경향을 측정하는 임상척도',
+           '높은 점수: 스트레스 시 신체 증상, 방어기제 사용, 감정 억압, 갈등 회피',
+           '낮은 점수: 스트레스 직면, 현실적 대처, 감정 표현 적절, 갈등 해결 시도'),
+    'Pd': ('사회적 규범이나 권위에 대한 반항과 충동성을 측정하는 임상척도. 반사회적 행동, 충동성, 권위 도전을 평가함',
+           '높은 점수: 규칙 위반, 권위 도전, 충동적 행동, 반사회적 태도, 책임감 부족',
+           '낮은 점수: 규칙 준수, 권위 존중, 신중한 행동, 사회적 적응, 책임감'),
+    'Mf': ('전통적인 성 역할 고정관념과의 일치 정도를 측정하는 임상척도',
+           '높은 점수: 전통적 성 역할 거부, 다양한 관심사, 성별 고정관념 약함',
+           '낮은 점수: 전통적 성 역할 수용, 성별 고정관념 강함, 전형적 관심사'),
+    'Pa': ('타인에 대한 의심과 적대감을 측정하는 임상척도. 편집성, 의심, 적대감을 평가함',
+           '높은 점수: 타인 불신, 의심 많음, 적대적 태도, 피해 의식, 경계심 강함',
+           '낮은 점수: 타인 신뢰, 의심 적음, 우호적 태도, 개방적 관계, 협력적'),
+    'Pt': ('불안, 걱정, 강박적 사고를 측정하는 임상척도. 불안 수준, 걱정, 강박성을 평가함',
+           '높은 점수: 높은 불안, 과도한 걱정, 강박적 사고, 완벽주의, 결정 어려움',
+           '낮은 점수: 낮은 불안, 적절한 걱정, 유연한 사고, 현실적 기준, 결정력'),
+    'Sc': ('혼란스러운 사고와 사회적 소외감을 측정하는 임상척도. 사고 혼란, 현실감, 사회적 연결을 평가함',
+           '높은 점수: 사고 혼란, 현실감 부족, 사회적 소외, 이상한 경험, 집중력 부족',
+           '낮은 점수: 명확한 사고, 현실감 양호, 사회적 연결, 일반적 경험, 집중력 양호'),
+    'Ma': ('과잉 활동과 충동성을 측정하는 임상척도. 활동성, 충동성, 기분 변화를 평가함',
+           '높은 점수: 과잉 활동, 충동적 행동, 기분 변화 심함, 성급함, 집중력 부족',
+           '낮은 점수: 적절한 활동, 신중한 행동, 안정된 기분, 인내심, 집중력 양호'),
+    'Si': ('사교 상황에서의 불편감과 내향성을 측정하는 임상척도. 사회적 내향성, 사교 불안을 평가함',
+           '높은 점수: 사교 불안, 대인관계 어려움, 사회적 위축, 혼자 있기 선호, 소극적 참여',
+           '낮은 점수: 사교적, 대인관계 원활, 사회적 자신감, 모임 참여 적극적, 외향적')
+}
+
+# 적성검사 지표들 (직무 연관성 포함)
+APTITUDE_DETAILED_DEFINITIONS = {
+    'verbal_total': ('언어와 관련된 종합적 능력. 어휘력, 문장 이해력, 표현력을 종합 평가하여 언어적 업무 수행 능력을 측정함',
+                    '높은 언어 이해력, 풍부한 어휘력, 명확한 표현력, 문서 작성 우수, 언어적 업무 적합',
+                    '언어 이해력 부족, 제한된 어휘력, 표현력 부족, 문서 작성 어려움, 언어적 업무 부적합'),
+    'verbal_vocab': ('어휘의 의미를 정확히 이해하고 적절히 활용하는 능력. 단어 이해력과 활용도를 측정함',
+                    '풍부한 어휘력, 정확한 단어 선택, 맥락적 이해, 전문 용어 활용, 표현의 다양성',
+                    '제한된 어휘력, 부정확한 단어 사용, 맥락 이해 부족, 전문 용어 어려움, 단조로운 표현'),
+    'numerical_total': ('수량적 정보를 이해하고 논리적으로 사고하는 종합 능력. 수리적 업무 수행 능력을 측정함',
+                       '높은 수리 능력, 논리적 사고, 통계적 이해, 데이터 분석 가능, 수리적 업무 적합',
+                       '수리 능력 부족, 논리적 사고 어려움, 통계 이해 부족, 데이터 분석 어려움, 수리적 업무 부적합'),
+    'situational_judgment': ('조직 상황에서의 적절한 판단력을 측정. 상황 인식, 대안 평가, 최적 선택 능력을 평가함',
+                            '상황 판단 우수, 적절한 대응, 갈등 해결 능력, 조직 적응력, 현실적 판단',
+                            '상황 판단 미흡, 부적절한 대응, 갈등 해결 어려움, 조직 부적응, 비현실적 판단'),
+    'social_knowledge': ('사회 구성원으로서 필요한 기본 상식과 사회적 이해를 측정함',
+                        '풍부한 사회 상식, 시사 이해, 사회 규범 인식, 상식적 판단, 사회적 적응',
+                        '사회 상식 부족, 시사 무관심, 사회 규범 무지, 비상식적 판단, 사회적 부적응'),
+    'interpersonal_skills': ('타인과의 관계 형성과 유지 능력을 측정. 대인관계 기술과 사회적 기술을 평가함',
+                            '원활한 대인관계, 사회적 기술 우수, 갈등 조정 능력, 네트워킹 능력, 팀워크',
+                            '대인관계 어려움, 사회적 기술 부족, 갈등 해결 미흡, 네트워킹 부족, 개인주의')
+}
@@ -0,0 +1,166 @@
+"""
+한글 이름/날짜 생성기 (내장 이름 엔진)
+
+성씨와 성별 이름 목록을 빈도 가중치와 함께 내장하고, numpy 인덱스 샘플링으로 여러 명의 이름을
+한 번에 생성합니다. 외부 패키지(Faker)나 네트워크를 사용하지 않으므로 격리된 환경에서도 바로
+동작하며, 100만 명 이름 생성이 1초 안쪽입니다. 생성기는 테이블 난수 스트림(StageRandom)에서
+시드를 받아 인스턴스별로 독립적인 난수 상태를 가집니다.
+
+날짜는 실행 시각이 아니라 데이터 기준일(CONFIG 의 REFERENCE_DATE)을 기준으로 만들기 때문에 같은
+시드면 언제 실행해도 같은 결과가 나옵니다.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from .config import CONFIG, reference_date
+
+# 성씨와 인구 비율 가중치 (통계청 인구주택총조사 성씨 비율 근사, 단위 0.01%)
+SURNAMES = [
+    ('김', 2150), ('이', 1470), ('박', 840), ('최', 470), ('정', 430), ('강', 230), ('조', 210),
+    ('윤', 210), ('장', 200), ('임', 170), ('한', 150), ('오', 150), ('서', 150), ('신', 150),
+    ('권', 140), ('황', 140), ('안', 140), ('송', 130), ('류', 120), ('전', 110), ('홍', 110),
+    ('고', 90), ('문', 90), ('양', 90), ('손', 90), ('배', 80), ('백', 80), ('허', 60), ('유', 60),
+    ('남', 60), ('심', 50), ('노', 40), ('하', 40), ('곽', 40), ('성', 40), ('차', 40), ('주', 40),
+    ('우', 40), ('구', 40), ('민', 30), ('진', 30), ('나', 30), ('지', 30), ('엄', 30), ('채', 30),
+    ('원', 30), ('천', 20), ('방', 20), ('공', 20), ('현', 20), ('함', 20), ('변', 20), ('염', 20),
+    ('여', 20), ('추', 20), ('도', 20), ('소', 10), ('석', 10), ('선', 10), ('설', 10), ('마', 10),
+    ('길', 10), ('연', 10), ('위', 10), ('표', 10), ('명', 10), ('기', 10), ('반', 10), ('왕', 10),
+    ('금', 10), ('옥', 10), ('육', 10), ('인', 10), ('맹', 10), ('제', 10), ('모', 10), ('탁', 10),
+    ('국', 10), ('어', 10), ('은', 10), ('편', 10), ('용', 10), ('남궁', 4), ('황보', 2), ('제갈', 1),
+    ('선우', 1), ('독고', 1),
+]
+
+# 성별 이름 (1960~2000년대 출생 코호트, 대략 인기 순. 가중치는 순위 기반 Zipf)
+GIVEN_NAMES = {
+    '남': [
+        '민준', '서준', '도윤', '예준', '시우', '주원', '하준', '지호', '준서', '건우', '우진', '현우',
+        '선우', '연우', '유준', '정우', '승우', '승현', '시윤', '준혁', '지훈', '성민', '동현', '민수',
+        '영수', '영호', '성호', '정호', '상철', '상훈', '상현', '상우', '동욱', '동훈', '동민', '재현',
+        '재훈', '재영', '재민', '재호', '준호', '준영', '지원', '현수', '현석', '현준', '민호', '민재',
+        '승민', '승훈', '진우', '진호', '진혁', '태현', '태호', '태민', '종현', '종민', '경호', '경수',
+        '광수', '광호', '병철', '병훈', '기현', '기훈', '도현', '대현', '대호', '용호', '용준', '창민',
+        '창호', '형준', '형석', '희준', '석진', '석현', '인호', '인수', '호준', '원준', '윤호', '윤재',
+        '주현', '주영', '규현', '규민', '철민', '철수', '명수', '상민', '세훈', '세준', '정수', '준기',
+        '우현', '은석', '영민', '영진', '성수', '성진', '성훈', '정훈', '정민', '한결', '시후', '은우',
+    ],
+    '여': [
+        '서연', '서윤', '지우', '서현', '민서', '하은', '하윤', '윤서', '지유', '채원', '지민', '수아',
+        '다은', '예은', '소율', '예린', '지안', '수빈', '시은', '소윤', '지영', '지현', '지은', '지혜',
+        '수진', '수정', '수연', '수현', '혜진', '혜원', '혜영', '혜정', '현정', '현주', '현진', '현아',
+        '민정', '민지', '민경', '미경', '미영', '미숙', '미정', '미란', '은정', '은영', '은주', '은희',
+        '은지', '소영', '소연', '소희', '선영', '선희', '유진', '유리', '유나', '윤정', '윤희', '정은',
+        '정희', '정아', '경희', '경아', '경미', '경숙', '영희', '영미', '영숙', '영주', '미선', '선미',
+        '나연', '나은', '다혜', '예진', '채은', '가은', '가영', '보람', '보영', '아름', '아영', '연주',
+        '연희', '주희', '주연', '진희', '진아', '혜린', '세영', '세진', '효진', '효정', '희정', '희진',
+        '인영', '인혜', '은비', '윤아', '한나', '수민', '지원', '예원', '다인', '서영', '은서', '하린',
+    ],
+}
+GENDERS = list(GIVEN_NAMES)
+
+# 고유 이름 생성 시 재추첨 횟수 (남은 중복은 쓰지 않은 조합에서 비복원 추출)
+UNIQUE_REDRAW_ROUNDS = 8
+
+
+def zipf_weights(n, offset=5):
+    """순위 기반 가중치 (1 / (순위 + offset)), 합 1"""
+    weights = 1.0 / (np.arange(n) + offset)
+    return weights / weights.sum()
+
+
+class KoreanNames:
+    """
+    내장 한글 이름/날짜 생성기
+
+    이름은 (성씨 번호, 이름 번호) 쌍으로 뽑아 코드(성씨 번호 * 이름 수 + 이름 번호)로 다루므로
+    중복 검사와 재추첨이 정수 배열 연산으로 끝납니다.
+    """
+
+    def __init__(self, seed, reference=None):
+        self.reference = reference or reference_date(CONFIG)
+        self.generator = np.random.default_rng(seed)
+        self.surnames = np.array([surname for surname, _ in SURNAMES])
+        weights = np.array([weight for _, weight in SURNAMES], dtype=float)
+        self.surname_p = weights / weights.sum()
+        self.given = {gender: np.array(names) for gender, names in GIVEN_NAMES.items()}
+        self.given_p = {gender: zipf_weights(len(names)) for gender, names in GIVEN_NAMES.items()}
+
+    def capacity(self, gender):
+        """성별 고유 이름 조합 수"""
+        return len(self.surnames) * len(self.given[gender])
+
+    def _draw_codes(self, gender, size):
+        surname = self.generator.choice(len(self.surnames), size=size, p=self.surname_p)
+        given = self.generator.choice(len(self.given[gender]), size=size, p=self.given_p[gender])
+        return surname * len(self.given[gender]) + given
+
+    def _unique_codes(self, gender, size):
+        """size 개의 서로 다른 이름 코드 (가중치 비율 유지, 조합 수를 넘으면 ValueError)"""
+        if size > self.capacity(gender):
+            raise ValueError(f"{gender} 고유 이름 조합 수({self.capacity(gender):,})보다 많은 이름({size:,})을 "
+                             f"요청했습니다")
+        codes = self._draw_codes(gender, size)
+        for _ in range(UNIQUE_REDRAW_ROUNDS):
+            _, first = np.unique(codes, return_index=True)
+            duplicate = np.ones(size, dtype=bool)
+            duplicate[first] = False
+            if not duplicate.any():
+                return codes
+            codes[duplicate] = self._draw_codes(gender, int(duplicate.sum()))
+
+        # 재추첨으로 남은 중복은 아직 쓰지 않은 조합에서 가중치 비율로 비복원 추출
+        _, first = np.unique(codes, return_index=True)
+        duplicate = np.ones(size, dtype=bool)
+        duplicate[first] = False
+        p = np.outer(self.surname_p, self.given_p[gender]).ravel()
+        p[codes[first]] = 0.0
+        codes[duplicate] = self.generator.choice(len(p), size=int(duplicate.sum()), replace=False, p=p / p.sum())
+        return codes
+
+    def names(self, genders, unique=False):
+        """
+        성별 목록('남'/'여') → 이름 배열 (성씨 + 이름, object 배열)
+
+        unique: True 이면 같은 성별 안에서 이름이 겹치지 않음 (남녀 공용 이름은 성별 간 중복 가능)
+        """
+        genders = np.asarray(genders)
+        result = np.empty(len(genders), dtype=object)
+        for gender in GENDERS:
+            mask = genders == gender
+            size = int(mask.sum())
+            if not size:
+                continue
+            codes = self._unique_codes(gender, size) if unique else self._draw_codes(gender, size)
+            surname, given = np.divmod(codes, len(self.given[gender]))
+            result[mask] = np.char.add(self.surnames[surname], self.given[gender][given]).tolist()
+        return result
+
+    def name(self, gender=None):
+        """이름 하나 (gender 가 없으면 성별 무작위)"""
+        gender = gender or GENDERS[int(self.generator.integers(len(GENDERS)))]
+        return str(self.names([gender])[0])
+
+    def birth_dates(self, minimum_ages, maximum_ages):
+        """나이 범위 목록 → 생년월일 배열 (datetime64[D], 출생 연도 = 기준 연도 - 나이)"""
+        low = np.asarray(minimum_ages)
+        high = np.asarray(maximum_ages)
+        years = self.reference.year - self.generator.integers(low, high + 1)
+        months = self.generator.integers(1, 13, size=len(years))
+        days = self.generator.integers(1, 29, size=len(years))
+        month_start = (years - 1970) * 12 + (months - 1)
+        return month_start.astype('datetime64[M]').astype('datetime64[D]') + (days - 1)
+
+    def date_of_birth(self, minimum_age=25, maximum_age=60):
+        return self.birth_dates([minimum_age], [maximum_age])[0].astype(datetime)
+
+    def date_between(self, start_years_ago=10, end_years_ago=0):
+        """기준일 start_years_ago 년 전 ~ end_years_ago 년 전 사이 날짜"""
+        end = self.reference - timedelta(days=end_years_ago * 365)
+        span = (start_years_ago - end_years_ago) * 365
+        return end - timedelta(days=int(self.generator.integers(span + 1)))
+
+
+def name_engine(rng, config=CONFIG):
+    """rng 에서 시드를 받고 config 의 기준일을 쓰는 KoreanNames 인스턴스 반환"""
+    return KoreanNames(rng.seed32(), reference_date(config))
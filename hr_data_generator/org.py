@@ -0,0 +1,313 @@
+"""
+조직 구성 (본부/팀/팀 인원)
+
+기본(fixed) 구성은 3본부 10팀 210명의 고정 조직이며, scaled 구성은 TOTAL_EMPLOYEES 로부터
+본부 수, 팀 수, 팀별 인원을 산출합니다. organization_structure 와 employee_info 는 같은
+구성에서 만들어지므로 규모와 무관하게 서로 일치합니다.
+
+ORG_LEVELS 가 4 이상이면 본부와 팀 사이에 중간 조직(센터/실/그룹/파트) 계층을 넣습니다. 본부마다
+팀 수로부터 위 계층부터 계층별 단위 수를 정하고, 모든 중간 조직의 하위 단위 수가 SPAN_OF_CONTROL
+범위에 들도록 합니다. 팀이 적어 계층을 모두 채울 수 없는 본부는 중간 계층 수를 줄입니다. 배분
+난수는 별도 스트림('org_tree')을 사용하므로 본부/팀 구성은 계층 수와 무관하게 같습니다.
+"""
+
+import math
+import re
+import numpy as np
+
+from .config import CONFIG
+from .rng import stage_random
+
+COMPANY_NAME = '넥스트젠 테크놀로지스'
+
+# 고정 조직 구성 (org_id, org_name, parent_org, division_name, team_size)
+DEPARTMENTS = [
+    ('ORG101', 'HR팀', 'ORG100', '경영지원본부', 12),
+    ('ORG102', '재무팀', 'ORG100', '경영지원본부', 10),
+    ('ORG201', 'AI솔루션개발팀', 'ORG200', '기술본부', 28),
+    ('ORG202', '플랫폼개발팀', 'ORG200', '기술본부', 32),
+    ('ORG203', '데이터분석팀', 'ORG200', '기술본부', 24),
+    ('ORG204', 'IT기획팀', 'ORG200', '기술본부', 20),
+    ('ORG205', 'UI/UX디자인팀', 'ORG200', '기술본부', 16),
+    ('ORG206', 'QA팀', 'ORG200', '기술본부', 18),
+    ('ORG301', '마케팅팀', 'ORG300', '비즈니스본부', 20),
+    ('ORG302', '영업팀', 'ORG300', '비즈니스본부', 26),
+]
+
+# 고정 조직 본부 (employee_id, org_id, org_name, division_name)
+DIVISION_HEADS = [
+    ('DIV001', 'ORG100', '경영지원본부', '경영지원본부'),
+    ('DIV002', 'ORG200', '기술본부', '기술본부'),
+    ('DIV003', 'ORG300', '비즈니스본부', '비즈니스본부'),
+]
+
+FIXED_HEADCOUNT = 1 + len(DIVISION_HEADS) + sum(size for *_, size in DEPARTMENTS)
+
+# scaled 구성: 본부 유형별 팀 이름과 상대 규모 (기술본부가 가장 큼)
+DIVISION_TYPES = {
+    '경영지원본부': (['HR팀', '재무팀', '총무팀', '법무팀', '경영기획팀', '구매팀'], 0.5),
+    '기술본부': (['AI솔루션개발팀', '플랫폼개발팀', '데이터분석팀', 'IT기획팀', 'UI/UX디자인팀', 'QA팀',
+               '인프라팀', '보안팀', '모바일개발팀'], 1.6),
+    '비즈니스본부': (['마케팅팀', '영업팀', '고객성공팀', '제휴팀', '해외사업팀'], 0.9),
+}
+
+
+# 중간 조직 계층 (위에서부터): (org_type, 이름 접미사, 조직장 직급). 계층이 더 많으면 마지막 값을 반복
+# 조직장 직급은 본부장보다 낮음 (master.JOB_TITLES_HIERARCHY)
+UNIT_LEVELS = [
+    ('Center', '센터', '센터장'),
+    ('Department', '실', '부장'),
+    ('Group', '그룹', '부장'),
+    ('Part', '파트', '부장'),
+]
+
+
+def division_type(division_name):
+    """'기술2본부' 처럼 번호가 붙은 본부 이름을 기본 유형('기술본부')으로 변환"""
+    return re.sub(r'\d+본부$', '본부', division_name)
+
+
+def id_width(count):
+    """ID 숫자 자릿수 (최소 3자리, 인원이 늘면 자동 확장)"""
+    return max(3, len(str(count)))
+
+
+def _numbered(name, suffix, number):
+    """'HR팀' + 2 → 'HR2팀' (첫 번째는 번호 없음)"""
+    return name if number == 1 else f'{name[:-len(suffix)]}{number}{suffix}'
+
+
+def use_scaled_layout(config):
+    mode = config['ORG_SCALING']
+    if mode not in ('auto', 'fixed', 'scaled'):
+        raise ValueError(f"ORG_SCALING 은 'auto', 'fixed', 'scaled' 중 하나여야 합니다: {mode}")
+    return mode == 'scaled' or (mode == 'auto' and config['TOTAL_EMPLOYEES'] != FIXED_HEADCOUNT)
+
+
+def _team_sizes(rng, n_teams, headcount, spec):
+    """로그정규분포 팀 인원을 합계가 headcount 가 되도록 정수로 배분"""
+    gen = rng.generator
+    raw = gen.lognormal(math.log(spec['mean']), spec['sigma'], n_teams)
+    raw = np.clip(raw, spec['min'], spec['max'])
+    sizes = np.maximum(np.floor(raw * headcount / raw.sum()).astype(np.int64), 2)
+
+    # 반올림 오차 보정 (무작위 팀에 1명씩 가감)
+    diff = headcount - int(sizes.sum())
+    while diff:
+        step = 1 if diff > 0 else -1
+        candidates = np.arange(n_teams) if step > 0 else np.flatnonzero(sizes > 2)
+        picked = gen.choice(candidates, size=min(abs(diff), len(candidates)), replace=False)
+        sizes[picked] += step
+        diff -= step * len(picked)
+    return sizes.tolist()
+
+
+def _scaled_layout(config):
+    total = config['TOTAL_EMPLOYEES']
+    if total < 50:
+        raise ValueError(f"scaled 조직 구성은 50명 이상이어야 합니다: {total}")
+
+    rng = stage_random(config, 'org_layout')
+    gen = rng.generator
+    spec = config['TEAM_SIZE']
+
+    # 본부 수: 인원의 제곱근에 비례 (210명 → 3개, 1만 명 → 20개, 100만 명 → 200개)
+    n_div = max(3, round(math.sqrt(total) / 5))
+    # 팀장 + 팀원 인원 (대표이사, 본부장 제외)
+    team_headcount = total - 1 - n_div
+    n_teams = max(n_div, round(team_headcount / spec['mean']))
+
+    type_names = list(DIVISION_TYPES)
+    div_types = [type_names[i % len(type_names)] for i in range(n_div)]
+
+    # 본부별 팀 배정: 본부마다 최소 1팀, 나머지는 유형 가중치 x 로그정규 노이즈
+    weights = np.array([DIVISION_TYPES[t][1] for t in div_types]) * gen.lognormal(0, 0.4, n_div)
+    counts = np.ones(n_div, dtype=np.int64) + gen.multinomial(n_teams - n_div, weights / weights.sum())
+    sizes = _team_sizes(rng, n_teams, team_headcount, spec)
+
+    div_width = len(str(n_div))
+    team_width = max(2, len(str(int(counts.max()))))
+    head_width = id_width(n_div)
+
+    divisions = []
+    teams = []
+    type_seen = {}
+    size_iter = iter(sizes)
+    for d, (div_kind, n_team) in enumerate(zip(div_types, counts), start=1):
+        type_seen[div_kind] = type_seen.get(div_kind, 0) + 1
+        div_name = _numbered(div_kind, '본부', type_seen[div_kind])
+        div_org = f'ORG{d:0{div_width}d}{0:0{team_width}d}'
+        divisions.append((f'DIV{d:0{head_width}d}', div_org, div_name, div_name))
+
+        pool = DIVISION_TYPES[div_kind][0]
+        for t in range(int(n_team)):
+            team_name = _numbered(pool[t % len(pool)], '팀', t // len(pool) + 1)
+            teams.append((f'ORG{d:0{div_width}d}{t + 1:0{team_width}d}', team_name, div_org, div_name, next(size_iter)))
+
+    company_org = 'ORG' + '0' * (div_width + team_width)
+    return company_org, divisions, teams
+
+
+def _plan_levels(n_teams, max_depth, span):
+    """
+    본부 하나의 중간 조직 계층별 단위 수 (위 계층부터, 팀 제외)
+
+    팀 수로부터 계층마다 고른 분기 수(n_teams ** (1 / (계층 수 + 1)))를 정해 위에서부터 목표 단위 수를
+    잡고, 아래 계층부터 각 단위의 하위 단위 수가 span 범위에 들도록 조정합니다. 본부 바로 아래 단위가
+    span['min'] 개 이상인 가장 깊은 구성을 쓰고, 팀이 적어 그런 구성이 없으면 계층을 줄입니다
+    (빈 리스트면 팀이 본부 바로 아래). 본부의 하위 단위 수에는 span['max'] 를 적용하지 않습니다.
+    """
+    for depth in range(max_depth, 0, -1):
+        branching = n_teams ** (1 / (depth + 1))
+        counts = [round(branching ** (k + 1)) for k in range(depth)] + [n_teams]
+        for k in range(depth - 1, -1, -1):
+            low = -(-counts[k + 1] // span['max'])
+            high = counts[k + 1] // span['min']
+            if low > high:
+                break
+            counts[k] = min(max(counts[k], low), high)
+        else:
+            if counts[0] >= span['min']:
+                return counts[:-1]
+    return []
+
+
+def _spread(gen, n_items, n_groups, span):
+    """n_items 개를 n_groups 개 단위에 span['min']~span['max'] 개씩 무작위 배분 (합 = n_items)"""
+    sizes = np.full(n_groups, span['min'], dtype=np.int64)
+    slots = np.repeat(np.arange(n_groups), span['max'] - span['min'])
+    picked = gen.choice(len(slots), size=n_items - int(sizes.sum()), replace=False) if len(slots) else []
+    sizes += np.bincount(slots[picked], minlength=n_groups)
+    return sizes.tolist()
+
+
+def check_span(groups, teams, span):
+    """
+    중간 조직의 하위 단위 수가 span['min']~span['max'] 이고, 중간 조직을 둔 본부의 하위 단위 수가
+    span['min'] 이상인지 확인 (벗어나면 ValueError)
+    """
+    children = {}
+    for org_id, _, _, parent_org, *_ in groups:
+        children.setdefault(parent_org, []).append(org_id)
+    for org_id, _, parent_org, *_ in teams:
+        children.setdefault(parent_org, []).append(org_id)
+
+    group_ids = {group[0] for group in groups}
+    for parent_org, units in children.items():
+        n = len(units)
+        if parent_org in group_ids:
+            if not span['min'] <= n <= span['max']:
+                raise ValueError(f"중간 조직 {parent_org} 의 하위 단위 수 {n} 가 SPAN_OF_CONTROL {span} 범위 밖입니다")
+        elif units[0] in group_ids and n < span['min']:
+            raise ValueError(f"본부 {parent_org} 의 하위 단위 수 {n} 가 SPAN_OF_CONTROL 최소값보다 작습니다")
+
+
+def _insert_levels(config, divisions, teams):
+    """
+    본부와 팀 사이의 중간 조직 생성
+
+    반환값: (groups, teams, team_levels) - groups: [(org_id, org_name, org_type, parent_org, division_name, level,
+            조직장 employee_id, 조직장 직급)] (본부별 위 계층부터), teams: parent_org 를 중간 조직으로 바꾼 팀 목록,
+            team_levels: {팀 org_id: level} (팀이 적은 본부는 중간 계층이 적어 팀 level 이 낮음)
+    """
+    levels = config['ORG_LEVELS']
+    if levels < 3:
+        raise ValueError(f"ORG_LEVELS 는 3 이상이어야 합니다: {levels}")
+    if levels == 3:
+        return [], teams, {team[0]: 2 for team in teams}
+    span = config['SPAN_OF_CONTROL']
+    if not 1 <= span['min'] <= span['max']:
+        raise ValueError(f"SPAN_OF_CONTROL 은 1 <= min <= max 여야 합니다: {span}")
+
+    gen = stage_random(config, 'org_tree').generator
+    teams_by_division = {}
+    for team in teams:
+        teams_by_division.setdefault(team[2], []).append(team[0])
+
+    units = []
+    team_parent = {}
+    team_levels = {}
+    for _, div_org, _, div_name in divisions:
+        team_ids = teams_by_division.get(div_org, [])
+        plan = _plan_levels(len(team_ids), levels - 3, span)
+
+        # 위 계층부터 단위 생성 (본부 안에서 계층별 일련번호). parents: 바로 위 계층 (중간 조직은 units 번호)
+        parents = [div_org]
+        for depth, count in enumerate(plan):
+            org_type, suffix, title = UNIT_LEVELS[min(depth, len(UNIT_LEVELS) - 1)]
+            sizes = _spread(gen, count, len(parents), span) if depth else [count]
+            children = []
+            for parent, size in zip(parents, sizes):
+                for _ in range(size):
+                    children.append(len(units))
+                    units.append((f'{div_name} {len(children)}{suffix}', org_type, parent, div_name, depth + 2, title))
+            parents = children
+
+        sizes = _spread(gen, len(team_ids), len(parents), span) if plan else [len(team_ids)]
+        team_iter = iter(team_ids)
+        for parent, size in zip(parents, sizes):
+            for _ in range(size):
+                team_id = next(team_iter)
+                team_parent[team_id] = parent
+                team_levels[team_id] = len(plan) + 2
+
+    width = id_width(len(units))
+    org_ids = [f'GRP{i:0{width}d}' for i in range(1, len(units) + 1)]
+
+    def resolve(parent):
+        return org_ids[parent] if isinstance(parent, int) else parent
+
+    groups = [
+        (org_ids[i], name, org_type, resolve(parent), div_name, level, f'GL{i + 1:0{width}d}', title)
+        for i, (name, org_type, parent, div_name, level, title) in enumerate(units)
+    ]
+    # 중간 조직장 수만큼 큰 팀부터 한 명씩 줄여 전체 인원 유지
+    sizes = [team[4] for team in teams]
+    by_size = sorted(range(len(teams)), key=lambda t: -sizes[t])
+    removed = 0
+    while removed < len(groups) and any(size > 2 for size in sizes):
+        for t in by_size:
+            if removed == len(groups):
+                break
+            if sizes[t] > 2:
+                sizes[t] -= 1
+                removed += 1
+
+    teams = [(org_id, name, resolve(team_parent[org_id]), div_name, size)
+             for (org_id, name, _, div_name, _), size in zip(teams, sizes)]
+    check_span(groups, teams, span)
+    return groups, teams, team_levels
+
+
+def build_org_layout(config=CONFIG):
+    """
+    조직 구성 반환
+
+    반환값: dict
+        company_org: 회사 org_id
+        ceo_id: 대표이사 employee_id
+        divisions: [(본부장 employee_id, org_id, org_name, division_name)]
+        groups: [(org_id, org_name, org_type, parent_org, division_name, level, 조직장 employee_id, 조직장 직급)]
+                (ORG_LEVELS 가 3 이면 빈 리스트, 상위 조직이 먼저 나옴)
+        teams: [(org_id, org_name, parent_org, division_name, team_size, 팀장 employee_id)]
+        team_levels: {팀 org_id: level} (최대 ORG_LEVELS - 1)
+        member_id_width: 일반 직원 ID 자릿수
+    """
+    if use_scaled_layout(config):
+        company_org, divisions, teams = _scaled_layout(config)
+    else:
+        company_org, divisions, teams = 'ORG000', DIVISION_HEADS, DEPARTMENTS
+    groups, teams, team_levels = _insert_levels(config, divisions, teams)
+
+    members = sum(size - 1 for *_, size in teams)
+    member_width = id_width(members)
+    leader_width = id_width(len(teams))
+    return {
+        'company_org': company_org,
+        'ceo_id': 'EMP' + '0' * member_width,
+        'divisions': divisions,
+        'groups': groups,
+        'team_levels': team_levels,
+        'teams': [(*team, f'TL{idx:0{leader_width}d}') for idx, team in enumerate(teams, start=1)],
+        'member_id_width': member_width,
+    }
@@ -0,0 +1,1064 @@
+"""
+C그룹: 프로젝트 및 평가 데이터
+
+프로젝트 이력, 성과 평가, 수시 성과평가, 목표 관리, 퇴사자 인터뷰, 팀 조직문화 서베이,
+포상/징계, 1:1 미팅, 역량 진단, 리더십 360도 평가
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from .columnar import ensure_master
+from .config import CONFIG, reference_date
+from .rng import stage_random
+from .streaming import collect
+from .templates import PhraseBank, phrase_writer
+
+PROJECT_NAMES = [
+    '고객 데이터 분석 플랫폼', 'HR 챗봇 개발', '모바일 앱 리뉴얼',
+    '클라우드 마이그레이션', 'AI 추천 시스템', '레거시 시스템 개선',
+    '보안 강화 프로젝트', '마케팅 자동화', 'CRM 시스템 구축',
+    '데이터 웨어하우스 구축', 'API 게이트웨이 개발', 'MSA 전환',
+    '고객 포털 개발', '내부 업무 시스템', '모니터링 시스템',
+    'BI 대시보드 구축', '챗봇 고도화', '검색 엔진 최적화',
+    '결제 시스템 개선', '인증 시스템 개선'
+]
+
+REVIEW_PERIODS = ['2022 H1', '2022 H2', '2023 H1', '2023 H2', '2024 H1']
+GRADE_DISTRIBUTION = ['S', 'A', 'A', 'A', 'B', 'B', 'B', 'B', 'C', 'C', 'D']
+
+# 수시 평가 유형
+REVIEW_TYPES = ['분기 평가', '프로젝트 종료 평가', '수시 평가', '목표 달성 평가']
+
+GOAL_CATEGORIES = ['업무 성과', '역량 개발', '프로젝트 완수', '프로세스 개선', '협업 강화', '혁신 과제']
+GOAL_TYPES = ['OKR', 'MBO', 'KPI']
+
+EXIT_REASONS_PRIMARY = {
+    '더 나은 기회': ['더 좋은 연봉 제안', '커리어 성장 기회', '원하는 직무로 이직', '더 큰 회사로 이직'],
+    '보상 불만': ['낮은 연봉', '승진 누락', '동종 업계 대비 낮은 처우', '성과 대비 보상 불균형'],
+    '업무 불만': ['과도한 업무량', '업무 내용 불만족', '비효율적인 프로세스', '의미 없는 업무'],
+    '상사/관계': ['상사와의 갈등', '팀 내 갈등', '조직 문화 부적응', '커뮤니케이션 문제'],
+    '성장 정체': ['경력 개발 기회 부족', '교육 기회 제한', '기술 발전 기회 없음', '역량 활용 불가'],
+    '워라밸': ['과도한 야근', '휴가 사용 제한', '유연근무 불가', '번아웃'],
+    '개인 사유': ['학업', '건강', '가족', '창업'],
+}
+
+CULTURE_QUESTIONS = {
+    'q_psychological_safety': '팀 내에서 자유롭게 의견을 표현할 수 있다',
+    'q_trust_in_leadership': '팀 리더를 신뢰한다',
+    'q_collaboration': '팀원 간 협업이 잘 이루어진다',
+    'q_innovation_encouragement': '새로운 아이디어와 시도가 장려된다',
+    'q_work_life_balance': '적절한 업무량과 워라밸이 보장된다',
+    'q_recognition': '성과와 기여가 인정받는다',
+    'q_fairness': '공정한 대우를 받는다'
+}
+
+# 포상 유형
+REWARD_TYPES = {
+    '우수사원상': ('월간 우수사원 선정', 500000),
+    '공로상': ('프로젝트 성공적 완수', 1000000),
+    '혁신상': ('혁신 아이디어 제안 및 실행', 2000000),
+    '팀워크상': ('팀 협업 우수', 300000),
+    '고객만족상': ('고객 만족도 향상 기여', 1500000)
+}
+
+# 징계 유형
+DISCIPLINE_TYPES = {
+    '구두경고': '업무 태만',
+    '서면경고': '무단 지각 반복',
+    '감봉': '업무상 과실',
+    '정직': '중대 규정 위반'
+}
+
+MEETING_TOPICS = [
+    '업무 진행 상황 점검',
+    '성과 목표 검토 및 조정',
+    '커리어 개발 논의',
+    '업무 관련 어려움 및 지원 사항',
+    '최근 프로젝트 피드백',
+    '팀 협업 및 커뮤니케이션',
+    '개인 역량 개발 계획',
+    '업무 만족도 및 고충 상담',
+    '차기 평가 준비',
+    '교육 및 개발 기회 논의'
+]
+
+SKILL_METRICS = ['SKILL_001', 'SKILL_002', 'SKILL_003', 'SKILL_004',
+                 'SKILL_005', 'SKILL_006', 'SKILL_007', 'SKILL_008']
+
+LEADERSHIP_METRICS = ['LEAD_001', 'LEAD_002', 'LEAD_003', 'LEAD_004', 'LEAD_005', 'LEAD_006', 'LEAD_007']
+
+# 프로젝트 PM 정성 피드백
+PM_FEEDBACK = PhraseBank([
+    # 우수 성과 (40%)
+    (
+        "프로젝트 목표 {105~130}% 달성. "
+        "{일정을 앞당겨|품질 기준을 초과하여|예산 대비 효율적으로} 완수했으며, "
+        "{팀원들의 신뢰|이해관계자 만족도|기술적 완성도}가 매우 높음."
+    ),
+    (
+        "{복잡한 기술 이슈|일정 지연 리스크|요구사항 변경}를 "
+        "{창의적으로|신속하게|체계적으로} 해결. "
+        "{프로젝트 성공의 핵심 기여자|팀의 롤모델|기술 리더 역할 수행}."
+    ),
+    (
+        "{탁월한 문제 해결 능력|뛰어난 커뮤니케이션|적극적인 책임감}으로 프로젝트에 기여. "
+        "{향후 리더 역할 기대|지속적 성장 예상|핵심 인재로 평가}됨."
+    ),
+    # 양호 성과 (40%)
+    (
+        "맡은 역할을 성실히 수행. "
+        "{기본 목표 달성|안정적인 업무 처리|주어진 작업 완수}. "
+        "{보다 주도적인 역할 기대|도전적 목표 설정 권장|역량 확장 필요}."
+    ),
+    (
+        "{일정대로|큰 이슈 없이|요구사항에 맞춰} 업무 완수. "
+        "{팀과의 협업 양호|기술적 역량 발휘|책임감 있는 태도}. "
+        "다음 프로젝트에서 {더 큰 역할 기대|리더십 발휘 필요|전문성 심화 요구}."
+    ),
+    (
+        "전반적으로 만족스러운 기여. "
+        "{커뮤니케이션 개선|일정 관리 능력 향상|기술 역량 강화} 시 더 큰 성과 기대."
+    ),
+    # 개선 필요 (20%)
+    (
+        "기본 작업은 완수했으나, "
+        "{일정 준수에 어려움|품질 기준 미달 부분 존재|커뮤니케이션 개선 필요}. "
+        "{추가 교육 권장|멘토링 지원 필요|역량 강화 계획 수립}."
+    ),
+    (
+        "{타 팀과의 협업|요구사항 이해|기술적 난이도 해결}에서 어려움 노출. 개선 방안 논의 필요."
+    ),
+])
+
+# 프로젝트 동료 정성 피드백
+PEER_FEEDBACK = PhraseBank([
+    # 매우 긍정적 (30%)
+    (
+        "{항상 동료를 먼저 생각하고|어려울 때 적극적으로 도와주며|팀 분위기를 밝게 만들고} "
+        "{신뢰할 수 있는|함께 일하기 좋은|배울 점이 많은} 동료. "
+        "{전문성도 뛰어남|커뮤니케이션이 탁월함|문제 해결 능력 우수}."
+    ),
+    (
+        "{기술적으로 뛰어나며|책임감이 강하고|열정적으로 일하며} "
+        "{팀원들에게 지식을 공유|후배들을 잘 가르침|어려운 문제도 함께 고민}해줌. "
+        "{팀의 기둥|핵심 멤버|없어서는 안 될 동료}."
+    ),
+    (
+        "프로젝트 진행 중 {적극적인 소통|빠른 피드백|건설적인 의견 제시|유연한 협업 태도}로 팀워크 향상에 기여. "
+        "{함께 일하고 싶은 동료|신뢰도 높음|팀 성과에 큰 기여}."
+    ),
+    # 긍정적 (50%)
+    (
+        "{협력적이고|성실하며|책임감 있게} 업무를 수행. "
+        "{커뮤니케이션 원활|팀워크 양호|맡은 일 잘 처리}함."
+    ),
+    (
+        "{적극적으로 참여|필요한 지원 제공|협업에 긍정적}. "
+        "{함께 일하기 좋음|동료로서 만족|믿고 맡길 수 있음}."
+    ),
+    (
+        "프로젝트에 {성실히 기여|전문성 발휘|책임감 있게 참여}. "
+        "{특별한 이슈 없음|원활한 협업|안정적인 성과}."
+    ),
+    # 보통/개선 필요 (20%)
+    (
+        "{기본적인 협업은 수행하나|업무는 처리하지만|맡은 역할은 하나} "
+        "{커뮤니케이션이 부족|주도적 참여 아쉬움|적극성 필요}. "
+        "{개선 여지 있음|더 적극적인 참여 기대|소통 개선 필요}."
+    ),
+])
+
+# 반기 성과 평가 등급별 코멘트 (구체적이고 다양하게)
+REVIEW_COMMENTS_BY_GRADE = {
+    'S': PhraseBank([
+        (
+            "반기 목표 {130~160}% 달성으로 탁월한 성과. "
+            "{핵심 프로젝트를 성공으로 이끔|팀 전체 성과 향상에 기여|혁신적 아이디어로 비즈니스 임팩트|기술적 난제 해결로 회사 발전 기여}. "
+            "{승진 적극 추천|핵심인재로 관리|보상 상향 필요|리더 역할 부여 검토}."
+        ),
+        (
+            "{뛰어난 리더십|exceptional한 전문성|탁월한 실행력|창의적 문제 해결}으로 조직에 큰 가치 창출. "
+            "{차세대 리더 육성 대상|경쟁사 스카우트 우려|장기 유지 전략 필요|보상 패키지 재검토}."
+        ),
+        (
+            "기대를 크게 상회하는 성과. "
+            "{고객사로부터 극찬|이해관계자 만족도 최고|프로젝트 수주 기여|회사 평판 제고}. "
+            "회사의 미래를 책임질 핵심 인재."
+        ),
+    ]),
+    'A': PhraseBank([
+        (
+            "반기 목표 {105~120}% 달성. "
+            "{안정적이고 우수한 성과|기대에 부응하는 기여|전문성을 바탕으로 한 성과|팀 목표 달성에 기여}. "
+            "{리더십 기회 제공 검토|전문가 트랙 육성|도전적 과제 부여|승진 후보 검토}."
+        ),
+        (
+            "{기술적 전문성|프로젝트 수행 능력|협업 및 소통 역량|책임감과 실행력} 우수. "
+            "{지속적 성장 기대|핵심 프로젝트 투입|역량 확장 지원|보상 인센티브}."
+        ),
+        (
+            "우수한 성과. "
+            "{전략적 사고|리더십 역량|글로벌 마인드|혁신 역량} 개발 시 S등급 도약 가능. "
+            "{교육 투자 예정|멘토링 프로그램|해외 연수 검토|경력 개발 계획 수립}."
+        ),
+    ]),
+    'B': PhraseBank([
+        (
+            "기본 목표 달성. "
+            "{일부 지연 발생|품질 기준 충족|평균 수준 성과|무난한 업무 처리}. "
+            "{주도성 강화|기술 역량 보완|커뮤니케이션 개선|효율성 제고} 필요."
+        ),
+        (
+            "{안정적이나 도전 부족|맡은 일은 하나 확장성 없음|평범한 수준|기대치 수준}. "
+            "{더 높은 목표 설정 권장|자기주도적 개선|적극성 제고|시야 확대} 필요."
+        ),
+        (
+            "평균적 성과. "
+            "{프로세스 개선 기여도 낮음|혁신 시도 미흡|수동적 업무 태도|성장 정체 우려}. "
+            "{1:1 코칭|교육 기회|멘토 배정|개선 계획} 지원."
+        ),
+    ]),
+    'C': PhraseBank([
+        (
+            "목표 달성률 {60~75}%. "
+            "{역량 부족|태도 문제|우선순위 오류|협업 어려움} 파악. "
+            "{집중 육성|업무 재배치|PIP 수립|멘토링 강화} 시급."
+        ),
+        (
+            "{기대 이하 성과|개선 미흡|반복적 실수|목표 이해 부족}. "
+            "3개월 내 {명확한 개선|구체적 발전|태도 변화|역량 향상} 없으면 "
+            "{재배치 검토|계약 갱신 논의|추가 조치|진로 상담}."
+        ),
+    ]),
+    'D': PhraseBank([
+        (
+            "심각한 수준의 저성과. "
+            "{즉시 개선 조치|역량 재평가|적합성 검토|근본 원인 파악} 필요. "
+            "{PIP 즉시 적용|전문가 코칭|업무 전환|고용 유지 재검토}."
+        ),
+    ]),
+}
+
+# 수시 성과평가 자기평가 문구
+ACHIEVEMENT_DETAILS = PhraseBank([
+        "분기 목표 {95~135}% 달성",
+        "{핵심 KPI|주요 마일스톤|중요 deliverable} {3~8}건 완료",
+        "{신규 고객|매출|생산성|품질 지표} {10~40}% 향상",
+        "{프로젝트|업무 개선안|혁신 과제} 일정 대비 {5~20}일 조기 완료",
+])
+
+SKILL_DEVELOPMENT = PhraseBank([
+        "{Python|AI/ML|클라우드|데이터 분석|프로젝트 관리} 역량을 새롭게 습득",
+        "{사내 교육|외부 컨퍼런스|온라인 강의|실무 프로젝트}를 통해 전문성 강화",
+        "{신기술 도입|프로세스 자동화|업무 효율화|품질 개선} 방안 제안 및 실행",
+        "{기술 블로그 작성|사내 세미나 발표|스터디 그룹 운영|후배 멘토링}으로 지식 공유",
+])
+
+COLLABORATION = PhraseBank([
+        "{타 부서와|유관 팀과|외부 파트너와|크로스 팀으로} {3~10}회 이상 협업 프로젝트 수행",
+        "{커뮤니케이션 개선|정기 미팅 주도|문서화 강화|투명한 정보 공유}로 협업 효율성 증대",
+        "팀 내 {갈등 조정|의견 조율|합의 도출|문제 해결}에 기여",
+        "{신규 입사자|주니어 개발자|타 팀 동료|프로젝트 팀원} {2~5}명 지원",
+])
+
+SELF_COMMENTS = PhraseBank([
+        (
+            "해당 기간 동안 {@achievement_details}하였습니다. "
+            "{@skill_development}하며 전문성을 높였고, {@collaboration}하였습니다."
+        ),
+        (
+            "{@achievement_details}한 것이 주요 성과입니다. "
+            "특히 {어려운 기술 이슈를 독자적으로 해결|이해관계자 기대를 초과 충족|팀 전체 생산성 향상에 기여|프로세스 혁신안 제안 및 적용}한 점이 의미 있었습니다."
+        ),
+        (
+            "{@skill_development}하고, {@achievement_details}하며 기대 이상의 결과를 냈다고 자평합니다. "
+            "{@collaboration}하는 과정도 개인 성장에 도움이 되었습니다."
+        ),
+        (
+            "이번 평가 기간의 핵심 성과는 {@achievement_details}입니다. "
+            "또한 {업무 효율화로 팀 전체 시간 20% 절감|신규 도구 도입으로 품질 향상|고객 만족도 점수 상승에 기여|비용 절감 아이디어 실행}했습니다."
+        ),
+        (
+            "{@collaboration}하며 팀워크를 강화했고, {@achievement_details}하는 성과를 냈습니다. "
+            "향후 {더 큰 책임의 역할|리더 포지션|전문가 트랙|혁신 프로젝트 리딩}에 도전하고 싶습니다."
+        ),
+], banks={
+    'achievement_details': ACHIEVEMENT_DETAILS,
+    'skill_development': SKILL_DEVELOPMENT,
+    'collaboration': COLLABORATION,
+})
+
+# 수시 성과평가 상사평가 등급별 코멘트
+MANAGER_COMMENTS_BY_GRADE = {
+    'S': PhraseBank([
+        (
+            "목표를 {120~150}% 초과 달성하는 탁월한 성과를 보였습니다. "
+            "{기술적 난제를 혁신적으로 해결|팀 성과를 이끄는 핵심 역할 수행|이해관계자들로부터 극찬|회사 전체 성과에 기여}했으며, "
+            "{차세대 리더로 육성 필요|핵심 프로젝트 리더 역할 부여 검토|승진 후보로 추천|보상 상향 조정 필요}."
+        ),
+        (
+            "{탁월한 리더십|뛰어난 기술력|창의적 문제 해결 능력|exceptional한 실행력}으로 프로젝트를 성공으로 이끌었습니다. "
+            "{팀원들의 롤모델|조직의 핵심 자산|반드시 유지해야 할 인재|경쟁사 스카우트 우려}로 평가됩니다."
+        ),
+        (
+            "기대를 훨씬 상회하는 성과입니다. "
+            "{복잡한 프로젝트를 단독으로 이끔|여러 위기 상황을 돌파|팀 전체 생산성 향상에 기여|신규 비즈니스 기회 창출}. "
+            "회사의 미래를 책임질 인재입니다."
+        ),
+    ]),
+    'A': PhraseBank([
+        (
+            "목표 {100~115}% 달성으로 우수한 성과를 보였습니다. "
+            "{기술적 전문성|안정적인 프로젝트 수행|적극적인 협업 태도|높은 업무 이해도}가 돋보였으며, "
+            "{리더십 역량 개발 시 더 큰 성장 기대|다음 단계 역할 준비 필요|전문가로서 입지 확고|지속적 우수 성과 유지}."
+        ),
+        (
+            "{일정 내 품질 기준 충족|이해관계자 기대 부응|팀 목표 달성에 기여|안정적 결과물 산출}하는 우수한 성과. "
+            "{보다 도전적인 과제 부여 검토|역량 확장 기회 제공 예정|차기 프로젝트 핵심 역할 기대|승진 검토 대상}."
+        ),
+        (
+            "전반적으로 만족스러운 성과입니다. "
+            "{커뮤니케이션 역량|기술적 깊이|리더십 발휘|문제 해결 능력}에서 강점을 보였으나, "
+            "{더 큰 그림을 보는 시각|전략적 사고|이니셔티브 발휘|타 팀 협업} 강화 시 S등급 기대."
+        ),
+    ]),
+    'B': PhraseBank([
+        (
+            "기본 목표는 달성했으나 "
+            "{일정이 다소 지연|품질 기준 일부 미달|커뮤니케이션 개선 필요|주도성 부족}한 부분이 있습니다. "
+            "{시간 관리 능력 향상|기술 역량 강화 교육|협업 스킬 개발|적극성 제고} 권장."
+        ),
+        (
+            "{맡은 업무는 수행|주어진 역할 완수|기본 책임 이행}했으나, "
+            "{보다 적극적인 태도|능동적인 문제 해결|창의적인 접근|선제적 대응}이 필요합니다. "
+            "다음 평가에서는 {도전적 목표 설정|자기주도적 개선|역량 향상 노력|성과 제고} 기대."
+        ),
+        (
+            "평균적인 성과입니다. "
+            "{기술적 역량 보완|업무 효율성 개선|커뮤니케이션 강화|시야 확대} 필요. "
+            "{멘토링 지원 예정|교육 기회 제공|1:1 코칭 진행|개선 계획 수립}하겠습니다."
+        ),
+    ]),
+    'C': PhraseBank([
+        (
+            "목표 달성률 {60~80}%로 개선이 필요합니다. "
+            "{기술적 어려움|시간 관리 미흡|우선순위 설정 오류|협업 문제}가 주된 원인으로 파악됩니다. "
+            "{집중 육성 프로그램 배정|멘토 지정 및 지원 강화|업무 범위 재조정|역량 개발 계획 수립} 예정."
+        ),
+        (
+            "{업무 이해도 부족|실행력 미흡|태도 개선 필요|역량 격차}로 인해 기대에 미치지 못했습니다. "
+            "향후 3개월간 {집중 관리|정기 점검|개선 모니터링|1:1 코칭}을 통해 개선 필요."
+        ),
+        (
+            "성과가 기대 수준 이하입니다. "
+            "{즉시 개선 조치|역량 진단 및 교육|업무 재배치 검토|PIP(성과개선계획) 수립} 필요. "
+            "차기 평가에서 명확한 개선 확인 필요."
+        ),
+    ]),
+}
+
+# 퇴사자 인터뷰 정성 의견 (퇴사 사유별로 구체적이고 진솔하게)
+POSITIVE_ASPECTS = PhraseBank([
+    "{훌륭한 동료들|우수한 기술 스택|도전적인 프로젝트|좋은 학습 기회|전문성 개발 환경}",
+    "{체계적인 온보딩|멘토의 헌신적 지원|자유로운 기술 선택|수평적 문화|복리후생}",
+])
+
+NEGATIVE_ASPECTS = PhraseBank([
+    "{primary_reason} 문제가 {지속적으로|반복적으로|구조적으로} 발생",
+    "{secondary_reason}까지 겹치면서 {더 이상 개선 기대 어려움|한계에 도달|지속 근무 불가 판단|커리어 재고}",
+    "{여러 차례 개선 요청했으나 변화 없음|상사와 논의했으나 해결 안 됨|HR과 상담했으나 실질적 조치 없음|기대했던 변화가 일어나지 않음}",
+])
+
+EXIT_FEEDBACK = PhraseBank([
+    (
+        "재직 기간 동안 {@positive_aspects}에는 감사했습니다. 그러나 {@negative_aspects}하여 최종적으로 퇴사를 결정했습니다. "
+        "특히 {primary_reason}은(는) {반드시 개선되어야 할 부분|조직의 지속가능성을 위해 해결 필요|우수 인재 유지를 위해 시급한 과제|후배들을 위해서라도 변화 필요}입니다."
+    ),
+    (
+        "{처음에는 기대가 컸으나|입사 당시 약속과 달리|시간이 지나면서} {primary_reason} 문제가 심화되었습니다. {@positive_aspects}은(는) 좋았지만, {secondary_reason}까지 겹치면서 {더 나은 환경을 찾아|커리어 성장을 위해|건강과 가정을 위해|미래를 위해} 떠나기로 결정했습니다."
+    ),
+    (
+        "솔직히 말하면 {primary_reason}이(가) 결정적 이유입니다. {수차례 개선을 요청했지만 변화 없었고|팀 내 여러 동료가 같은 문제 제기했으나|상황이 점점 악화되면서|더 이상 참기 어려운 수준이 되어} 퇴사를 결심했습니다. {@positive_aspects}은(는) 아쉽지만, {개인 성장|정신 건강|커리어 발전|일과 삶의 균형}을 위해 불가피한 선택이었습니다."
+    ),
+    (
+        "{회사의 비전과 제품에는 공감하나|동료들은 훌륭하지만|기술적 환경은 좋으나|복지는 만족스러우나} {primary_reason}과(와) {secondary_reason} 때문에 {더 이상 성장하기 어렵다|장기적으로 함께하기 힘들다|다른 곳에서 기회를 찾아야겠다|변화가 필요하다}고 판단했습니다. "
+        "{후배들을 위해서라도 이 부분은 개선되길|조직 문화 혁신이 시급하다고|리더십 교육이 필요하다고|인사 정책 재검토가 필요하다고} 생각합니다."
+    ),
+], banks={'positive_aspects': POSITIVE_ASPECTS, 'negative_aspects': NEGATIVE_ASPECTS})
+
+# 팀 조직문화 서베이 정성 의견 (팀 문화 수준별)
+CULTURE_COMMENTS = {
+    'excellent': PhraseBank([
+        (
+            "우리 팀은 {심리적 안전감|상호 신뢰|개방적 소통|협력 문화}이 매우 잘 형성되어 있습니다. "
+            "{실패를 두려워하지 않고 도전|자유롭게 의견을 나누며 혁신|서로 존중하며 성장|함께 문제를 해결}"
+            "하는 분위기가 정착되어 있어 "
+            "{업무 만족도가 높습니다|팀에 대한 자부심이 큽니다|최고의 팀이라 생각합니다|오래 함께하고 싶습니다}."
+        ),
+        (
+            "팀장님이 {팀원의 성장을 진심으로 지원|공정하고 투명하게 의사결정|권한을 적절히 위임하고 신뢰|개개인의 강점을 살려 활용}해주십니다. "
+            "{정기적인 1:1 미팅에서 커리어 고민을 함께 나누고|실패해도 배움의 기회로 삼으며|성과는 공정하게 인정하고|개인 사정도 배려}해주셔서 감사합니다."
+        ),
+        (
+            "팀원 모두가 {서로 돕는 문화|지식 공유|건설적 피드백|긍정적 에너지}를 만들어가고 있습니다. "
+            "{어려운 프로젝트도 함께라면 해낼 수 있다는 믿음|동료들과 함께 성장하는 느낌|이 팀에서 최고의 경험|타 부서 동료들이 부러워하는 팀}입니다."
+        ),
+    ]),
+    'good': PhraseBank([
+        (
+            "팀 분위기는 {대체로 만족스럽습니다|좋은 편입니다|긍정적입니다}. "
+            "{리더의 지원|동료 간 협업|업무 자율성|공정한 평가}은 좋으나, "
+            "{업무량 조절|프로세스 개선|더 나은 소통|혁신 기회} 측면에서 개선 여지가 있습니다."
+        ),
+        (
+            "{팀원들과의 관계|업무 환경|리더십 스타일|협업 문화}에 만족하고 있습니다. "
+            "다만 {과도한 회의|불필요한 보고|의사결정 속도|업무 분배}가 다소 개선되면 더 좋을 것 같습니다."
+        ),
+        (
+            "전반적으로 {함께 일하기 좋은|신뢰할 수 있는|성장할 수 있는|안정적인} 팀입니다. "
+            "{더 많은 도전 기회|명확한 경력 경로|공정한 보상|워라밸 개선}이 보완되면 excellent한 팀이 될 것입니다."
+        ),
+    ]),
+    'average': PhraseBank([
+        (
+            "{팀 내 소통이 원활하지 않을 때가 있습니다|업무 분배가 불균형하다고 느낍니다|의사결정 과정이 불투명합니다|팀 비전이 명확하지 않습니다}. "
+            "{정기 팀 미팅 활성화|역할과 책임 명확화|리더의 적극적 소통|프로세스 개선}이 필요합니다."
+        ),
+        (
+            "{업무량이 과도하여 번아웃 우려|성과 인정이 부족|성장 기회가 제한적|불공정한 평가}됩니다. "
+            "팀 문화 개선을 위한 {리더십 변화|HR 개입|팀 워크샵|솔직한 대화의 장}이 필요해 보입니다."
+        ),
+        (
+            "팀 분위기가 {예전만 못합니다|점점 악화되는 느낌|개선이 시급합니다|침체되어 있습니다}. "
+            "{핵심 인재 이탈|업무 동기 저하|팀 내 갈등|리더 신뢰 문제}로 인해 "
+            "{조직 개편 필요|리더십 교체 검토|문화 혁신 시급|구성원 의견 청취} 상황입니다."
+        ),
+    ]),
+    'poor': PhraseBank([
+        (
+            "팀 문화가 심각한 수준입니다. "
+            "{리더가 일방적으로 지시만 하고 피드백 무시|팀원 간 경쟁만 부추기고 협업 없음|야근이 강요되며 휴가 사용 눈치|불공정한 평가와 편애}가 만연합니다. "
+            "{이직 준비 중|더 이상 견디기 어려움|HR 면담 요청 예정|조직 개편 없으면 퇴사 고려}."
+        ),
+        (
+            "{심리적 안전감 전무|의견 제시하면 무시당함|실수하면 공개적으로 질책|성과는 리더 공, 실패는 팀원 책임}합니다. "
+            "이런 환경에서는 {성장 불가능|창의성 발휘 어려움|장기 근무 의사 없음|팀 애정 사라짐}. 근본적 변화 필요."
+        ),
+        (
+            "팀장의 {구시대적 관리 방식|소통 부재|편파적 태도|역량 부족}으로 팀 전체가 "
+            "{번아웃|좌절|불신|분열} 상태입니다. "
+            "{다수 팀원이 이직 준비|팀 재편 논의 중|본부장 면담 요청|집단 민원 검토}. 시급한 조치 필요."
+        ),
+        (
+            "과도한 {업무량|야근|주말 근무|불필요한 회의}과 "
+            "{성과 무시|보상 불공정|경력 개발 기회 차단|소통 단절}로 "
+            "{팀 사기 최저|우수 인재 대거 이탈|프로젝트 실패 반복|조직 신뢰 붕괴} 상황. 즉각적인 개입 요청합니다."
+        ),
+    ]),
+}
+
+
+def build_project_history(employees, master=None, config=CONFIG):
+    """8. project_history - 프로젝트 이력"""
+    rng = stage_random(config, 'project_history')
+    master = ensure_master(employees, master)
+    comment = phrase_writer(rng, config['COMMENT_ENCODING'])
+    project_data = []
+    project_counter = 1
+
+    # 재직 중인 직원 (프로젝트 배정 대상)
+    active_employees = [employees[i] for i in master.rows(master['active'])]
+
+    # 조직 규모에 비례해 연간 프로젝트 수 확대 (기본 210명 기준 8-15개)
+    scale = max(1, round(len(employees) / 210))
+
+    # 다양한 프로젝트 생성 (2020-2024)
+    projects_list = []
+    for year in range(2020, 2025):
+        num_projects = rng.randint(8, 15) * scale
+        width = max(2, len(str(num_projects)))
+        for i in range(num_projects):
+            project_id = f'PRJ_{year}_{i+1:0{width}d}'
+            project_name = rng.choice(PROJECT_NAMES)
+            start_month = rng.randint(1, 10)
+            duration_months = rng.randint(3, 12)
+            start_date = f'{year}-{start_month:02d}-{rng.randint(1, 28):02d}'
+            end_date = (datetime.strptime(start_date, '%Y-%m-%d') + timedelta(days=duration_months*30)).strftime('%Y-%m-%d')
+
+            projects_list.append((project_id, project_name, start_date, end_date))
+
+    # 각 프로젝트에 직원 배정
+    for proj_id, proj_name, start_date, end_date in projects_list:
+        # 프로젝트 규모 (3-10명)
+        team_size = rng.randint(3, 10)
+
+        # 재직 중인 직원 중 랜덤 선택
+        selected_team = rng.sample(active_employees, min(team_size, len(active_employees)))
+
+        roles = ['PL', '개발자', '개발자', 'QA', '기획자', '디자이너', 'PM', '아키텍트']
+
+        for idx, emp in enumerate(selected_team):
+            role = roles[idx % len(roles)]
+
+            project_data.append({
+                'project_member_id': f'PM{project_counter:04d}',
+                'employee_id': emp['employee_id'],
+                'project_id': proj_id,
+                'project_name': proj_name,
+                'role': role,
+                'pm_qualitative_feedback': comment(PM_FEEDBACK),
+                'peer_qualitative_feedback': comment(PEER_FEEDBACK),
+                'start_date': start_date,
+                'end_date': end_date,
+            })
+            project_counter += 1
+
+    return project_data
+
+
+def build_performance_review(employees, master=None, config=CONFIG):
+    """9. performance_review - 성과 평가"""
+    rng = stage_random(config, 'performance_review')
+    master = ensure_master(employees, master)
+    hire_dates = master.hire_datetimes()
+    comment = phrase_writer(rng, config['COMMENT_ENCODING'])
+    performance_data = []
+    review_counter = 1
+
+    for i in master.rows(master['active']):
+        emp = employees[i]
+        hire_date = hire_dates[i]
+
+        for period in REVIEW_PERIODS:
+            year = int(period.split()[0])
+            half = period.split()[1]
+
+            if year < hire_date.year:
+                continue
+            if year == hire_date.year and half == 'H1' and hire_date.month > 6:
+                continue
+
+            # 성과 등급 (정규분포 기반)
+            grade = rng.choice(GRADE_DISTRIBUTION)
+
+            performance_data.append({
+                'review_id': f'REV{review_counter:04d}',
+                'employee_id': emp['employee_id'],
+                'review_period': period,
+                'final_grade': grade,
+                'manager_comment_development': comment(REVIEW_COMMENTS_BY_GRADE[grade])
+            })
+            review_counter += 1
+
+    return performance_data
+
+
+def iter_continuous_performance_review(employees, master=None, config=CONFIG):
+    """9-1. continuous_performance_review - 수시 성과평가 (자기평가 + 상사평가)"""
+    rng = stage_random(config, 'continuous_performance_review')
+    reference = reference_date(config)
+    master = ensure_master(employees, master)
+    hire_dates = master.hire_datetimes()
+    comment = phrase_writer(rng, config['COMMENT_ENCODING'])
+    continuous_review_counter = 1
+
+    for i in master.rows(master['active']):
+        emp = employees[i]
+        hire_date = hire_dates[i]
+
+        # 2022-2024년 동안 직원당 5-15회의 수시 평가
+        years_of_service = min(reference.year - hire_date.year, 3)
+        num_reviews = rng.randint(3, 5) * years_of_service
+
+        for _ in range(num_reviews):
+            # 평가 대상 기간 (1-4개월)
+            period_length = rng.randint(30, 120)
+            period_end_date = hire_date + timedelta(days=rng.randint(30, 1095))
+
+            if period_end_date > reference:
+                continue
+
+            period_start_date = period_end_date - timedelta(days=period_length)
+
+            # 자기평가 작성일 (평가 대상 기간 종료 후 1-7일)
+            self_eval_date = period_end_date + timedelta(days=rng.randint(1, 7))
+            self_eval_timestamp = self_eval_date + timedelta(
+                hours=rng.randint(9, 18),
+                minutes=rng.randint(0, 59)
+            )
+
+            # 상사평가 작성일 (자기평가 후 2-10일)
+            manager_eval_date = self_eval_date + timedelta(days=rng.randint(2, 10))
+            manager_eval_timestamp = manager_eval_date + timedelta(
+                hours=rng.randint(9, 18),
+                minutes=rng.randint(0, 59)
+            )
+
+            # 자기평가 등급 (일반적으로 높게 평가)
+            self_rating_options = ['S', 'S', 'A', 'A', 'A', 'B', 'B']
+            self_rating = rng.choice(self_rating_options)
+
+            # 상사평가 등급 (자기평가보다 보수적)
+            manager_rating_map = {
+                'S': rng.choice(['S', 'A', 'A', 'A']),
+                'A': rng.choice(['A', 'A', 'B', 'B']),
+                'B': rng.choice(['B', 'B', 'C']),
+                'C': rng.choice(['B', 'C', 'C']),
+            }
+            manager_rating = manager_rating_map.get(self_rating, 'B')
+
+            yield {
+                'review_id': f"CR{continuous_review_counter:05d}",
+                'employee_id': emp['employee_id'],
+                'review_type': rng.choice(REVIEW_TYPES),
+                'evaluation_period_start': period_start_date.strftime('%Y-%m-%d'),
+                'evaluation_period_end': period_end_date.strftime('%Y-%m-%d'),
+                'self_evaluation_timestamp': self_eval_timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+                'self_rating': self_rating,
+                'self_comment': comment(SELF_COMMENTS),
+                'manager_evaluation_timestamp': manager_eval_timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+                'manager_rating': manager_rating,
+                'manager_comment': comment(MANAGER_COMMENTS_BY_GRADE.get(manager_rating, MANAGER_COMMENTS_BY_GRADE['B'])),
+                'rating_gap': 1 if self_rating != manager_rating else 0,
+                'evaluation_status': '완료'
+            }
+            continuous_review_counter += 1
+
+
+build_continuous_performance_review = collect(iter_continuous_performance_review)
+
+
+def iter_goal_management(employees, master=None, config=CONFIG):
+    """9-2. goal_management - 목표 관리 (OKR/MBO)"""
+    rng = stage_random(config, 'goal_management')
+    reference = reference_date(config)
+    master = ensure_master(employees, master)
+    hire_dates = master.hire_datetimes()
+    goal_counter = 1
+
+    for i in master.rows(master['active']):
+        emp = employees[i]
+        hire_date = hire_dates[i]
+
+        # 2022-2024년 각 분기별 목표 설정
+        for year in range(max(2022, hire_date.year), 2025):
+            for quarter in ['Q1', 'Q2', 'Q3', 'Q4']:
+                quarter_start_month = {'Q1': 1, 'Q2': 4, 'Q3': 7, 'Q4': 10}[quarter]
+                goal_set_date = datetime(year, quarter_start_month, rng.randint(1, 7))
+
+                if goal_set_date < hire_date or goal_set_date > reference:
+                    continue
+
+                # 분기당 2-4개 목표
+                num_goals = rng.randint(2, 4)
+
+                for _ in range(num_goals):
+                    category = rng.choice(GOAL_CATEGORIES)
+                    goal_type = rng.choice(GOAL_TYPES)
+
+                    # 목표 진행률 (분기가 지났으면 완료, 현재 분기면 진행중)
+                    if year < reference.year or (year == reference.year and quarter_start_month < reference.month):
+                        progress = rng.randint(70, 100)
+                        status = '완료' if progress >= 80 else '부분 달성'
+                    else:
+                        progress = rng.randint(30, 80)
+                        status = '진행중'
+
+                    # 목표 설명 생성
+                    goal_descriptions = {
+                        '업무 성과': [
+                            f"{rng.choice(['매출', '생산성', '품질', '고객 만족도'])} {rng.randint(10, 30)}% 향상",
+                            f"핵심 업무 지표 목표치 {rng.randint(90, 120)}% 달성",
+                        ],
+                        '역량 개발': [
+                            f"{rng.choice(['Python', 'AI/ML', '리더십', '데이터 분석'])} 역량 강화 교육 이수",
+                            "신규 기술 스택 학습 및 프로젝트 적용",
+                        ],
+                        '프로젝트 완수': [
+                            f"{rng.choice(['개발', '개선', '구축'])} 프로젝트 일정 내 완수",
+                            f"프로젝트 목표 품질 기준 {rng.randint(90, 100)}% 달성",
+                        ],
+                        '프로세스 개선': [
+                            f"업무 프로세스 효율성 {rng.randint(15, 40)}% 개선",
+                            f"반복 업무 자동화로 시간 {rng.randint(20, 50)}% 절감",
+                        ],
+                        '협업 강화': [
+                            f"크로스 팀 협업 프로젝트 {rng.randint(2, 5)}건 이상 참여",
+                            "지식 공유 세션 주도 및 팀 역량 향상 기여",
+                        ],
+                        '혁신 과제': [
+                            f"신규 아이디어 제안 및 실행 {rng.randint(1, 3)}건",
+                            "혁신 활동을 통한 비용 절감 또는 수익 창출",
+                        ]
+                    }
+
+                    yield {
+                        'goal_id': f'GOAL{goal_counter:05d}',
+                        'employee_id': emp['employee_id'],
+                        'goal_type': goal_type,
+                        'goal_category': category,
+                        'goal_description': rng.choice(goal_descriptions[category]),
+                        'target_period': f"{year} {quarter}",
+                        'set_date': goal_set_date.strftime('%Y-%m-%d'),
+                        'target_completion_date': (goal_set_date + timedelta(days=90)).strftime('%Y-%m-%d'),
+                        'progress_percentage': progress,
+                        'status': status,
+                        'final_achievement_rate': progress if status == '완료' else None,
+                        'manager_id': emp['manager_id'],
+                    }
+                    goal_counter += 1
+
+
+build_goal_management = collect(iter_goal_management)
+
+
+def iter_exit_interview(employees, master=None, config=CONFIG):
+    """9-3. exit_interview - 퇴사자 인터뷰"""
+    rng = stage_random(config, 'exit_interview')
+    reference = reference_date(config)
+    master = ensure_master(employees, master)
+    hire_dates = master.hire_datetimes()
+    comment = phrase_writer(rng, config['COMMENT_ENCODING'])
+    exit_counter = 1
+
+    for i in master.rows(master.mask('status', '퇴사')):
+        emp = employees[i]
+        hire_date = hire_dates[i]
+        # 퇴사일 설정 (입사 후 6개월 ~ 8년)
+        exit_date = hire_date + timedelta(days=rng.randint(180, 2920))
+        if exit_date > reference:
+            exit_date = reference - timedelta(days=rng.randint(30, 365))
+
+        # 인터뷰 일자 (퇴사일 1-7일 전)
+        interview_date = exit_date - timedelta(days=rng.randint(1, 7))
+
+        # 주 퇴사 사유 선택
+        primary_category = rng.choice(list(EXIT_REASONS_PRIMARY.keys()))
+        primary_reason = rng.choice(EXIT_REASONS_PRIMARY[primary_category])
+
+        # 부차적 사유
+        secondary_categories = [k for k in EXIT_REASONS_PRIMARY.keys() if k != primary_category]
+        secondary_reason = rng.choice(EXIT_REASONS_PRIMARY[rng.choice(secondary_categories)])
+
+        # 회사 추천 의향 (퇴사 사유에 따라)
+        if primary_category in ['개인 사유', '더 나은 기회']:
+            recommend_score = round(rng.uniform(3.5, 5.0), 1)
+        elif primary_category in ['보상 불만', '성장 정체']:
+            recommend_score = round(rng.uniform(2.5, 4.0), 1)
+        else:  # 상사/관계, 업무 불만, 워라밸
+            recommend_score = round(rng.uniform(1.5, 3.5), 1)
+
+        # 개선 제안
+        improvement_suggestions = {
+            '더 나은 기회': '경력 개발 경로 명확화, 내부 이동 기회 확대',
+            '보상 불만': '시장 경쟁력 있는 보상 체계 수립, 투명한 보상 정책',
+            '업무 불만': '업무 프로세스 개선, 불필요한 업무 제거',
+            '상사/관계': '리더십 교육 강화, 조직 문화 개선, 갈등 해결 메커니즘 구축',
+            '성장 정체': '교육 예산 확대, 외부 컨퍼런스 참여 지원, 사내 스터디 활성화',
+            '워라밸': '유연근무제 확대, 불필요한 야근 문화 개선, 휴가 사용 장려',
+            '개인 사유': '해당 없음'
+        }
+
+        yield {
+            'exit_interview_id': f'EXIT{exit_counter:04d}',
+            'employee_id': emp['employee_id'],
+            'interview_date': interview_date.strftime('%Y-%m-%d'),
+            'exit_date': exit_date.strftime('%Y-%m-%d'),
+            'tenure_years': round((exit_date - hire_date).days / 365.25, 1),
+            'primary_reason_category': primary_category,
+            'primary_reason_detail': primary_reason,
+            'secondary_reason': secondary_reason,
+            'would_recommend_company': recommend_score,
+            'overall_satisfaction': round(rng.uniform(2.0, 4.5), 1),
+            'qualitative_feedback': comment(EXIT_FEEDBACK, primary_reason=primary_reason, secondary_reason=secondary_reason),
+            'improvement_suggestion': improvement_suggestions[primary_category],
+            'rehire_eligible': rng.choice(['Yes', 'Yes', 'Yes', 'No']),
+        }
+        exit_counter += 1
+
+
+build_exit_interview = collect(iter_exit_interview)
+
+
+def iter_team_culture_survey(employees, organization_structure, master=None, config=CONFIG):
+    """9-4. team_culture_survey - 팀별 조직문화 서베이 (정성+정량)"""
+    rng = stage_random(config, 'team_culture_survey')
+    master = ensure_master(employees, master)
+    hire_years = master['hire_year'].tolist()
+    comment = phrase_writer(rng, config['COMMENT_ENCODING'])
+    culture_counter = 1
+
+    # 팀별 특성 부여 (일부 팀은 문제가 있고, 일부는 좋음)
+    team_characteristics = {}
+    teams = [org for org in organization_structure if org['org_type'] == 'Team']
+    for team in teams:
+        # 랜덤하게 팀 문화 수준 결정
+        culture_level = rng.choice(['excellent', 'good', 'good', 'average', 'average', 'poor'])
+        team_characteristics[team['org_id']] = culture_level
+
+    for i in master.rows(master['active']):
+        emp = employees[i]
+        for year in [2023, 2024]:
+            if year < hire_years[i]:
+                continue
+
+            survey_date = datetime(year, rng.randint(10, 11), rng.randint(1, 28))
+
+            # 팀 특성에 따른 점수 조정
+            team_culture = team_characteristics.get(emp['org_id'], 'average')
+
+            if team_culture == 'excellent':
+                base_score = 4.5
+                std_dev = 0.3
+            elif team_culture == 'good':
+                base_score = 4.0
+                std_dev = 0.4
+            elif team_culture == 'average':
+                base_score = 3.5
+                std_dev = 0.5
+            else:  # poor
+                base_score = 2.5
+                std_dev = 0.6
+
+            scores = {}
+            for q_code in CULTURE_QUESTIONS.keys():
+                scores[q_code] = round(np.clip(rng.normal(base_score, std_dev), 1.0, 5.0), 1)
+
+            yield {
+                'survey_id': f'TCULTURE{culture_counter:05d}',
+                'employee_id': emp['employee_id'],
+                'org_id': emp['org_id'],
+                'org_name': emp['org_name'],
+                'division_name': emp['division_name'],
+                'survey_year': year,
+                'survey_date': survey_date.strftime('%Y-%m-%d'),
+                **scores,
+                'overall_team_satisfaction': round(np.mean(list(scores.values())), 1),
+                'qualitative_comment': comment(CULTURE_COMMENTS[team_culture]),
+                'would_recommend_team': round(np.clip(rng.normal(base_score, std_dev), 1.0, 5.0), 1),
+            }
+            culture_counter += 1
+
+
+build_team_culture_survey = collect(iter_team_culture_survey)
+
+
+def build_rewards_and_discipline(employees, master=None, config=CONFIG):
+    """9-5. rewards_and_discipline - 포상 및 징계 이력"""
+    rng = stage_random(config, 'rewards_and_discipline')
+    reference = reference_date(config)
+    master = ensure_master(employees, master)
+    hire_dates = master.hire_datetimes()
+    rewards_discipline_data = []
+    rd_counter = 1
+
+    for i in master.rows(master['active']):
+        emp = employees[i]
+        hire_date = hire_dates[i]
+        years_of_service = reference.year - hire_date.year
+
+        # 근속 1년 미만은 포상 대상에서 제외
+        if years_of_service < 1:
+            continue
+
+        # 포상: 우수 직원은 여러 번, 일반 직원은 가끔
+        num_rewards = rng.choices([0, 0, 0, 1, 1, 2, 3], weights=[40, 20, 10, 15, 10, 3, 2])[0]
+
+        for _ in range(num_rewards):
+            max_days = years_of_service * 365
+            if max_days <= 180:
+                continue
+            reward_date = hire_date + timedelta(days=rng.randint(180, max_days))
+            if reward_date > reference:
+                continue
+
+            reward_type, (reason, amount) = rng.choice(list(REWARD_TYPES.items()))
+
+            rewards_discipline_data.append({
+                'record_id': f'RD{rd_counter:05d}',
+                'employee_id': emp['employee_id'],
+                'record_type': '포상',
+                'category': reward_type,
+                'reason': reason,
+                'action_date': reward_date.strftime('%Y-%m-%d'),
+                'monetary_amount': amount,
+                'issued_by': emp['manager_id'],
+                'description': f'{reward_type} 수상: {reason}',
+                'impact_on_record': 'Positive'
+            })
+            rd_counter += 1
+
+        # 징계: 소수의 직원만 (5%), 근속 1년 이상
+        if rng.random() < 0.05 and years_of_service >= 1:
+            max_days = years_of_service * 365
+            if max_days > 180:
+                discipline_date = hire_date + timedelta(days=rng.randint(180, max_days))
+            else:
+                continue
+            if discipline_date <= reference:
+                discipline_type, reason = rng.choice(list(DISCIPLINE_TYPES.items()))
+
+                rewards_discipline_data.append({
+                    'record_id': f'RD{rd_counter:05d}',
+                    'employee_id': emp['employee_id'],
+                    'record_type': '징계',
+                    'category': discipline_type,
+                    'reason': reason,
+                    'action_date': discipline_date.strftime('%Y-%m-%d'),
+                    'monetary_amount': -500000 if discipline_type == '감봉' else 0,
+                    'issued_by': emp['manager_id'],
+                    'description': f'{discipline_type} 조치: {reason}',
+                    'impact_on_record': 'Negative'
+                })
+                rd_counter += 1
+
+    return rewards_discipline_data
+
+
+def iter_one_on_one_meetings(employees, master=None, config=CONFIG):
+    """9-6. one_on_one_meetings - 1:1 미팅 기록"""
+    rng = stage_random(config, 'one_on_one_meetings')
+    reference = reference_date(config)
+    master = ensure_master(employees, master)
+    hire_dates = master.hire_datetimes()
+    meeting_counter = 1
+
+    for i in master.rows(master['active'] & master['has_manager']):
+        emp = employees[i]
+        hire_date = hire_dates[i]
+
+        # 2023년부터 월 1회 1:1 미팅
+        start_date = max(datetime(2023, 1, 1), hire_date)
+        current_date = start_date
+
+        while current_date <= reference:
+            # 월 1회 (매월 랜덤한 날짜)
+            meeting_date = current_date + timedelta(days=rng.randint(0, 28))
+
+            if meeting_date > reference:
+                break
+
+            # 미팅 시간 (업무 시간 내)
+            meeting_datetime = meeting_date + timedelta(
+                hours=rng.randint(10, 16),
+                minutes=rng.choice([0, 30])
+            )
+
+            # 미팅 시간 (30분 ~ 1시간)
+            duration = rng.choice([30, 45, 60])
+
+            # 주요 논의 사항 (2-3개)
+            num_topics = rng.randint(2, 3)
+            selected_topics = rng.sample(MEETING_TOPICS, num_topics)
+
+            # 액션 아이템
+            action_items = [
+                f'{rng.choice(["교육 신청", "목표 수정", "프로젝트 배정", "역량 개발 계획 수립", "피드백 반영"])}',
+                f'{rng.choice(["다음 주까지", "이번 달 내", "다음 분기까지"])} {rng.choice(["완료", "검토", "실행"])}',
+            ]
+
+            yield {
+                'meeting_id': f'MTG{meeting_counter:06d}',
+                'employee_id': emp['employee_id'],
+                'manager_id': emp['manager_id'],
+                'meeting_datetime': meeting_datetime.strftime('%Y-%m-%d %H:%M:%S'),
+                'duration_minutes': duration,
+                'discussion_topics': ' | '.join(selected_topics),
+                'action_items': ' | '.join(rng.sample(action_items, rng.randint(1, 2))),
+                'next_meeting_scheduled': (meeting_datetime + timedelta(days=rng.randint(25, 35))).strftime('%Y-%m-%d'),
+                'employee_satisfaction_score': round(rng.uniform(3.5, 5.0), 1),
+                'meeting_status': '완료'
+            }
+            meeting_counter += 1
+
+            # 다음 달로
+            current_date = current_date + timedelta(days=30)
+
+
+build_one_on_one_meetings = collect(iter_one_on_one_meetings)
+
+
+def build_skill_assessment(employees, master=None, config=CONFIG):
+    """10. skill_assessment - 역량 진단"""
+    rng = stage_random(config, 'skill_assessment')
+    master = ensure_master(employees, master)
+    skill_assessment_data = []
+    assess_counter = 1
+
+    assessment_date = '2023-11-10'
+
+    for i in master.rows(master['active']):
+        emp = employees[i]
+        for metric_code in SKILL_METRICS:
+            # 정규분포 기반 점수 (3.5 평균, 표준편차 0.6)
+            self_rating = round(np.clip(rng.normal(3.7, 0.5), 1.0, 5.0), 1)
+            manager_rating = round(np.clip(rng.normal(3.5, 0.6), 1.0, 5.0), 1)
+            peer_rating = round(np.clip(rng.normal(3.6, 0.5), 1.0, 5.0), 1)
+
+            skill_assessment_data.append({
+                'assessment_id': f'SA{assess_counter:04d}',
+                'employee_id': emp['employee_id'],
+                'assessment_date': assessment_date,
+                'metric_code': metric_code,
+                'self_rating': self_rating,
+                'manager_rating': manager_rating,
+                'peer_rating_avg': peer_rating
+            })
+            assess_counter += 1
+
+    return skill_assessment_data
+
+
+def build_leadership_360_review(employees, master=None, config=CONFIG):
+    """11. leadership_360_review - 리더십 360도 평가"""
+    rng = stage_random(config, 'leadership_360_review')
+    master = ensure_master(employees, master)
+    leadership_data = []
+    lead_counter = 1
+
+    leaders = [employees[i] for i in master.rows(master['leader'])]
+
+    for leader in leaders:
+        for review_year in [2022, 2023, 2024]:
+            for metric_code in LEADERSHIP_METRICS:
+                # 리더십 점수 (정규분포, 3.5 평균)
+                boss_score = round(np.clip(rng.normal(3.7, 0.5), 2.0, 5.0), 1)
+                direct_report_score = round(np.clip(rng.normal(3.5, 0.6), 1.5, 5.0), 1)
+                peer_score = round(np.clip(rng.normal(3.6, 0.5), 2.0, 5.0), 1)
+
+                # Boss 평가
+                leadership_data.append({
+                    'review_id': f'L360_{lead_counter:04d}',
+                    'leader_employee_id': leader['employee_id'],
+                    'review_year': review_year,
+                    'rater_relationship': 'Boss',
+                    'metric_code': metric_code,
+                    'score': boss_score
+                })
+                lead_counter += 1
+
+                # Direct Report 평가
+                leadership_data.append({
+                    'review_id': f'L360_{lead_counter:04d}',
+                    'leader_employee_id': leader['employee_id'],
+                    'review_year': review_year,
+                    'rater_relationship': 'Direct Report',
+                    'metric_code': metric_code,
+                    'score': direct_report_score
+                })
+                lead_counter += 1
+
+                # Peer 평가
+                leadership_data.append({
+                    'review_id': f'L360_{lead_counter:04d}',
+                    'leader_employee_id': leader['employee_id'],
+                    'review_year': review_year,
+                    'rater_relationship': 'Peer',
+                    'metric_code': metric_code,
+                    'score': peer_score
+                })
+                lead_counter += 1
+
+    return leadership_data
@@ -0,0 +1,717 @@
+"""
+테이블 생성 파이프라인
+
+각 테이블의 생성 함수와 의존 관계(상위 테이블)를 등록해 두고, 요청된 테이블과 그
+상위 테이블만 순서대로 생성합니다. workers 를 지정하면 의존 관계 DAG 에 따라 독립적인
+테이블을 프로세스 풀에서 동시에 생성합니다.
+"""
+
+import contextlib
+import functools
+import os
+import sqlite3
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from .arrowio import (
+    DEFAULT_ROW_GROUP_ROWS,
+    read_feather,
+    write_feather,
+    write_feather_chunks,
+    write_parquet,
+    write_parquet_chunks,
+)
+from .columnar import build_employee_master
+from .config import resolve_config
+from .database import DATABASE_FILE, finalize_database, load_frames, write_sqlite, write_sqlite_chunks
+from .engagement import build_compensation_history, build_engagement_survey
+from .graph import NEO4J_IMPORT_ARGS, graph_path, write_graph_chunks, write_import_args
+from .instrument import finish_stats, measured_stage, run_summary, write_run_report
+from .master import (
+    build_employee_info,
+    build_hr_metrics_definition,
+    build_job_history,
+    build_organization_structure,
+    build_personal_traits,
+    build_reporting_closure,
+    build_reporting_lines,
+    iter_job_history,
+    iter_personal_traits,
+    iter_reporting_closure,
+    iter_reporting_lines,
+)
+from .performance import (
+    build_continuous_performance_review,
+    build_exit_interview,
+    build_goal_management,
+    build_leadership_360_review,
+    build_one_on_one_meetings,
+    build_performance_review,
+    build_project_history,
+    build_rewards_and_discipline,
+    build_skill_assessment,
+    build_team_culture_survey,
+    iter_continuous_performance_review,
+    iter_exit_interview,
+    iter_goal_management,
+    iter_one_on_one_meetings,
+    iter_team_culture_survey,
+)
+from .psychometrics import APTITUDE_SCALES, CPI_SCALES, MMPI_CLINICAL_SCALES, MMPI_VALIDITY_SCALES
+from .recruitment import (
+    build_onboarding_program,
+    build_recruitment_aptitude_results,
+    build_recruitment_cpi_results,
+    build_recruitment_history,
+    build_recruitment_mmpi_results,
+    build_training_history,
+    iter_onboarding_program,
+    iter_recruitment_mmpi_results,
+    iter_training_history,
+)
+from .scheduler import run_dag
+from .streaming import DEFAULT_CHUNK_ROWS, to_frame, write_csv_chunks
+from .talent import (
+    build_employee_yearly_snapshot,
+    build_key_talent_pool,
+    build_succession_plan,
+    iter_employee_yearly_snapshot,
+    iter_succession_plan,
+)
+from .templates import PHRASE_DICTIONARY_FILE, phrase_dictionary
+
+# 0~100 범위 정수 점수 컬럼 타입 (Parquet 에 int8 로 저장)
+SCORE_DTYPE = 'int8'
+BIG5_TRAITS = ['openness', 'conscientiousness', 'extraversion', 'agreeableness', 'neuroticism']
+
+# 테이블 레지스트리 (생성 순서 = 등록 순서)
+# file: 출력 파일명 (없으면 파일로 저장하지 않고 하위 테이블에만 전달하는 내부 단계),
+# builder: 생성 함수, deps: 생성 함수에 순서대로 전달되는 상위 테이블 (첫 상위 테이블이 employee_master 이면
+#       직원 레코드 master.records() 를 첫 인자로, 마스터를 master= 로 전달. 워커에는 마스터 경로만 pickle)
+# iterator: 레코드를 하나씩 내보내는 생성 함수 (stream 모드에서 하위 테이블이 없으면 리스트 없이 바로 기록)
+# dtypes: 기록 시 고정할 컬럼 타입 (정수와 None 이 섞인 컬럼, Parquet 에서 int8 로 저장할 점수 컬럼)
+# comments: 템플릿 문구 컬럼 → {템플릿 행 값 이름: 값을 가져올 컬럼} (COMMENT_ENCODING 복원용)
+# graph: Neo4j 벌크 임포트로 기록할 노드/관계 선언 (graph.py)
+# shared: True 이면 병렬 생성 시 결과를 share() 로 공유 파일에 옮겨 하위 테이블 워커에 경로만 전달
+#         (결과 객체에 share()/release() 가 있어야 함. columnar.EmployeeMaster 참고)
+# step/message: 진행 상황 출력용
+TABLES = {
+    'organization_structure': {
+        'file': '00_organization_structure.csv', 'builder': build_organization_structure, 'deps': [],
+        'graph': [
+            {'nodes': 'Org', 'id': 'org_id',
+             'properties': {'org_name': 'string', 'org_type': 'string', 'level': 'int'}},
+            {'relationship': 'PART_OF', 'start': ('org_id', 'Org'), 'end': ('parent_org_id', 'Org')},
+            {'relationship': 'HEADS', 'start': ('head_employee_id', 'Employee'), 'end': ('org_id', 'Org')},
+        ],
+        'step': '0-1', 'message': '{n}개 조직 단위 생성 완료',
+    },
+    'hr_metrics_definition': {
+        'file': '02_hr_metrics_definition.csv', 'builder': build_hr_metrics_definition, 'deps': [],
+        'graph': [
+            {'nodes': 'Metric', 'id': 'metric_code',
+             'properties': {'metric_name': 'string', 'tool_name': 'string', 'dimension': 'string',
+                            'definition': 'string'}},
+        ],
+        'step': '1', 'message': '{n}개 평가 지표 정의 완료',
+    },
+    'employee_info': {
+        'file': '03_employee_info.csv', 'builder': build_employee_info, 'deps': [],
+        'graph': [
+            {'nodes': 'Employee', 'id': 'employee_id',
+             'properties': {'name': 'string', 'gender': 'string', 'birth_date': 'date',
+                            'employment_type': 'string', 'hire_date': 'date', 'job_title': 'string',
+                            'status': 'string'}},
+            {'relationship': 'BELONGS_TO', 'start': ('employee_id', 'Employee'), 'end': ('org_id', 'Org')},
+            {'relationship': 'REPORTS_TO', 'start': ('employee_id', 'Employee'), 'end': ('manager_id', 'Employee')},
+        ],
+        'step': '2', 'message': '{n}명 직원 정보 생성 완료 (3단계 위계 구조)',
+    },
+    'employee_master': {
+        'builder': build_employee_master, 'deps': ['employee_info'], 'shared': True,
+        'step': '2-1', 'message': '{n}명 컬럼형 직원 마스터 생성 완료',
+    },
+    'reporting_lines': {
+        'file': '01_reporting_lines.csv', 'builder': build_reporting_lines,
+        'iterator': iter_reporting_lines, 'deps': ['employee_master'],
+        'step': '2-2', 'message': '{n}개 보고 라인 생성 완료',
+    },
+    'reporting_closure': {
+        'file': '01_reporting_closure.csv', 'builder': build_reporting_closure,
+        'iterator': iter_reporting_closure, 'deps': ['employee_master'],
+        'step': '2-3', 'message': '{n}건 보고 라인 클로저 생성 완료',
+    },
+    'job_history': {
+        'file': '04_job_history.csv', 'builder': build_job_history,
+        'iterator': iter_job_history, 'deps': ['employee_master'],
+        'step': '3', 'message': '{n}건 경력 이력 생성 완료 (위계 반영)',
+    },
+    'personal_traits': {
+        'file': '05_personal_traits.csv', 'builder': build_personal_traits,
+        'iterator': iter_personal_traits, 'deps': ['employee_master'],
+        'dtypes': dict.fromkeys(BIG5_TRAITS, SCORE_DTYPE),
+        'step': '4', 'message': '{n}건 성격 특성 데이터 생성 완료',
+        'banner': 'A그룹 마스터 데이터 생성 완료',
+    },
+    'recruitment_history': {
+        'file': '06_recruitment_history.csv', 'builder': build_recruitment_history,
+        'deps': ['employee_master'],
+        'step': '5', 'message': '{n}건 채용 이력 생성 완료',
+    },
+    'recruitment_aptitude_results': {
+        'file': '07_recruitment_aptitude_results.csv', 'builder': build_recruitment_aptitude_results,
+        'deps': ['employee_master', 'recruitment_history'],
+        'dtypes': dict.fromkeys(APTITUDE_SCALES, SCORE_DTYPE),
+        'step': '6', 'message': '{n}건 적성검사 결과 생성 완료',
+    },
+    'recruitment_cpi_results': {
+        'file': '08_recruitment_cpi_results.csv', 'builder': build_recruitment_cpi_results,
+        'deps': ['employee_master', 'recruitment_aptitude_results'],
+        'dtypes': dict.fromkeys(CPI_SCALES, SCORE_DTYPE),
+        'step': '7', 'message': '{n}건 CPI 성격검사 결과 생성 완료',
+    },
+    'recruitment_mmpi_results': {
+        'file': '09_recruitment_mmpi_results.csv', 'builder': build_recruitment_mmpi_results,
+        'iterator': iter_recruitment_mmpi_results,
+        'deps': ['employee_master', 'recruitment_cpi_results'],
+        'dtypes': dict.fromkeys(MMPI_VALIDITY_SCALES + MMPI_CLINICAL_SCALES, SCORE_DTYPE),
+        'step': '8', 'message': '{n}건 MMPI 진단검사 결과 생성 완료',
+    },
+    'onboarding_program': {
+        'file': '10_onboarding_program.csv', 'builder': build_onboarding_program,
+        'iterator': iter_onboarding_program, 'deps': ['employee_master'],
+        'step': '9', 'message': '{n}건 온보딩 프로그램 기록 생성 완료',
+    },
+    'training_history': {
+        'file': '11_training_history.csv', 'builder': build_training_history,
+        'iterator': iter_training_history, 'deps': ['employee_master'],
+        'step': '10', 'message': '{n}건 교육 이력 생성 완료',
+        'banner': 'B그룹 채용/온보딩/교육 데이터 생성 완료',
+    },
+    'project_history': {
+        'file': '12_project_history.csv', 'builder': build_project_history,
+        'deps': ['employee_master'],
+        'comments': {'pm_qualitative_feedback': {}, 'peer_qualitative_feedback': {}},
+        'graph': [
+            {'nodes': 'Project', 'id': 'project_id', 'distinct': True, 'properties': {'project_name': 'string'}},
+            {'relationship': 'WORKED_ON', 'start': ('employee_id', 'Employee'), 'end': ('project_id', 'Project'),
+             'properties': {'role': 'string', 'start_date': 'date', 'end_date': 'date',
+                            'pm_qualitative_feedback': 'string', 'peer_qualitative_feedback': 'string'}},
+        ],
+        'step': '11', 'message': '{n}건 프로젝트 이력 생성 완료',
+    },
+    'performance_review': {
+        'file': '13_performance_review.csv', 'builder': build_performance_review,
+        'deps': ['employee_master'],
+        'comments': {'manager_comment_development': {}},
+        'graph': [
+            {'nodes': 'Review', 'id': 'review_id', 'labels': 'Review;PerformanceReview',
+             'properties': {'review_period': 'string', 'final_grade': 'string',
+                            'manager_comment_development': 'string'}},
+            {'relationship': 'HAS_REVIEW', 'start': ('employee_id', 'Employee'), 'end': ('review_id', 'Review')},
+        ],
+        'step': '12', 'message': '{n}건 성과 평가 기록 생성 완료',
+    },
+    'continuous_performance_review': {
+        'file': '14_continuous_performance_review.csv', 'builder': build_continuous_performance_review,
+        'iterator': iter_continuous_performance_review, 'deps': ['employee_master'],
+        'comments': {'self_comment': {}, 'manager_comment': {}},
+        'graph': [
+            {'nodes': 'Review', 'id': 'review_id', 'labels': 'Review;ContinuousReview',
+             'properties': {'review_type': 'string', 'evaluation_period_start': 'date',
+                            'evaluation_period_end': 'date', 'self_evaluation_timestamp': 'localdatetime',
+                            'self_rating': 'string', 'self_comment': 'string',
+                            'manager_evaluation_timestamp': 'localdatetime', 'manager_rating': 'string',
+                            'manager_comment': 'string', 'rating_gap': 'int', 'evaluation_status': 'string'}},
+            {'relationship': 'HAS_REVIEW', 'start': ('employee_id', 'Employee'), 'end': ('review_id', 'Review')},
+        ],
+        'step': '13', 'message': '{n}건 수시 성과평가 기록 생성 완료 (자기평가 + 상사평가 타임스탬프 포함)',
+    },
+    'goal_management': {
+        'file': '15_goal_management.csv', 'builder': build_goal_management,
+        'iterator': iter_goal_management, 'deps': ['employee_master'],
+        'dtypes': {'final_achievement_rate': 'float64'},
+        'step': '14', 'message': '{n}건 목표 관리 기록 생성 완료',
+    },
+    'exit_interview': {
+        'file': '16_exit_interview.csv', 'builder': build_exit_interview,
+        'iterator': iter_exit_interview, 'deps': ['employee_master'],
+        'comments': {
+            'qualitative_feedback': {'primary_reason': 'primary_reason_detail',
+                                     'secondary_reason': 'secondary_reason'},
+        },
+        'step': '15', 'message': '{n}건 퇴사자 인터뷰 기록 생성 완료',
+    },
+    'team_culture_survey': {
+        'file': '16_team_culture_survey.csv', 'builder': build_team_culture_survey,
+        'iterator': iter_team_culture_survey,
+        'deps': ['employee_master', 'organization_structure'],
+        'comments': {'qualitative_comment': {}},
+        'step': '16', 'message': '{n}건 팀 조직문화 서베이 기록 생성 완료',
+    },
+    'rewards_and_discipline': {
+        'file': '17_rewards_and_discipline.csv', 'builder': build_rewards_and_discipline,
+        'deps': ['employee_master'],
+        'step': '17', 'message': '{n}건 포상/징계 이력 생성 완료',
+    },
+    'one_on_one_meetings': {
+        'file': '18_one_on_one_meetings.csv', 'builder': build_one_on_one_meetings,
+        'iterator': iter_one_on_one_meetings, 'deps': ['employee_master'],
+        'step': '18', 'message': '{n}건 1:1 미팅 기록 생성 완료',
+    },
+    'skill_assessment': {
+        'file': '19_skill_assessment.csv', 'builder': build_skill_assessment,
+        'deps': ['employee_master'],
+        'graph': [
+            {'relationship': 'ASSESSED_ON', 'start': ('employee_id', 'Employee'), 'end': ('metric_code', 'Metric'),
+             'properties': {'assessment_date': 'date', 'self_rating': 'float', 'manager_rating': 'float',
+                            'peer_rating_avg': 'float'}},
+        ],
+        'step': '19', 'message': '{n}건 역량 진단 기록 생성 완료',
+    },
+    'leadership_360_review': {
+        'file': '20_leadership_360_review.csv', 'builder': build_leadership_360_review,
+        'deps': ['employee_master'],
+        'graph': [
+            {'relationship': 'RATED_ON', 'start': ('leader_employee_id', 'Employee'),
+             'end': ('metric_code', 'Metric'),
+             'properties': {'review_year': 'int', 'rater_relationship': 'string', 'score': 'float'}},
+        ],
+        'step': '20', 'message': '{n}건 리더십 360도 평가 기록 생성 완료',
+        'banner': 'C그룹 프로젝트/평가 데이터 생성 완료',
+    },
+    'engagement_survey': {
+        'file': '21_engagement_survey.csv', 'builder': build_engagement_survey,
+        'deps': ['employee_master'],
+        'step': '21', 'message': '{n}건 조직 몰입도 설문 기록 생성 완료',
+    },
+    'compensation_history': {
+        'file': '22_compensation_history.csv', 'builder': build_compensation_history,
+        'deps': ['employee_master'],
+        'step': '22', 'message': '{n}건 보상 이력 생성 완료',
+        'banner': 'D그룹 몰입도/보상 데이터 생성 완료',
+    },
+    'key_talent_pool': {
+        'file': '23_key_talent_pool.csv', 'builder': build_key_talent_pool,
+        'deps': ['employee_master', 'performance_review', 'rewards_and_discipline', 'leadership_360_review',
+                 'engagement_survey'],
+        'step': '23', 'message': '{n}명 핵심인재 선정 완료 (성과 평가 기반)',
+    },
+    'succession_plan': {
+        'file': '24_succession_plan.csv', 'builder': build_succession_plan,
+        'iterator': iter_succession_plan,
+        'deps': ['employee_master', 'key_talent_pool'],
+        'graph': [
+            {'relationship': 'SUCCESSOR_OF', 'start': ('successor_id', 'Employee'),
+             'end': ('current_holder_id', 'Employee'),
+             'properties': {'critical_position': 'string', 'successor_rank': 'int', 'readiness_level': 'string',
+                            'position_risk_level': 'string', 'plan_date': 'date'}},
+        ],
+        'step': '24', 'message': '{n}건 승계 계획 생성 완료 (핵심인재 기반)',
+        'banner': 'E그룹 인재 관리 데이터 생성 완료',
+    },
+    'employee_yearly_snapshot': {
+        'file': '25_employee_yearly_snapshot.csv', 'builder': build_employee_yearly_snapshot,
+        'iterator': iter_employee_yearly_snapshot,
+        'deps': ['employee_master', 'performance_review', 'compensation_history', 'skill_assessment',
+                 'project_history'],
+        'step': '25', 'message': '{n}건 연간 스냅샷 생성 완료',
+    },
+}
+
+# 파일로 저장하는 테이블 (내부 단계 제외)
+OUTPUT_TABLES = [name for name, spec in TABLES.items() if 'file' in spec]
+
+
+# 출력 형식 → 파일 확장자 (sqlite 는 모든 테이블을 DATABASE_FILE 하나에 저장,
+# neo4j 는 테이블마다 TABLES[...]['graph'] 의 노드/관계 파일을 저장)
+OUTPUT_FORMATS = {'csv': '.csv', 'parquet': '.parquet', 'feather': '.feather', 'sqlite': None, 'neo4j': None}
+
+
+def resolve_tables(tables=None):
+    """요청된 테이블과 모든 상위 테이블을 생성 순서대로 반환"""
+    if tables is None:
+        return list(TABLES)
+
+    unknown = [name for name in tables if name not in TABLES]
+    if unknown:
+        raise ValueError(f"알 수 없는 테이블: {', '.join(unknown)}")
+
+    required = set()
+    pending = list(tables)
+    while pending:
+        name = pending.pop()
+        if name not in required:
+            required.add(name)
+            pending.extend(TABLES[name]['deps'])
+    return [name for name in TABLES if name in required]
+
+
+def table_path(name, output_dir, output_format='csv'):
+    """
+    출력 형식에 맞는 테이블 파일 경로 (파일명은 TABLES[...]['file'] 에서 확장자만 변경)
+
+    sqlite 는 데이터베이스 파일, neo4j 는 노드/관계 파일명의 접두어(확장자 없는 경로)를 반환합니다.
+    """
+    if output_format == 'sqlite':
+        return os.path.join(output_dir, DATABASE_FILE)
+    stem = os.path.splitext(TABLES[name]['file'])[0]
+    if output_format == 'neo4j':
+        return os.path.join(output_dir, stem)
+    return os.path.join(output_dir, stem + OUTPUT_FORMATS[output_format])
+
+
+def write_table(name, df, output_dir, output_format='csv', row_group_rows=DEFAULT_ROW_GROUP_ROWS):
+    """테이블을 CSV(UTF-8 BOM), Parquet, Feather 또는 SQLite 로 저장하고 파일 경로 반환"""
+    path = table_path(name, output_dir, output_format)
+    if output_format == 'sqlite':
+        return write_sqlite(df, path, name)
+    if output_format == 'neo4j':
+        write_graph_chunks(df.to_dict('records'), path, TABLES[name].get('graph', []))
+        return path
+    if output_format == 'parquet':
+        return write_parquet(df, path, TABLES[name].get('dtypes'), row_group_rows)
+    if output_format == 'feather':
+        return write_feather(df, path, TABLES[name].get('dtypes'))
+    df.to_csv(path, index=False, encoding='utf-8-sig')
+    return path
+
+
+def write_records(name, records, path, chunk_rows, output_format='csv', row_group_rows=DEFAULT_ROW_GROUP_ROWS):
+    """레코드를 청크 단위로 기록하고 행 수 반환"""
+    dtypes = TABLES[name].get('dtypes')
+    if output_format == 'parquet':
+        return write_parquet_chunks(records, path, chunk_rows, dtypes, row_group_rows)
+    if output_format == 'feather':
+        return write_feather_chunks(records, path, chunk_rows, dtypes)
+    if output_format == 'sqlite':
+        return write_sqlite_chunks(records, path, name, chunk_rows)
+    if output_format == 'neo4j':
+        return write_graph_chunks(records, path, TABLES[name].get('graph', []))
+    return write_csv_chunks(records, path, chunk_rows, dtypes)
+
+
+def read_table(name, output_dir, output_format='csv', columns=None):
+    """저장된 테이블을 DataFrame 으로 읽기 (neo4j 출력은 테이블 단위로 읽을 수 없음)"""
+    if output_format == 'neo4j':
+        raise ValueError("neo4j 출력은 read_table 로 읽을 수 없습니다")
+    path = table_path(name, output_dir, output_format)
+    if output_format == 'parquet':
+        return pd.read_parquet(path, columns=columns)
+    if output_format == 'feather':
+        return pd.read_feather(path, columns=columns)
+    if output_format == 'sqlite':
+        select = ', '.join(f'"{col}"' for col in columns) if columns else '*'
+        with contextlib.closing(sqlite3.connect(path)) as conn:
+            return pd.read_sql_query(f'SELECT {select} FROM {name}', conn)
+    return pd.read_csv(path, usecols=columns)
+
+
+def export_sqlite(source_dir, input_format='csv', output_dir=None, tables=None, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    이미 저장된 테이블 파일을 SQLite 데이터베이스 하나로 적재하고 데이터베이스 경로 반환
+
+    source_dir: generate() 의 output_dir
+    input_format: 저장된 파일 형식 ('csv', 'parquet', 'feather'). CSV 는 chunk_rows 행씩 읽습니다.
+    output_dir: 데이터베이스(DATABASE_FILE)를 만들 디렉토리 (None 이면 source_dir)
+    tables: 적재할 테이블 이름 목록 (None 이면 source_dir 에 있는 전체 테이블)
+    """
+    if input_format not in OUTPUT_FORMATS or input_format == 'sqlite':
+        raise ValueError(f"지원하지 않는 입력 형식: {input_format}")
+    if tables is not None:
+        unknown = [name for name in tables if name not in TABLES]
+        if unknown:
+            raise ValueError(f"알 수 없는 테이블: {', '.join(unknown)}")
+
+    path = table_path(None, output_dir or source_dir, 'sqlite')
+    loaded = []
+    for name in OUTPUT_TABLES if tables is None else tables:
+        file = table_path(name, source_dir, input_format)
+        if tables is None and not os.path.exists(file):
+            continue
+        if input_format == 'csv':
+            frames = pd.read_csv(file, chunksize=chunk_rows)
+        else:
+            frames = [read_table(name, source_dir, input_format)]
+        load_frames(path, name, frames)
+        loaded.append(name)
+    return finalize_database(path, loaded)
+
+
+def load_tables(path, tables=None, mmap=True, as_pandas=False):
+    """
+    Feather 로 저장된 테이블 읽기
+
+    path: generate(output_format='feather') 의 output_dir
+    tables: 읽을 테이블 이름 목록 (None 이면 path 에 있는 전체 테이블)
+    mmap: 파일을 memory map 으로 열어 버퍼를 복사하지 않음 (여러 프로세스가 페이지 캐시 공유)
+    as_pandas: True 이면 DataFrame 으로 반환 (pandas ArrowDtype 컬럼이 Arrow 버퍼를 그대로 참조)
+    반환값: {테이블 이름: pyarrow.Table 또는 DataFrame}
+    """
+    if tables is not None:
+        unknown = [name for name in tables if name not in TABLES]
+        if unknown:
+            raise ValueError(f"알 수 없는 테이블: {', '.join(unknown)}")
+
+    loaded = {}
+    for name in OUTPUT_TABLES if tables is None else tables:
+        file = table_path(name, path, 'feather')
+        if tables is None and not os.path.exists(file):
+            continue
+        table = read_feather(file, mmap)
+        loaded[name] = table.to_pandas(types_mapper=pd.ArrowDtype) if as_pandas else table
+    return loaded
+
+
+def expand_comments(name, df, dictionary=None):
+    """
+    COMMENT_ENCODING 으로 저장된 테이블의 코드 컬럼을 문장으로 복원한 사본 반환
+
+    dictionary: 코드를 생성할 때 저장한 PhraseDictionary (load_phrase_dictionary 로 읽음).
+                None 이면 현재 프로세스의 템플릿을 사용합니다.
+    """
+    dictionary = dictionary or phrase_dictionary()
+    df = df.copy()
+    for column, fields in TABLES[name].get('comments', {}).items():
+        values = [df[source].tolist() for source in fields.values()]
+        df[column] = [
+            dictionary.expand(code, **dict(zip(fields, row)))
+            for code, *row in zip(df[column].tolist(), *values)
+        ]
+    return df
+
+
+def call_stage(name, make, upstream, config):
+    """생성 함수(builder/iterator) 호출. employee_master 결과는 직원 레코드와 master= 로 나눠 전달"""
+    if TABLES[name]['deps'][:1] == ['employee_master']:
+        master, *upstream = upstream
+        return make(master.records(), *upstream, master=master, config=config)
+    return make(*upstream, config=config)
+
+
+def run_stage(name, upstream, config):
+    """테이블 하나 생성 (워커 프로세스에서도 호출 가능한 최상위 함수)"""
+    return call_stage(name, TABLES[name]['builder'], upstream, config)
+
+
+def stream_stage(name, upstream, config, output_dir, chunk_rows, leaves, requested,
+                 output_format='csv', row_group_rows=DEFAULT_ROW_GROUP_ROWS):
+    """
+    테이블 하나를 생성하면서 청크 단위로 output_format 파일에 기록 (워커 프로세스에서도 호출 가능)
+
+    leaves: 하위 테이블이 없는 테이블 이름 집합. 이 테이블은 iterator 가 있으면 레코드를
+            리스트로 모으지 않고 바로 기록합니다.
+    requested: 파일로 기록할 테이블 이름 집합
+    반환값: 하위 테이블이 있으면 레코드 리스트, 없으면 기록한 행 수
+    """
+    spec = TABLES[name]
+    if 'file' not in spec:
+        # 내부 단계: 기록 없이 하위 테이블에 전달 (하위 테이블이 없으면 크기만 반환)
+        result = run_stage(name, upstream, config)
+        return len(result) if name in leaves else result
+
+    path = table_path(name, output_dir, output_format)
+    if name in leaves:
+        make = spec.get('iterator', spec['builder'])
+        return write_records(name, call_stage(name, make, upstream, config), path, chunk_rows, output_format,
+                             row_group_rows)
+
+    records = run_stage(name, upstream, config)
+    if name in requested:
+        write_records(name, records, path, chunk_rows, output_format, row_group_rows)
+    return records
+
+
+def finalize_output(plan, requested, output_dir, output_format):
+    """모든 테이블 기록 후 처리 (sqlite: 인덱스/ANALYZE, neo4j: neo4j-admin 인자 파일)"""
+    if output_format == 'sqlite':
+        finalize_database(table_path(None, output_dir, 'sqlite'), requested)
+    elif output_format == 'neo4j':
+        files = [(table_path(name, output_dir, 'neo4j'), TABLES[name]['graph'])
+                 for name in plan if name in requested and 'graph' in TABLES[name]]
+        write_import_args(os.path.join(output_dir, NEO4J_IMPORT_ARGS), files)
+
+
+def written_bytes(name, output_dir, output_format='csv'):
+    """
+    테이블 출력 파일 크기 합 (없으면 0)
+
+    sqlite 는 테이블별 파일이 없으므로 데이터베이스 파일과 WAL 파일 전체 크기입니다.
+    """
+    path = table_path(name, output_dir, output_format)
+    if output_format == 'sqlite':
+        paths = [path, path + '-wal']
+    elif output_format == 'neo4j':
+        paths = [graph_path(path, element) for element in TABLES[name].get('graph', [])]
+    else:
+        paths = [path]
+    return sum(os.path.getsize(p) for p in paths if os.path.exists(p))
+
+
+def generate(tables=None, config=None, output_dir=None, verbose=False, workers=None,
+             stream=False, chunk_rows=DEFAULT_CHUNK_ROWS, output_format='csv',
+             row_group_rows=DEFAULT_ROW_GROUP_ROWS, report_path=None, trace_memory=False,
+             profile_dir=None):
+    """
+    HR 데이터 테이블 생성
+
+    tables: 생성할 테이블 이름 목록 (None 이면 전체). 상위 테이블은 자동으로 함께 생성됩니다.
+    config: CONFIG 덮어쓰기 값 (dict)
+    output_dir: 지정 시 요청된 테이블을 CSV 로 저장
+    workers: 2 이상이면 독립적인 테이블을 해당 수의 프로세스에서 병렬 생성
+             (테이블마다 독립 난수 스트림을 사용하므로 순차 실행과 결과가 동일).
+             직원 마스터 배열은 공유 memory map 파일로 워커에 전달합니다 (columnar.EmployeeMaster.share)
+    stream: True 이면 모든 테이블을 chunk_rows 행씩 output_dir 에 바로 기록하고 DataFrame 을
+            만들지 않습니다. 하위 테이블이 없는 테이블은 레코드를 리스트로 모으지 않으며,
+            상위 테이블 레코드도 마지막 하위 테이블이 생성되면 해제됩니다.
+    output_format: 'csv' (UTF-8 BOM), 'parquet' (날짜/범주형/점수 컬럼 타입 지정, pyarrow 필요),
+                   'feather' (같은 타입의 비압축 Arrow IPC 파일, load_tables 로 memory map 읽기),
+                   'sqlite' (모든 테이블을 DATABASE_FILE 하나에 적재하고 분석 쿼리 인덱스 생성) 또는
+                   'neo4j' (TABLES[...]['graph'] 의 노드/관계를 neo4j-admin database import 형식으로 기록,
+                   인자 파일 NEO4J_IMPORT_ARGS 함께 저장)
+    row_group_rows: Parquet row group 행 수
+    report_path: 지정 시 단계별 소요 시간, CPU 시간, 행/초, 최고 RSS, 기록 바이트를 실행 리포트로
+                 저장 ('.csv' 이면 CSV, 그 외에는 JSON. instrument 모듈 참고)
+    trace_memory: True 이면 단계별 tracemalloc 최고치도 측정 (할당 추적으로 느려짐)
+    profile_dir: 지정 시 단계마다 cProfile 덤프('<테이블 이름>.prof')를 저장
+    반환값: {테이블 이름: DataFrame} (요청된 테이블만), stream 모드에서는 {테이블 이름: 행 수}
+
+    config 의 COMMENT_ENCODING 이 True 이면 정성 코멘트 컬럼에 템플릿 코드를 저장하고, 복원에
+    필요한 템플릿 목록을 output_dir 의 PHRASE_DICTIONARY_FILE 로 함께 저장합니다 (expand_comments).
+    """
+    if stream and not output_dir:
+        raise ValueError("stream 모드에는 output_dir 이 필요합니다")
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"지원하지 않는 출력 형식: {output_format} ({', '.join(OUTPUT_FORMATS)})")
+    if output_format == 'sqlite' and stream and workers and workers > 1:
+        # SQLite 는 쓰기 연결이 하나뿐이므로 워커가 각자 적재할 수 없음
+        raise ValueError("sqlite 출력은 stream 모드에서 workers 와 함께 사용할 수 없습니다 "
+                         "(병렬 생성 후 export_sqlite 로 적재)")
+
+    config = resolve_config(config)
+    plan = resolve_tables(tables)
+    # 내부 단계(file 없음)는 직접 요청한 경우에만 반환 (파일로 저장하지 않음)
+    requested = set(OUTPUT_TABLES if tables is None else tables)
+    deps = {name: TABLES[name]['deps'] for name in plan}
+
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+        if config['COMMENT_ENCODING'] and any('comments' in TABLES[name] for name in requested):
+            phrase_dictionary().save(os.path.join(output_dir, PHRASE_DICTIONARY_FILE))
+
+    frames = {}
+    instrumented = bool(report_path or trace_memory or profile_dir)
+    stages = {}
+    started_at = datetime.now().isoformat(timespec='seconds')
+    started = time.perf_counter()
+    # sqlite 는 파일 하나에 순서대로 적재하므로 테이블별 기록량은 직전 크기와의 차이
+    last_size = written_bytes(None, output_dir, output_format) if output_dir and output_format == 'sqlite' else 0
+
+    def finish(name, result, stats=None):
+        nonlocal last_size
+        spec = TABLES[name]
+        n = result if stream else len(result)
+        write_seconds = 0.0
+        if name in requested:
+            if stream:
+                frames[name] = n
+            elif 'file' not in spec:
+                frames[name] = result
+            else:
+                frames[name] = to_frame(result)
+                if output_dir:
+                    begin = time.perf_counter()
+                    write_table(name, frames[name], output_dir, output_format, row_group_rows)
+                    write_seconds = time.perf_counter() - begin
+
+        if stats is not None:
+            size = 0
+            if output_dir and name in requested and 'file' in spec:
+                size = written_bytes(name, output_dir, output_format)
+                if output_format == 'sqlite':
+                    size, last_size = max(size - last_size, 0), size
+            stats['step'] = spec['step']
+            stages[name] = finish_stats(stats, n, size, write_seconds)
+
+        if verbose:
+            elapsed = f" ({stats['wall_seconds'] + write_seconds:.2f}초)" if stats is not None else ''
+            print(f"   [OK] {spec['message'].format(n=n)}{elapsed}")
+            if 'banner' in spec:
+                print("\n" + "=" * 80)
+                print(spec['banner'])
+                print("=" * 80)
+
+    if stream:
+        leaves = frozenset(name for name in plan if not any(name in deps[other] for other in plan))
+        stage_fn = functools.partial(stream_stage, config=config, output_dir=output_dir,
+                                     chunk_rows=chunk_rows, leaves=leaves, requested=frozenset(requested),
+                                     output_format=output_format, row_group_rows=row_group_rows)
+    else:
+        stage_fn = functools.partial(run_stage, config=config)
+    if instrumented:
+        stage_fn = functools.partial(measured_stage, stage_fn=stage_fn, trace_memory=trace_memory,
+                                     profile_dir=profile_dir)
+
+    def complete():
+        if output_dir:
+            finalize_output(plan, requested, output_dir, output_format)
+        if report_path:
+            summary = run_summary(
+                [stages[name] for name in plan], time.perf_counter() - started, started_at=started_at,
+                tables=len(plan), workers=workers or 1, stream=stream, output_format=output_format,
+                total_employees=config['TOTAL_EMPLOYEES'], random_seed=config['RANDOM_SEED'],
+            )
+            write_run_report(report_path, summary)
+            if verbose:
+                print(f"\n실행 리포트 저장: {report_path}")
+
+    if workers and workers > 1:
+        if verbose:
+            print(f"\n{len(plan)}개 테이블을 {workers}개 프로세스에서 병렬 생성 중...")
+
+        def report(name, result):
+            stats = None
+            if instrumented:
+                result, stats = result
+            if verbose:
+                print(f"\n[{TABLES[name]['step']}/25] {TABLES[name].get('file', name)} 생성 완료")
+            finish(name, result if not stream or name in leaves else len(result), stats)
+            if 'shared' in TABLES[name] and any(name in deps[other] for other in plan):
+                # 하위 테이블 워커에는 공유 배열 경로만 pickle 해서 전달 (워커는 memory map 으로 연결)
+                shared.append(result.share())
+                return shared[-1]
+            return result if instrumented else None
+
+        shared = []
+        try:
+            run_dag(plan, deps, stage_fn, workers=workers, on_complete=report, release=True)
+        finally:
+            for result in shared:
+                result.release()
+        complete()
+        return {name: frames[name] for name in plan if name in frames}
+
+    # 남은 하위 테이블 수 (0 이 되면 레코드 해제)
+    consumers = {name: sum(name in deps[other] for other in plan) for name in plan}
+    results = {}
+    for name in plan:
+        spec = TABLES[name]
+        if verbose:
+            print(f"\n[{spec['step']}/25] {spec.get('file', name)} 생성 중...")
+
+        result = stage_fn(name, [results[dep] for dep in spec['deps']])
+        stats = None
+        if instrumented:
+            result, stats = result
+        for dep in spec['deps']:
+            consumers[dep] -= 1
+            if not consumers[dep]:
+                del results[dep]
+        if consumers[name]:
+            results[name] = result
+        finish(name, result if not stream or name in leaves else len(result), stats)
+
+    complete()
+    return frames
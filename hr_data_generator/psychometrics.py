@@ -0,0 +1,130 @@
+"""
+채용 전형 검사 척도 상관 표본 추출
+
+적성검사, CPI, MMPI 의 모든 척도를 하나의 다변량 정규분포에서 함께 뽑습니다. 척도 간 목표
+상관계수(SCALE_CORRELATIONS 를 CORRELATION_STRENGTH 에 맞춰 조정)로 상관행렬을 만들고, 독립 표준정규
+행렬에 Cholesky 인자를 곱해 직원 x 척도 잠재점수를 한 번에 생성합니다. 세 검사 테이블은
+같은 난수 스트림에서 같은 잠재점수를 재현하므로 테이블 사이에 예측값을 전달하지 않습니다.
+
+상관계수는 잠재점수 기준이며, 점수 변환(퇴사자/직급 평균 보정, 정수 변환, 범위 자르기) 후 기본
+강도(REFERENCE_STRENGTH)에서 검사 테이블의 측정 상관이 README 의 값이 되도록 보정한 값입니다. 리더급 직원은 같은 표준정규 행렬에
+LEADER_SCALE_CORRELATIONS 를 덮어쓴 상관행렬의 인자를 곱합니다.
+"""
+
+import numpy as np
+
+from .config import CONFIG
+from .rng import stage_random
+
+# 적성검사 하위 요인
+APTITUDE_SCALES = [
+    # 언어적 능력
+    'verbal_vocab', 'verbal_composition', 'verbal_decoding', 'verbal_english',
+    # 수리적 능력
+    'numerical_quantity', 'numerical_statistics', 'numerical_logic',
+    # 기타 능력
+    'situational_judgment', 'social_knowledge', 'interpersonal_skills',
+]
+
+# CPI 20개 일상척도 + 벡터척도 (출력 순서)
+CPI_SCALES = [
+    # 1군: 대인관계 및 자신감
+    'dominance_do', 'capacity_status_cs', 'sociability_sy', 'social_presence_sp',
+    'self_acceptance_sa', 'independence_in', 'empathy_em',
+    # 2군: 규범 지향성 및 가치관
+    'responsibility_re', 'socialization_so', 'self_control_sc', 'good_impression_gi',
+    'communality_cm', 'well_being_wb', 'tolerance_to',
+    # 3군: 성취 잠재력 및 지적 효율성
+    'achievement_conformance_ac', 'achievement_independence_ai', 'intellectual_efficiency_ie',
+    # 4군: 역할 및 개인적 스타일
+    'psychological_mindedness_py', 'flexibility_fx', 'femininity_masculinity_fm',
+    # 벡터척도
+    'vector_v1_extraversion', 'vector_v2_norm_orientation', 'vector_v3_self_realization',
+]
+
+# MMPI 타당도 척도 (허위, 빈도, 교정)
+MMPI_VALIDITY_SCALES = ['lie_scale_l', 'frequency_scale_f', 'correction_scale_k']
+
+# MMPI 임상 척도 (출력 순서)
+MMPI_CLINICAL_SCALES = [
+    'hypochondriasis_hs', 'depression_d', 'hysteria_hy', 'psychopathic_deviate_pd', 'masculinity_femininity_mf',
+    'paranoia_pa', 'psychasthenia_pt', 'schizophrenia_sc', 'hypomania_ma', 'social_introversion_si',
+]
+
+RECRUITMENT_SCALES = APTITUDE_SCALES + CPI_SCALES + MMPI_VALIDITY_SCALES + MMPI_CLINICAL_SCALES
+
+# 상관계수 표의 기준 강도 (CONFIG 기본 CORRELATION_STRENGTH)
+REFERENCE_STRENGTH = 0.6
+
+# 척도 간 잠재 상관계수 (REFERENCE_STRENGTH 기준). 괄호 안은 기본 설정에서 검사 테이블의 측정 상관
+SCALE_CORRELATIONS = {
+    # 대인관계능력이 높은 사람은 CPI 사교성/공감성도 높음 (0.33, 0.39)
+    ('interpersonal_skills', 'sociability_sy'): 0.312,
+    ('interpersonal_skills', 'empathy_em'): 0.372,
+    # 상황판단능력이 높은 사람은 CPI 지배성도 높음 (0.39)
+    ('situational_judgment', 'dominance_do'): 0.345,
+    # CPI 안녕감이 낮으면 MMPI 우울증이 높음 (-0.63)
+    ('well_being_wb', 'depression_d'): -0.562,
+    # CPI 사교성이 높으면 MMPI 사회적내향성이 낮음 (-0.64)
+    ('sociability_sy', 'social_introversion_si'): -0.632,
+}
+
+# 리더급(columnar.LEADER_TITLES) 직원에게 적용하는 잠재 상관계수 (SCALE_CORRELATIONS 값을 덮어씀)
+LEADER_SCALE_CORRELATIONS = {
+    # 리더급은 상황판단능력과 CPI 지배성의 연관이 더 강함 (리더급 안에서 0.51)
+    ('situational_judgment', 'dominance_do'): 0.503,
+}
+
+# 상관행렬 보정 시 최소 고유값 (Cholesky 분해 가능하도록 양의 정부호 유지)
+MIN_EIGENVALUE = 1e-6
+
+
+def scaled_correlation(r, strength):
+    """
+    기준 강도의 상관계수 → strength 의 상관계수
+
+    Fisher z (atanh) 척도에서 강도에 비례시키므로 strength 가 REFERENCE_STRENGTH 이면 r 그대로,
+    0 이면 0 이고, 강도를 높여도 절댓값이 1 을 넘지 않습니다.
+    """
+    return float(np.tanh(np.arctanh(r) * strength / REFERENCE_STRENGTH))
+
+
+def correlation_matrix(strength, scales=RECRUITMENT_SCALES, correlations=SCALE_CORRELATIONS):
+    """
+    척도 상관행렬 (강도를 반영한 잠재 상관계수, 지정하지 않은 척도 쌍은 0)
+
+    strength 가 1 에 가까우면 목표 상관계수 조합이 양의 정부호가 아닐 수 있으므로, 이 경우
+    음의 고유값을 MIN_EIGENVALUE 로 올리고 대각을 1 로 다시 맞춘 상관행렬을 사용합니다.
+    """
+    position = {scale: i for i, scale in enumerate(scales)}
+    matrix = np.eye(len(scales))
+    for (a, b), r in correlations.items():
+        i, j = position[a], position[b]
+        matrix[i, j] = matrix[j, i] = scaled_correlation(r, strength)
+
+    eigenvalues, eigenvectors = np.linalg.eigh(matrix)
+    if eigenvalues.min() < MIN_EIGENVALUE:
+        matrix = (eigenvectors * np.maximum(eigenvalues, MIN_EIGENVALUE)) @ eigenvectors.T
+        scale = 1 / np.sqrt(np.diag(matrix))
+        matrix = matrix * np.outer(scale, scale)
+    return matrix
+
+
+def sample_scales(n, config=CONFIG, leaders=None):
+    """
+    직원 x 척도 잠재점수 (표준정규, 목표 상관 반영)
+
+    ENABLE_CORRELATION 이 꺼져 있으면 모든 척도가 독립입니다. 같은 config, 인원, leaders 이면
+    어느 검사 단계에서 호출해도 같은 값을 반환합니다.
+    leaders: 리더급 직원 마스크 (지정하면 해당 행은 LEADER_SCALE_CORRELATIONS 반영)
+    반환값: {척도 이름: 직원 순서의 표준정규 배열}
+    """
+    strength = config['CORRELATION_STRENGTH'] if config['ENABLE_CORRELATION'] else 0.0
+    gen = stage_random(config, 'recruitment_scales').generator
+    normal = gen.standard_normal((n, len(RECRUITMENT_SCALES)))
+    latent = normal @ np.linalg.cholesky(correlation_matrix(strength)).T
+    if leaders is not None and strength:
+        leader_correlations = {**SCALE_CORRELATIONS, **LEADER_SCALE_CORRELATIONS}
+        factor = np.linalg.cholesky(correlation_matrix(strength, correlations=leader_correlations))
+        latent[leaders] = normal[leaders] @ factor.T
+    return dict(zip(RECRUITMENT_SCALES, latent.T))
@@ -0,0 +1,443 @@
+"""
+B그룹: 채용, 온보딩, 교육 데이터
+
+채용 이력, 채용 전형 검사 (적성검사, CPI, MMPI), 온보딩, 교육 이력
+"""
+
+from datetime import timedelta
+
+import numpy as np
+
+from .batch import date_strings, iter_records, latent_scores, t_scores, to_dates
+from .columnar import ensure_master
+from .config import CONFIG, reference_date
+from .index import index_by
+from .org import division_type
+from .psychometrics import APTITUDE_SCALES, CPI_SCALES, MMPI_CLINICAL_SCALES, sample_scales
+from .rng import stage_random
+from .streaming import collect
+
+RECRUITMENT_CHANNELS = ['채용공고', '헤드헌팅', '추천', '채용박람회', '대학 채용', '인턴 전환', '경력 스카우트']
+
+ONBOARDING_PROGRAMS = [
+    '회사 소개 및 비전 공유',
+    '조직문화 및 핵심가치 교육',
+    '업무 시스템 사용법 교육',
+    '부서별 업무 소개',
+    '멘토 배정 및 OJT',
+    '컴플라이언스 교육',
+    '정보보안 교육',
+]
+
+TRAINING_COURSES = [
+    ('Python 기초', 'Technical', 16),
+    ('Python 심화', 'Technical', 24),
+    ('데이터 분석 실무', 'Technical', 24),
+    ('SQL 데이터베이스', 'Technical', 16),
+    ('효과적인 커뮤니케이션', 'Soft Skill', 8),
+    ('프레젠테이션 스킬', 'Soft Skill', 8),
+    ('리더십 기본', 'Leadership', 16),
+    ('리더십 심화', 'Leadership', 20),
+    ('프로젝트 관리 실무', 'Management', 20),
+    ('애자일 방법론', 'Management', 16),
+    ('협업 스킬 향상', 'Soft Skill', 8),
+    ('AI/ML 기초', 'Technical', 32),
+    ('AI/ML 실무', 'Technical', 40),
+    ('문제해결 기법', 'Soft Skill', 12),
+    ('디자인 씽킹', 'Soft Skill', 16),
+    ('클라우드 컴퓨팅', 'Technical', 24),
+    ('정보보안', 'Compliance', 8),
+    ('개인정보보호', 'Compliance', 4),
+]
+
+# 직무별 적성 점수 조정 (언어, 수리, 상황판단)
+APTITUDE_DIVISION_ADJUSTMENT = {
+    '기술본부': (0, 5, 3),
+    '경영지원본부': (5, 2, 5),
+    '비즈니스본부': (3, 0, 5),
+}
+
+# 전체 CPI 점수 산정에 쓰는 주요 척도 (Do, Cs, Sy, Re, So, Sc, Ac, Ai, Ie)
+CPI_MAJOR_SCALES = [
+    'dominance_do', 'capacity_status_cs', 'sociability_sy', 'responsibility_re', 'socialization_so',
+    'self_control_sc', 'achievement_conformance_ac', 'achievement_independence_ai', 'intellectual_efficiency_ie',
+]
+
+# MMPI 타당도 척도 (평균, 표준편차, 최소, 최대) - 일반적으로 낮은 점수 (정상 범위)
+MMPI_VALIDITY_SPEC = {
+    'lie_scale_l': (45, 8, 30, 70),
+    'frequency_scale_f': (45, 8, 30, 75),
+    'correction_scale_k': (50, 8, 35, 70),
+}
+
+
+
+def build_recruitment_history(employees, master=None, config=CONFIG):
+    """5. recruitment_history - 채용 이력"""
+    rng = stage_random(config, 'recruitment_history')
+    master = ensure_master(employees, master)
+    hire_dates = master.hire_datetimes()
+    recruitment_data = []
+    recruit_counter = 1
+
+    for emp, is_active, hire_date in zip(employees, master['active'].tolist(), hire_dates):
+        if is_active or rng.random() < 0.7:  # 재직자 + 일부 퇴사자
+            apply_date = hire_date - timedelta(days=rng.randint(60, 150))
+            interview_date = apply_date + timedelta(days=rng.randint(14, 35))
+            offer_date = interview_date + timedelta(days=rng.randint(7, 21))
+
+            # 직급에 따른 채용 경로
+            if emp['job_title'] in ['팀장', '부장', '센터장', '이사', '대표이사']:
+                channel = rng.choice(['헤드헌팅', '경력 스카우트', '추천'])
+            else:
+                channel = rng.choice(RECRUITMENT_CHANNELS)
+
+            recruitment_data.append({
+                'recruitment_id': f'REC{recruit_counter:04d}',
+                'employee_id': emp['employee_id'],
+                'position_title': emp['job_title'],
+                'apply_date': apply_date.strftime('%Y-%m-%d'),
+                'interview_date': interview_date.strftime('%Y-%m-%d'),
+                'offer_date': offer_date.strftime('%Y-%m-%d'),
+                'hire_date': emp['hire_date'],
+                'recruitment_channel': channel,
+                'interviewer_comment': rng.choice([
+                    '직무 전문성이 뛰어나며 조직 적합도가 높음',
+                    '우수한 역량과 성장 가능성을 보임',
+                    '경험과 역량이 요구사항에 부합함',
+                    '기대 이상의 실력과 태도를 보임',
+                    '팀워크와 커뮤니케이션 능력이 우수함',
+                    '빠른 학습 능력과 적응력을 갖춤'
+                ])
+            })
+            recruit_counter += 1
+
+    return recruitment_data
+
+
+def _test_dates(gen, previous_dates, hire_dates, after, before):
+    """
+    검사일 배열
+
+    이전 단계 기록이 있으면 그 날짜로부터 after=(최소, 최대)일 후,
+    없으면(previous_dates 값이 None) 입사일로부터 before=(최소, 최대)일 전
+    """
+    n = len(hire_dates)
+    has_previous = np.array([date is not None for date in previous_dates], dtype=bool)
+    previous = to_dates([date if date is not None else 'NaT' for date in previous_dates])
+    base = np.where(has_previous, previous, hire_dates)
+    forward = gen.integers(after[0], after[1] + 1, n)
+    backward = gen.integers(before[0], before[1] + 1, n)
+    return date_strings(np.where(has_previous, base + forward, base - backward))
+
+
+def build_recruitment_aptitude_results(employees, recruitment_data, master=None, config=CONFIG):
+    """5-2. recruitment_aptitude_results - 적성검사 결과"""
+    gen = stage_random(config, 'recruitment_aptitude_results').generator
+    master = ensure_master(employees, master)
+    recruitment_by_employee = index_by(recruitment_data)
+    recruitment_records = [recruitment_by_employee.get(emp['employee_id']) for emp in employees]
+
+    # 모든 직원 (재직자 + 퇴사자)에 대해 채용 시 적성검사 실시
+    # 채용 프로세스: 지원일로부터 7-14일 후 (채용 기록이 없으면 입사일 기준 30-60일 전으로 역산)
+    test_dates = _test_dates(gen, [rec['apply_date'] if rec else None for rec in recruitment_records],
+                             master['hire_date'], (7, 14), (30, 60))
+
+    # 직무별 적성 점수 조정
+    adj_by_division = {
+        name: APTITUDE_DIVISION_ADJUSTMENT.get(division_type(name), (0, 0, 0))
+        for name in {emp['division_name'] for emp in employees}
+    }
+    division_adj = np.array([adj_by_division[emp['division_name']] for emp in employees],
+                            dtype=np.int64).reshape(-1, 3)
+    verbal_adj, numerical_adj, situational_adj = division_adj.T
+
+    # 퇴사자는 일부 점수를 낮게 조정 (채용 미스매치 반영)
+    overall_adjustment = np.where(master.mask('status', '퇴사'), -8, 0)
+
+    # 리더급은 상황판단능력도 우수 (CPI 지배성 가산점과 같은 방향, 상관관계 강도 반영)
+    situational_bonus = 0
+    if config['ENABLE_CORRELATION']:
+        leadership_bonus = np.array([config['LEADERSHIP_BONUS'].get(emp['job_title'], 0) for emp in employees])
+        situational_bonus = leadership_bonus * config['CORRELATION_STRENGTH']
+
+    # 하위 요인 점수 (CPI/MMPI 와의 상관관계는 공통 잠재점수에 반영되어 있음)
+    latent = sample_scales(len(employees), config, master['leader'])
+    base = 75 + overall_adjustment
+    means = {
+        'verbal_vocab': base + verbal_adj,
+        'verbal_composition': base + verbal_adj,
+        'verbal_decoding': base + verbal_adj,
+        'verbal_english': base - 5 + verbal_adj,
+        'numerical_quantity': base + numerical_adj,
+        'numerical_statistics': base + numerical_adj,
+        'numerical_logic': base + numerical_adj,
+        'situational_judgment': base + situational_adj + situational_bonus,
+        'social_knowledge': base,
+        'interpersonal_skills': base,
+    }
+    scores = {scale: latent_scores(latent[scale], means[scale], 12, 30, 100) for scale in APTITUDE_SCALES}
+    verbal_total = np.round((scores['verbal_vocab'] + scores['verbal_composition'] + scores['verbal_decoding']
+                             + scores['verbal_english']) / 4, 1)
+    numerical_total = np.round((scores['numerical_quantity'] + scores['numerical_statistics']
+                                + scores['numerical_logic']) / 3, 1)
+
+    # 전체 점수
+    overall_aptitude_score = np.round((verbal_total + numerical_total + scores['situational_judgment']
+                                       + scores['social_knowledge'] + scores['interpersonal_skills']) / 5, 1)
+
+    # 등급 산정, 합격/불합격 (C등급 이상 합격)
+    aptitude_grade = np.select(
+        [overall_aptitude_score >= 85, overall_aptitude_score >= 75, overall_aptitude_score >= 65,
+         overall_aptitude_score >= 55],
+        ['S', 'A', 'B', 'C'], default='D')
+    pass_fail_status = np.where(aptitude_grade == 'D', 'FAIL', 'PASS')
+
+    return list(iter_records({
+        'test_id': [f'APT{i:04d}' for i in range(1, len(employees) + 1)],
+        'employee_id': [emp['employee_id'] for emp in employees],
+        'test_date': test_dates,
+        'recruitment_id': [rec['recruitment_id'] if rec else f'REC{i:04d}'
+                           for i, rec in enumerate(recruitment_records, start=1)],
+
+        # 언어적 능력
+        'verbal_total': verbal_total,
+        'verbal_vocab': scores['verbal_vocab'],
+        'verbal_composition': scores['verbal_composition'],
+        'verbal_decoding': scores['verbal_decoding'],
+        'verbal_english': scores['verbal_english'],
+
+        # 수리적 능력
+        'numerical_total': numerical_total,
+        'numerical_quantity': scores['numerical_quantity'],
+        'numerical_statistics': scores['numerical_statistics'],
+        'numerical_logic': scores['numerical_logic'],
+
+        # 기타 능력
+        'situational_judgment': scores['situational_judgment'],
+        'social_knowledge': scores['social_knowledge'],
+        'interpersonal_skills': scores['interpersonal_skills'],
+
+        # 종합
+        'overall_aptitude_score': overall_aptitude_score,
+        'aptitude_grade': aptitude_grade,
+        'pass_fail_status': pass_fail_status,
+    }))
+
+
+def build_recruitment_cpi_results(employees, aptitude_results, master=None, config=CONFIG):
+    """5-3. recruitment_cpi_results - CPI 성격검사 결과"""
+    gen = stage_random(config, 'recruitment_cpi_results').generator
+    master = ensure_master(employees, master)
+    aptitude_by_employee = index_by(aptitude_results)
+    aptitude_records = [aptitude_by_employee.get(emp['employee_id']) for emp in employees]
+
+    # 적성검사 후 3-7일 후 CPI 실시 (적성검사 기록이 없으면 입사일 기준 20-40일 전)
+    test_dates = _test_dates(gen, [rec['test_date'] if rec else None for rec in aptitude_records],
+                             master['hire_date'], (3, 7), (20, 40))
+
+    # 퇴사자 특성 반영 (전반적으로 낮은 점수, 안녕감 특히 낮음, 책임감 낮음)
+    leaver = master.mask('status', '퇴사')
+    adjustment = np.where(leaver, -5, 0)
+    wb_adjustment = np.where(leaver, -10, 0)
+    re_adjustment = np.where(leaver, -8, 0)
+
+    # 직급별 특성 반영
+    leadership_bonus = np.select(
+        [master.mask('job_title', '팀장', '본부장', '대표이사'), master.mask('job_title', '차장', '부장')], [8, 5], default=0)
+
+    # CPI 20개 일상척도 + 벡터척도 생성 (T점수: 평균 50, 표준편차 10)
+    # 지배성은 적성검사 상황판단능력, 사교성/공감성은 대인관계능력과 공통 잠재점수로 연관
+    base = 50 + adjustment
+    leader = base + leadership_bonus
+    half_leader = base + leadership_bonus // 2
+    means = {scale: base for scale in CPI_SCALES}
+    means.update({
+        'dominance_do': leader,
+        'capacity_status_cs': leader,
+        'social_presence_sp': half_leader,
+        'responsibility_re': base + re_adjustment,
+        # 안녕감 - MMPI 우울증과 역상관
+        'well_being_wb': base + wb_adjustment,
+        'achievement_independence_ai': half_leader,
+    })
+    latent = sample_scales(len(employees), config, master['leader'])
+    scales = {scale: latent_scores(latent[scale], means[scale], 10, 20, 80) for scale in CPI_SCALES}
+
+    # 라이프스타일 유형 결정 (v1, v2 기준)
+    extravert = scales['vector_v1_extraversion'] >= 50
+    norm_oriented = scales['vector_v2_norm_orientation'] >= 50
+    lifestyle_type = np.select(
+        [extravert & norm_oriented, ~extravert & norm_oriented, extravert & ~norm_oriented],
+        ['Alpha', 'Beta', 'Gamma'], default='Delta')
+
+    # 전체 CPI 점수 (주요 척도들의 평균)
+    overall_cpi_score = np.round(np.stack([scales[scale] for scale in CPI_MAJOR_SCALES], axis=1).mean(axis=1), 1)
+
+    return list(iter_records({
+        'test_id': [f'CPI{i:04d}' for i in range(1, len(employees) + 1)],
+        'employee_id': [emp['employee_id'] for emp in employees],
+        'test_date': test_dates,
+        'recruitment_id': [rec['recruitment_id'] if rec else f'REC{i:04d}'
+                           for i, rec in enumerate(aptitude_records, start=1)],
+        **scales,
+        'lifestyle_type': lifestyle_type,
+        'overall_cpi_score': overall_cpi_score,
+    }))
+
+
+def iter_recruitment_mmpi_results(employees, cpi_results, master=None, config=CONFIG):
+    """5-4. recruitment_mmpi_results - MMPI 진단검사 결과"""
+    gen = stage_random(config, 'recruitment_mmpi_results').generator
+    master = ensure_master(employees, master)
+    n = len(employees)
+    cpi_by_employee = index_by(cpi_results)
+    cpi_records = [cpi_by_employee.get(emp['employee_id']) for emp in employees]
+
+    # CPI 후 1-3일 후 MMPI 실시 (CPI 기록이 없으면 입사일 기준 15-30일 전)
+    test_dates = _test_dates(gen, [rec['test_date'] if rec else None for rec in cpi_records],
+                             master['hire_date'], (1, 3), (15, 30))
+
+    # 퇴사자 특성 반영 (우울증 척도 높음, 불안 관련 척도 높음, 전반적 부적응)
+    leaver = master.mask('status', '퇴사')
+    depression_adj = np.where(leaver, 10, 0)
+    anxiety_adj = np.where(leaver, 8, 0)
+    adjustment_adj = np.where(leaver, 5, 0)
+
+    # 척도별 잠재점수 (CPI 안녕감 ↔ 우울증, CPI 사교성 ↔ 사회적내향성 역상관 반영)
+    latent = sample_scales(n, config, master['leader'])
+
+    # 타당도 척도
+    L, F, K = (latent_scores(latent[scale], *MMPI_VALIDITY_SPEC[scale]) for scale in MMPI_VALIDITY_SPEC)
+
+    # 타당도 검증 (5% 정도는 무효 프로파일)
+    invalid = gen.random(n) < 0.05
+    F = np.where(invalid, t_scores(gen, 75, 10, 70, 90, size=n), F)
+    validity_status = np.where(invalid, 'INVALID', 'VALID')
+
+    # 임상 척도 (T점수: 평균 50, 표준편차 10, 70 이상 시 임상적 주의)
+    base = 50 + adjustment_adj
+    means = {
+        'hypochondriasis_hs': base,                    # 건강염려증
+        'depression_d': base + depression_adj,         # 우울증
+        'hysteria_hy': base,                           # 히스테리
+        'psychopathic_deviate_pd': base,               # 반사회성
+        'masculinity_femininity_mf': 50,               # 남성성-여성성
+        'paranoia_pa': base + anxiety_adj,             # 편집증
+        'psychasthenia_pt': base + anxiety_adj,        # 강박증
+        'schizophrenia_sc': base,                      # 정신분열병
+        'hypomania_ma': 50,                            # 경조증
+        'social_introversion_si': base,                # 사회적내향성
+    }
+    scales = {scale: latent_scores(latent[scale], means[scale], 10, 20, 80) for scale in MMPI_CLINICAL_SCALES}
+    clinical = np.stack(list(scales.values()), axis=1)
+
+    # 임상 척도 상승 개수 (70T 이상, 남성성-여성성 제외)
+    elevation_scales = np.delete(clinical, MMPI_CLINICAL_SCALES.index('masculinity_femininity_mf'), axis=1)
+    clinical_elevation_count = (elevation_scales >= 70).sum(axis=1)
+    max_scale = elevation_scales.max(axis=1, initial=0)
+
+    # 위험 수준 평가
+    risk_level = np.select(
+        [(clinical_elevation_count >= 3) | (scales['depression_d'] >= 75) | (scales['schizophrenia_sc'] >= 75),
+         (clinical_elevation_count >= 1) | (max_scale >= 70)],
+        ['HIGH', 'MEDIUM'], default='LOW')
+
+    # 전반적 적응도
+    overall_adjustment = np.select(
+        [(risk_level == 'LOW') & ~invalid, risk_level == 'MEDIUM'], ['GOOD', 'FAIR'], default='POOR')
+
+    yield from iter_records({
+        'test_id': [f'MMPI{i:04d}' for i in range(1, n + 1)],
+        'employee_id': [emp['employee_id'] for emp in employees],
+        'test_date': test_dates,
+        'recruitment_id': [rec['recruitment_id'] if rec else f'REC{i:04d}'
+                           for i, rec in enumerate(cpi_records, start=1)],
+
+        # 타당도 척도
+        'lie_scale_l': L,
+        'frequency_scale_f': F,
+        'correction_scale_k': K,
+        'validity_status': validity_status,
+
+        # 임상 척도
+        **scales,
+
+        # 종합 평가
+        'clinical_elevation_count': clinical_elevation_count,
+        'risk_level': risk_level,
+        'overall_adjustment': overall_adjustment
+    })
+
+
+build_recruitment_mmpi_results = collect(iter_recruitment_mmpi_results)
+
+
+def iter_onboarding_program(employees, master=None, config=CONFIG):
+    """6. onboarding_program - 온보딩 프로그램"""
+    rng = stage_random(config, 'onboarding_program')
+    master = ensure_master(employees, master)
+    hire_dates = master.hire_datetimes()
+    onboard_counter = 1
+
+    # 최근 3년 입사자 대상
+    for i in master.rows(master['active'] & (master['hire_year'] >= 2022)):
+        emp = employees[i]
+        hire_date = hire_dates[i]
+        for idx, program in enumerate(ONBOARDING_PROGRAMS):
+            program_date = hire_date + timedelta(days=idx * 2 + rng.randint(0, 3))
+
+            yield {
+                'onboarding_id': f'ONB{onboard_counter:04d}',
+                'employee_id': emp['employee_id'],
+                'program_name': program,
+                'scheduled_date': program_date.strftime('%Y-%m-%d'),
+                'completion_status': rng.choices(['완료', '미완료'], weights=[95, 5])[0],
+                'satisfaction_score': round(rng.uniform(3.5, 5.0), 1)
+            }
+            onboard_counter += 1
+
+
+build_onboarding_program = collect(iter_onboarding_program)
+
+
+def iter_training_history(employees, master=None, config=CONFIG):
+    """7. training_history - 교육 이력"""
+    rng = stage_random(config, 'training_history')
+    reference = reference_date(config)
+    master = ensure_master(employees, master)
+    hire_dates = master.hire_datetimes()
+    train_counter = 1
+
+    for i in master.rows(master['active']):
+        emp = employees[i]
+        hire_date = hire_dates[i]
+        years_of_service = reference.year - hire_date.year
+
+        # 근속연수에 따라 교육 수 결정
+        num_trainings = min(rng.randint(2, 8), years_of_service * 2)
+        selected_courses = rng.sample(TRAINING_COURSES, min(num_trainings, len(TRAINING_COURSES)))
+
+        for course_name, category, hours in selected_courses:
+            # 입사 후 랜덤 날짜
+            days_after_hire = rng.randint(90, years_of_service * 365)
+            training_date = hire_date + timedelta(days=days_after_hire)
+
+            if training_date > reference:
+                continue
+
+            yield {
+                'training_id': f'TRN{train_counter:04d}',
+                'employee_id': emp['employee_id'],
+                'training_name': course_name,
+                'category': category,
+                'training_hours': hours,
+                'start_date': training_date.strftime('%Y-%m-%d'),
+                'completion_date': (training_date + timedelta(days=hours//2)).strftime('%Y-%m-%d'),
+                'completion_status': rng.choices(['수료', '미수료'], weights=[95, 5])[0],
+                'assessment_score': round(rng.uniform(70, 100), 1)
+            }
+            train_counter += 1
+
+
+build_training_history = collect(iter_training_history)
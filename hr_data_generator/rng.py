@@ -0,0 +1,69 @@
+"""
+테이블별 난수 스트림
+
+모든 테이블은 RANDOM_SEED 를 루트로 하는 SeedSequence 에서 테이블 이름(필요 시 추가 키)으로
+파생된 독립적인 numpy.random.Generator 를 사용합니다. 한 테이블에서 난수를 더 뽑아도 다른
+테이블의 결과는 바뀌지 않으며, 생성 순서나 병렬 여부와 무관하게 같은 결과가 나옵니다.
+"""
+
+import zlib
+
+import numpy as np
+
+
+def stream_key(name):
+    """테이블 이름 → SeedSequence spawn key (32비트 정수)"""
+    return zlib.crc32(name.encode('utf-8'))
+
+
+def seed_sequence(seed, name, *keys):
+    """(루트 시드, 테이블 이름, 추가 키) 로 결정되는 SeedSequence"""
+    return np.random.SeedSequence(seed, spawn_key=(stream_key(name), *[int(k) for k in keys]))
+
+
+class StageRandom:
+    """
+    numpy Generator 를 random 모듈과 같은 호출 방식으로 감싼 난수 스트림
+
+    반환값은 파이썬 기본 타입(int/float)이므로 timedelta, 문자열 포맷 등에 그대로 사용할 수 있습니다.
+    """
+
+    def __init__(self, generator):
+        self.generator = generator
+
+    def random(self):
+        return float(self.generator.random())
+
+    def randint(self, a, b):
+        """a 이상 b 이하 정수 (random.randint 와 동일하게 양 끝 포함)"""
+        return int(self.generator.integers(a, b + 1))
+
+    def uniform(self, a, b):
+        return float(self.generator.uniform(a, b))
+
+    def normal(self, loc=0.0, scale=1.0, size=None):
+        return self.generator.normal(loc, scale, size)
+
+    def choice(self, seq):
+        return seq[int(self.generator.integers(len(seq)))]
+
+    def choices(self, population, weights=None, k=1):
+        if weights is None:
+            idx = self.generator.integers(len(population), size=k)
+        else:
+            p = np.asarray(weights, dtype=float)
+            idx = self.generator.choice(len(population), size=k, p=p / p.sum())
+        return [population[i] for i in idx]
+
+    def sample(self, population, k):
+        idx = self.generator.choice(len(population), size=k, replace=False)
+        return [population[i] for i in idx]
+
+    def seed32(self):
+        """별도 생성기(이름 생성기 등) 시드용 32비트 정수"""
+        return int(self.generator.integers(2 ** 32))
+
+
+def stage_random(config, name, *keys):
+    """테이블(name)과 추가 키에 대한 독립 난수 스트림 반환"""
+    return StageRandom(np.random.default_rng(seed_sequence(config['RANDOM_SEED'], name, *keys)))
@@ -0,0 +1,73 @@
+"""
+테이블 생성 스케줄러 (의존 관계 DAG 기반 병렬 실행)
+
+상위 테이블이 모두 준비된 테이블부터 프로세스 풀에 제출합니다. 서로 독립적인 테이블은
+동시에 생성되므로 전체 소요 시간은 모든 단계의 합이 아니라 가장 긴 의존 경로
+(critical path)에 가까워집니다.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+
+def critical_path(plan, deps, cost=None):
+    """
+    plan 의 가장 긴 의존 경로 반환
+
+    deps: {테이블 이름: 상위 테이블 목록}
+    cost: {테이블 이름: 소요 시간} (없으면 모든 단계 1)
+    반환값: (경로 테이블 목록, 경로 비용 합)
+    """
+    cost = cost or {}
+    best = {}
+    for name in plan:  # plan 은 위상 정렬 순서
+        parents = [dep for dep in deps[name] if dep in best]
+        parent = max(parents, key=lambda dep: best[dep][1], default=None)
+        path, total = best[parent] if parent else ([], 0)
+        best[name] = (path + [name], total + cost.get(name, 1))
+    return max(best.values(), key=lambda item: item[1], default=([], 0))
+
+
+def run_dag(plan, deps, stage_fn, workers=None, on_complete=None, release=False):
+    """
+    DAG 순서를 지키며 stage_fn(name, upstream) 을 프로세스 풀에서 실행
+
+    plan: 실행할 테이블 목록 (위상 정렬 순서)
+    deps: {테이블 이름: 상위 테이블 목록}. upstream 은 이 순서대로 전달됩니다.
+    stage_fn: 워커 프로세스에서 실행할 최상위 함수 (pickle 가능해야 함)
+    workers: 최대 프로세스 수 (None 이면 CPU 수)
+    on_complete: 테이블 완료 시 메인 프로세스에서 호출 (name, records). None 이 아닌 값을
+                 반환하면 그 값을 결과로 저장하고 하위 테이블에 전달합니다 (측정값 분리 등).
+    release: True 이면 마지막 하위 테이블이 제출된 상위 테이블 결과를 바로 해제
+             (반환값에는 하위 테이블이 없는 테이블만 남음)
+    반환값: {테이블 이름: 레코드 리스트}
+    """
+    results = {}
+    pending = {name: set(deps[name]) & set(plan) for name in plan}
+    consumers = {name: sum(name in deps[other] for other in plan) for name in plan}
+    running = {}
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while pending or running:
+            ready = [name for name in plan if name in pending and not pending[name]]
+            for name in ready:
+                del pending[name]
+                upstream = [results[dep] for dep in deps[name]]
+                running[pool.submit(stage_fn, name, upstream)] = name
+                if release:
+                    for dep in deps[name]:
+                        consumers[dep] -= 1
+                        if not consumers[dep]:
+                            del results[dep]
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                results[name] = future.result()
+                for waiting in pending.values():
+                    waiting.discard(name)
+                if on_complete:
+                    replaced = on_complete(name, results[name])
+                    if replaced is not None:
+                        results[name] = replaced
+
+    return results
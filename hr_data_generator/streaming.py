@@ -0,0 +1,72 @@
+"""
+스트리밍 테이블 출력
+
+생성 함수(iter_*)가 내보내는 레코드를 고정 크기 청크로 모아 CSV 에 이어 쓰므로,
+테이블 크기와 무관하게 메모리 사용량이 청크 크기 수준으로 유지됩니다.
+"""
+
+import functools
+import itertools
+
+import pandas as pd
+
+DEFAULT_CHUNK_ROWS = 50000
+
+
+def collect(iter_fn):
+    """레코드를 하나씩 내보내는 iter_* 함수를 레코드 리스트를 반환하는 build_* 함수로 변환"""
+    @functools.wraps(iter_fn)
+    def build(*args, **kwargs):
+        return list(iter_fn(*args, **kwargs))
+    return build
+
+
+def chunked(records, size):
+    """레코드 iterable 을 size 개씩 리스트로 나눔"""
+    records = iter(records)
+    while True:
+        chunk = list(itertools.islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def to_frame(records, columns=None):
+    """레코드 리스트를 DataFrame 으로 변환 ('_' 로 시작하는 내부 참조 컬럼 제외)"""
+    df = pd.DataFrame(records)
+    if columns is None:
+        columns = [col for col in df.columns if not str(col).startswith('_')]
+    return df.reindex(columns=columns)
+
+
+def iter_frames(records, chunk_rows):
+    """레코드를 chunk_rows 행씩 DataFrame 으로 변환 (컬럼 구성은 첫 청크 기준)"""
+    columns = None
+    for chunk in chunked(records, chunk_rows):
+        df = to_frame(chunk, columns)
+        columns = list(df.columns)
+        yield df
+
+
+def write_csv_chunks(records, path, chunk_rows=DEFAULT_CHUNK_ROWS, dtypes=None):
+    """
+    레코드를 chunk_rows 행씩 CSV(UTF-8 BOM)에 이어 쓰고 전체 행 수 반환
+
+    컬럼 구성은 첫 청크 기준입니다 (이후 청크는 같은 컬럼 순서로 맞춤).
+    dtypes: 청크마다 고정할 컬럼 타입. 정수와 None 이 섞인 컬럼은 전체 테이블에서는 float 이
+            되지만 None 이 없는 청크에서는 int 로 추론되므로, 청크 크기와 무관하게 같은 CSV 를
+            쓰려면 지정해야 합니다.
+    """
+    rows = 0
+    columns = None
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        for chunk in chunked(records, chunk_rows):
+            df = to_frame(chunk, columns)
+            columns = list(df.columns)
+            if dtypes:
+                df = df.astype(dtypes)
+            df.to_csv(f, index=False, header=rows == 0)
+            rows += len(chunk)
+        if rows == 0:
+            pd.DataFrame().to_csv(f, index=False)
+    return rows
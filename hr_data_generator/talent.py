@@ -0,0 +1,306 @@
+"""
+E그룹: 인재 관리 데이터 (Talent Management) 및 연간 스냅샷
+"""
+
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from .columnar import ensure_master
+from .config import CONFIG
+from .index import group_by, index_by
+from .rng import stage_random
+from .streaming import collect
+
+# 핵심인재 선정에 사용하는 최근 2년 성과 평가 기간
+RECENT_REVIEW_PERIODS = ['2023 H1', '2023 H2', '2024 H1']
+
+# 성과 등급 → 점수
+GRADE_SCORES = {'S': 5, 'A': 4, 'B': 3, 'C': 2, 'D': 1}
+
+TALENT_TIERS = ['Tier 1 - Critical Talent', 'Tier 2 - High Potential', 'Tier 3 - Emerging Talent']
+
+# 개발 우선순위
+DEVELOPMENT_PRIORITY = {
+    'Tier 1 - Critical Talent': '최우선',
+    'Tier 2 - High Potential': '우선',
+    'Tier 3 - Emerging Talent': '일반',
+}
+
+
+def _talent_metrics(employees, performance_data, rewards_discipline_data, leadership_data, engagement_data):
+    """
+    직원별 핵심인재 선정 지표 (테이블별 group-by 1회)
+
+    반환값: employees 순서의 DataFrame
+        avg_performance: 최근 2년 성과 등급 평균 (평가 없으면 NaN)
+        rewards_count: 포상 횟수
+        leadership_score: 2024년 직속 부하 리더십 평가 평균 (없으면 NaN)
+        turnover_intention: 2024년 몰입도 설문 이직 의도 (없으면 NaN)
+    """
+    employee_ids = pd.Index([emp['employee_id'] for emp in employees])
+
+    # 최근 2년 성과 평가 → 등급 점수 평균
+    perf = pd.DataFrame(performance_data, columns=['employee_id', 'review_period', 'final_grade'])
+    perf = perf[perf['review_period'].isin(RECENT_REVIEW_PERIODS)]
+    avg_performance = perf['final_grade'].map(GRADE_SCORES).groupby(perf['employee_id']).mean()
+
+    # 포상 횟수
+    records = pd.DataFrame(rewards_discipline_data, columns=['employee_id', 'record_type'])
+    rewards_count = records.loc[records['record_type'] == '포상', 'employee_id'].value_counts()
+
+    # 리더십 평가 (리더별 점수 목록; np.mean 으로 기존 평균과 동일한 값 유지)
+    leader_scores = group_by(leadership_data, 'leader_employee_id', 'review_year', 'rater_relationship')
+    leadership_score = pd.Series({
+        leader_id: np.mean([r['score'] for r in reviews])
+        for (leader_id, year, relationship), reviews in leader_scores.items()
+        if year == 2024 and relationship == 'Direct Report'
+    }, dtype=float)
+
+    # 2024년 몰입도 설문 이직 의도 (직원별 첫 응답)
+    survey = pd.DataFrame(engagement_data, columns=['employee_id', 'survey_year', 'q_turnover_intention'])
+    survey = survey[survey['survey_year'] == 2024].drop_duplicates('employee_id')
+    turnover_intention = survey.set_index('employee_id')['q_turnover_intention']
+
+    return pd.DataFrame({
+        'avg_performance': avg_performance.reindex(employee_ids).to_numpy(),
+        'rewards_count': rewards_count.reindex(employee_ids, fill_value=0).to_numpy(),
+        'leadership_score': leadership_score.reindex(employee_ids).to_numpy(),
+        'turnover_intention': turnover_intention.reindex(employee_ids).to_numpy(),
+    }, index=employee_ids)
+
+
+def build_key_talent_pool(employees, performance_data, rewards_discipline_data, leadership_data, engagement_data,
+                          master=None, config=CONFIG):
+    """20. key_talent_pool - 핵심인재 풀 (성과 기반 선정)"""
+    master = ensure_master(employees, master)
+    key_talent_data = []
+    talent_counter = 1
+
+    metrics = _talent_metrics(employees, performance_data, rewards_discipline_data, leadership_data, engagement_data)
+    avg_performance = metrics['avg_performance'].to_numpy()
+    rewards_count = metrics['rewards_count'].to_numpy()
+    years_of_service = 2024 - master['hire_year']
+
+    # 리더십 평가는 리더 직책만 반영
+    is_leader = master.mask('job_title', '팀장', '본부장', '부장')
+    leadership_score = np.where(is_leader, metrics['leadership_score'].to_numpy(), np.nan)
+
+    # 선정 대상: 재직 중 + 대표이사 제외 + 최근 성과 평가 존재
+    eligible = (master['active']
+                & ~master.mask('job_title', '대표이사')
+                & ~np.isnan(avg_performance))
+    strong_leadership = leadership_score >= 4.3  # NaN 비교는 False
+
+    # Tier 1: 최우수 인재 (성과 S등급 평균 + 포상 이력 or 리더십 우수)
+    tier1 = eligible & (avg_performance >= 4.5) & ((rewards_count >= 2) | strong_leadership)
+    # Tier 2: 우수 인재 (성과 A등급 이상 + 리더 또는 전문가)
+    tier2 = (eligible & (avg_performance < 4.5) & (avg_performance >= 4.0)
+             & master.mask('job_title', '팀장', '본부장', '부장', '차장', '과장'))
+    # Tier 3: 잠재 인재 (성과 A 이상 + 젊은 직원)
+    tier3 = (eligible & (avg_performance < 4.0) & (avg_performance >= 3.8)
+             & (years_of_service <= 5) & master.mask('job_title', '사원', '주임', '대리', '과장'))
+
+    talent_tier = np.select([tier1, tier2, tier3], TALENT_TIERS, default='')
+
+    # 유지 리스크 평가 (engagement survey 기반, 응답 없으면 Medium)
+    turnover = metrics['turnover_intention'].to_numpy()
+    retention_risk = np.select([turnover >= 4.0, turnover >= 3.0, ~np.isnan(turnover)],
+                               ['High', 'Medium', 'Low'], default='Medium')
+
+    for i in np.flatnonzero(talent_tier != ''):
+        emp = employees[i]
+        tier = str(talent_tier[i])
+        rewards = int(rewards_count[i])
+        lead = None if np.isnan(leadership_score[i]) else float(leadership_score[i])
+
+        selection_reason = []
+        if tier == 'Tier 1 - Critical Talent':
+            selection_reason.append('탁월한 성과 지속')
+            if rewards >= 2:
+                selection_reason.append(f'포상 {rewards}회')
+            if lead and lead >= 4.3:
+                selection_reason.append('우수한 리더십')
+        elif tier == 'Tier 2 - High Potential':
+            selection_reason.append('안정적 우수 성과')
+            if lead and lead >= 4.0:
+                selection_reason.append('리더십 발휘')
+            if rewards >= 1:
+                selection_reason.append('포상 이력')
+        else:
+            selection_reason.append('성장 가능성')
+            selection_reason.append('안정적 성과')
+
+        key_talent_data.append({
+            'talent_id': f'TALENT{talent_counter:04d}',
+            'employee_id': emp['employee_id'],
+            'identification_date': '2024-06-30',
+            'talent_tier': tier,
+            'avg_performance_score': round(float(avg_performance[i]), 2),
+            'leadership_score': round(lead, 2) if lead else None,
+            'rewards_count': rewards,
+            'selection_reason': ' | '.join(selection_reason),
+            'retention_risk': str(retention_risk[i]),
+            'development_priority': DEVELOPMENT_PRIORITY[tier],
+            'succession_ready': 'Yes' if tier in ['Tier 1 - Critical Talent', 'Tier 2 - High Potential'] else 'Developing',
+            'review_date': '2024-12-31'
+        })
+        talent_counter += 1
+
+    return key_talent_data
+
+
+def iter_succession_plan(employees, key_talent_data, master=None, config=CONFIG):
+    """21. succession_plan - 승계 계획 (핵심 직책별 후보자)"""
+    rng = stage_random(config, 'succession_plan')
+    master = ensure_master(employees, master)
+    succession_counter = 1
+    talent_by_employee = index_by(key_talent_data)
+
+    # 승계 대상 핵심 직책 (본부장 + 팀장)
+    critical_positions = [employees[i] for i in master.rows(master['active']
+                                                            & master.mask('job_title', '본부장', '팀장'))]
+
+    # 핵심인재 풀 (승계 후보자가 될 수 있는 사람들)
+    ready_ids = {kt['employee_id'] for kt in key_talent_data
+                 if kt['succession_ready'] == 'Yes'}
+
+    # 승계 가능 인재를 본부/팀별로 색인 (employees 순서 유지)
+    ready_employees = [emp for emp in employees if emp['employee_id'] in ready_ids]
+    ready_by_division = group_by(ready_employees, 'division_name')
+    ready_by_org = group_by(ready_employees, 'org_id')
+
+    for position in critical_positions:
+        position_id = position['employee_id']
+        division_pool = ready_by_division.get(position['division_name'], [])
+
+        # 같은 본부 또는 같은 팀의 핵심인재 중에서 후보 선정
+        if position['job_title'] == '본부장':
+            # 본부장 후보: 같은 본부의 팀장들 중 핵심인재
+            candidates = [emp for emp in division_pool
+                          if emp['job_title'] in ['팀장', '차장', '부장']
+                          and emp['employee_id'] != position_id]
+        else:  # 팀장
+            # 팀장 후보: 같은 팀의 차장/과장 중 핵심인재
+            candidates = [emp for emp in ready_by_org.get(position['org_id'], [])
+                          if emp['job_title'] in ['차장', '과장', '대리']
+                          and emp['employee_id'] != position_id]
+
+        # 후보자가 없으면 다른 팀에서도 찾기
+        if len(candidates) < 2:
+            candidate_ids = {emp['employee_id'] for emp in candidates}
+            candidates.extend([emp for emp in division_pool
+                               if emp['job_title'] not in ['대표이사']
+                               and emp['employee_id'] != position_id
+                               and emp['employee_id'] not in candidate_ids][:3])
+
+        # 후보자 1-3명 선정
+        num_successors = min(len(candidates), rng.randint(1, 3))
+        selected_successors = rng.sample(candidates, num_successors) if candidates else []
+
+        for idx, successor in enumerate(selected_successors):
+            # 준비도 평가
+            successor_talent_info = talent_by_employee.get(successor['employee_id'])
+
+            if successor_talent_info:
+                perf_score = successor_talent_info['avg_performance_score']
+
+                if perf_score >= 4.5:
+                    readiness = 'Ready Now'
+                    development_needed = '리더십 고도화, 전략적 사고'
+                elif perf_score >= 4.0:
+                    readiness = '1-2 Years'
+                    development_needed = '관리 역량 강화, 의사결정 경험'
+                else:
+                    readiness = '3+ Years'
+                    development_needed = '리더십 기본, 팀 관리 경험'
+            else:
+                readiness = '3+ Years'
+                development_needed = '역량 전반 개발 필요'
+
+            # 현 직책자의 퇴사 리스크
+            position_talent_info = talent_by_employee.get(position['employee_id'])
+
+            if position_talent_info:
+                position_risk = position_talent_info['retention_risk']
+            else:
+                # 핵심인재가 아닌 리더는 리스크 높을 수 있음
+                position_risk = rng.choice(['Medium', 'High'])
+
+            yield {
+                'succession_plan_id': f'SUC{succession_counter:04d}',
+                'critical_position': position['job_title'],
+                'current_holder_id': position['employee_id'],
+                'current_holder_name': position['name'],
+                'org_name': position['org_name'],
+                'division_name': position['division_name'],
+                'successor_rank': idx + 1,  # 1st, 2nd, 3rd choice
+                'successor_id': successor['employee_id'],
+                'successor_name': successor['name'],
+                'successor_current_title': successor['job_title'],
+                'readiness_level': readiness,
+                'development_needed': development_needed,
+                'is_key_talent': 'Yes',
+                'position_risk_level': position_risk,
+                'plan_date': '2024-07-01',
+                'next_review_date': '2025-01-01'
+            }
+            succession_counter += 1
+
+
+build_succession_plan = collect(iter_succession_plan)
+
+
+def iter_employee_yearly_snapshot(employees, performance_data, compensation_data, skill_assessment_data, project_data,
+                                  master=None, config=CONFIG):
+    """22. employee_yearly_snapshot - 연간 요약"""
+    master = ensure_master(employees, master)
+    hire_years = master['hire_year'].tolist()
+    snapshot_counter = 1
+
+    # (employee_id, 연도) 기준 집계 (각 상위 테이블 1회 순회)
+    # 해당 연도의 마지막 성과 등급 (review_period: 'YYYY H1')
+    perf_grade = {}
+    for p in performance_data:
+        perf_grade[(p['employee_id'], int(p['review_period'][:4]))] = p['final_grade']
+
+    # 해당 연도의 첫 보상 기록 (effective_date: 'YYYY-01-01')
+    total_comp_by_year = {}
+    for c in compensation_data:
+        total_comp_by_year.setdefault((c['employee_id'], int(c['effective_date'][:4])), c['total_compensation'])
+
+    # 해당 연도 시작 프로젝트 수
+    project_count_by_year = Counter((p['employee_id'], int(p['start_date'][:4])) for p in project_data)
+
+    # 역량 점수 평균 (연도와 무관하므로 직원별 1회 계산)
+    avg_skill_by_employee = {
+        emp_id: round(np.mean([s['peer_rating_avg'] for s in records]), 2)
+        for emp_id, records in group_by(skill_assessment_data, 'employee_id').items()
+    }
+
+    for i in master.rows(master['active']):
+        emp = employees[i]
+        emp_id = emp['employee_id']
+
+        for year in range(2022, 2025):
+            if year < hire_years[i]:
+                continue
+
+            yield {
+                'snapshot_id': f'SNAP{snapshot_counter:04d}',
+                'employee_id': emp_id,
+                'snapshot_date': f'{year}-12-31',
+                'division_name': emp['division_name'],
+                'org_name': emp['org_name'],
+                'job_title': emp['job_title'],
+                'performance_grade': perf_grade.get((emp_id, year), 'B'),
+                'total_compensation': total_comp_by_year.get((emp_id, year), 40000000),
+                'key_skill_score_avg': avg_skill_by_employee.get(emp_id, 3.5),
+                'project_count': project_count_by_year[(emp_id, year)],
+                'employment_status': emp['status']
+            }
+            snapshot_counter += 1
+
+
+build_employee_yearly_snapshot = collect(iter_employee_yearly_snapshot)
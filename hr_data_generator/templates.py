@@ -0,0 +1,220 @@
+"""
+코멘트 템플릿 엔진
+
+평가 코멘트, 피드백, 서베이 의견처럼 여러 문장 후보 중 하나를 고르는 텍스트는 모듈 로드 시
+한 번만 컴파일해 두고, 행마다 선택된 템플릿 하나만 렌더링합니다. 후보 문장을 모두 f-string
+으로 만든 뒤 하나만 남기던 방식과 달리 버려지는 문장에 난수와 문자열 연산을 쓰지 않습니다.
+
+템플릿 문법:
+    {가|나|다}    후보 중 하나를 균등 선택
+    {105~130}    양 끝을 포함한 정수 (randint)
+    {@이름}      banks 로 넘긴 하위 문구 뱅크(PhraseBank)를 렌더링
+    {이름}       render() 호출 시 키워드 인자로 넘긴 행 값
+
+압축 저장 (COMMENT_ENCODING):
+    문장 대신 '템플릿 번호:슬롯값:슬롯값...' 코드 문자열을 저장합니다. 템플릿 번호는 모듈에서
+    컴파일된 모든 템플릿의 일련번호(TEMPLATES 인덱스)이고, 슬롯값은 선택지 번호/정수값/하위
+    템플릿 코드입니다. 행 값({이름})은 같은 행의 다른 컬럼에서 가져오므로 저장하지 않습니다.
+    템플릿 목록은 phrase dictionary 파일(PHRASE_DICTIONARY_FILE)로 함께 저장하고, 읽을 때
+    PhraseDictionary.expand() 로 문장을 복원합니다. 같은 난수 스트림에서 render() 와 encode()
+    는 같은 문장을 나타냅니다.
+"""
+
+import json
+import re
+
+PLACEHOLDER = re.compile(r'\{([^{}]*)\}')
+INT_RANGE = re.compile(r'^(-?\d+)~(-?\d+)$')
+
+PHRASE_DICTIONARY_FILE = 'comment_templates.json'
+
+# PhraseBank 로 등록된 모든 템플릿 (인덱스 = 템플릿 번호)
+TEMPLATES = []
+
+
+class Choice:
+    """{가|나|다} - 후보 중 하나 (코드: 후보 번호)"""
+
+    def __init__(self, options):
+        self.options = options
+
+    def render(self, rng, fields):
+        return self.options[rng.randint(0, len(self.options) - 1)]
+
+    def draw(self, rng, codes):
+        codes.append(rng.randint(0, len(self.options) - 1))
+
+    def expand(self, codes, fields, templates):
+        return self.options[next(codes)]
+
+
+class IntRange:
+    """{lo~hi} - 정수 (코드: 정수값)"""
+
+    def __init__(self, lo, hi):
+        self.lo, self.hi = lo, hi
+
+    def render(self, rng, fields):
+        return str(rng.randint(self.lo, self.hi))
+
+    def draw(self, rng, codes):
+        codes.append(rng.randint(self.lo, self.hi))
+
+    def expand(self, codes, fields, templates):
+        return str(next(codes))
+
+
+class Nested:
+    """{@이름} - 하위 문구 뱅크 (코드: 선택된 하위 템플릿의 코드)"""
+
+    def __init__(self, bank):
+        self.bank = bank
+
+    def render(self, rng, fields):
+        return self.bank.render(rng, **fields)
+
+    def draw(self, rng, codes):
+        self.bank.draw(rng, codes)
+
+    def expand(self, codes, fields, templates):
+        return templates[next(codes)].expand(codes, fields, templates)
+
+
+class Field:
+    """{이름} - 행 값 (코드 없음)"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def render(self, rng, fields):
+        return str(fields[self.name])
+
+    def draw(self, rng, codes):
+        pass
+
+    def expand(self, codes, fields, templates):
+        return str(fields[self.name])
+
+
+class Template:
+    """
+    컴파일된 문장 템플릿 (고정 문자열과 슬롯의 나열)
+
+    banks 가 None 이면 {@이름} 을 하위 템플릿 코드로만 해석합니다 (저장된 코드 복원용).
+    """
+
+    def __init__(self, text, banks=None):
+        self.text = text
+        self.parts = compile_parts(text, banks)
+        self.slots = [part for part in self.parts if not isinstance(part, str)]
+
+    def render(self, rng, **fields):
+        return ''.join(
+            part if isinstance(part, str) else part.render(rng, fields)
+            for part in self.parts
+        )
+
+    def draw(self, rng, codes):
+        for slot in self.slots:
+            slot.draw(rng, codes)
+
+    def expand(self, codes, fields, templates):
+        return ''.join(
+            part if isinstance(part, str) else part.expand(codes, fields, templates)
+            for part in self.parts
+        )
+
+
+class PhraseBank:
+    """문장 템플릿 후보 목록 - render() 는 하나를 고른 뒤 그 템플릿만 렌더링"""
+
+    def __init__(self, templates, banks=None):
+        self.templates = [Template(text, banks or {}) for text in templates]
+        self.ids = list(range(len(TEMPLATES), len(TEMPLATES) + len(self.templates)))
+        TEMPLATES.extend(self.templates)
+
+    def render(self, rng, **fields):
+        return self.templates[rng.randint(0, len(self.templates) - 1)].render(rng, **fields)
+
+    def draw(self, rng, codes):
+        i = rng.randint(0, len(self.templates) - 1)
+        codes.append(self.ids[i])
+        self.templates[i].draw(rng, codes)
+
+    def encode(self, rng):
+        """render() 와 같은 난수를 뽑아 문장 대신 코드 문자열 반환"""
+        codes = []
+        self.draw(rng, codes)
+        return ':'.join(map(str, codes))
+
+
+class PhraseDictionary:
+    """템플릿 번호 → 템플릿 목록 (코드 문자열을 문장으로 복원)"""
+
+    def __init__(self, texts):
+        self.texts = list(texts)
+        self.templates = [Template(text) for text in self.texts]
+
+    def expand(self, code, **fields):
+        codes = map(int, str(code).split(':'))
+        return self.templates[next(codes)].expand(codes, fields, self.templates)
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'templates': self.texts}, f, ensure_ascii=False, indent=0)
+        return path
+
+
+def phrase_dictionary():
+    """현재 프로세스에 등록된 템플릿으로 만든 PhraseDictionary"""
+    return PhraseDictionary(template.text for template in TEMPLATES)
+
+
+def load_phrase_dictionary(path):
+    """저장된 phrase dictionary 파일 읽기"""
+    with open(path, encoding='utf-8') as f:
+        return PhraseDictionary(json.load(f)['templates'])
+
+
+def phrase_writer(rng, encoded=False):
+    """문구 뱅크에서 문장(encoded 이면 코드 문자열)을 뽑는 함수 (bank, **fields) -> str 반환"""
+    if encoded:
+        return lambda bank, **fields: bank.encode(rng)
+    return lambda bank, **fields: bank.render(rng, **fields)
+
+
+def compile_parts(text, banks):
+    """템플릿 문자열 → [고정 문자열 | 슬롯] 리스트"""
+    parts = []
+    pos = 0
+    for match in PLACEHOLDER.finditer(text):
+        if match.start() > pos:
+            parts.append(text[pos:match.start()])
+        parts.append(compile_placeholder(match.group(1), banks, text))
+        pos = match.end()
+    if pos < len(text):
+        parts.append(text[pos:])
+    return parts
+
+
+def compile_placeholder(expr, banks, text):
+    """치환 구문 하나를 슬롯으로 변환"""
+    if '|' in expr:
+        return Choice(expr.split('|'))
+
+    int_range = INT_RANGE.match(expr)
+    if int_range:
+        return IntRange(int(int_range.group(1)), int(int_range.group(2)))
+
+    if expr.startswith('@'):
+        name = expr[1:]
+        if banks is None:
+            return Nested(None)
+        if name not in banks:
+            raise ValueError(f"템플릿에 정의되지 않은 문구 뱅크 '{name}': {text}")
+        return Nested(banks[name])
+
+    if expr.isidentifier():
+        return Field(expr)
+
+    raise ValueError(f"해석할 수 없는 템플릿 구문 '{{{expr}}}': {text}")